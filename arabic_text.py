@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arabic text normalization
+The one place where spelling variants are folded before matching, so every
+script compares names, labels and transcripts the same way.
+
+- fold(text): alef variants -> ا, ة -> ه, ى -> ي (and optionally
+  Arabic-Indic digits -> 0-9). One character to one, so offsets found in
+  the folded text are valid in the original. ascii_digits(text) folds
+  the digits only.
+- normalize(text): fold + drop diacritics and tatweel + digits, optionally
+  punctuation -> space, whitespace collapsed. One str.translate pass plus
+  one regex pass; short strings (names, labels) are memoized.
+- normalize(text, offsets=True) also returns, for each character of the
+  result, its offset in the original text.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+LETTERS = {'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ة': 'ه', 'ى': 'ي'}
+DIGITS = dict(zip('٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹', '01234567890123456789'))
+# Harakat, Quranic marks, superscript alef and tatweel
+DROPPED = [chr(c) for c in range(0x064B, 0x0660)] + ['ٰ', 'ـ']
+
+FOLD = str.maketrans(LETTERS)
+FOLD_DIGITS = str.maketrans({**LETTERS, **DIGITS})
+ASCII_DIGITS = str.maketrans(DIGITS)
+NORMALIZE = str.maketrans({**LETTERS, **DIGITS, **{c: None for c in DROPPED}})
+
+PUNCTUATION = re.compile(r'[^\w\s]')
+SHORT_TEXT = 64         # longer strings are not memoized
+CACHE_SIZE = 8192
+
+DROPPED_CODES = np.array([ord(c) for c in DROPPED], dtype=np.uint32)
+SPACE_CODES = np.array([c for c in range(0x3001) if chr(c).isspace()], dtype=np.uint32)
+
+def fold(text, digits=False):
+    """Length-preserving letter fold"""
+    return text.translate(FOLD_DIGITS if digits else FOLD)
+
+def ascii_digits(text):
+    return text.translate(ASCII_DIGITS)
+
+def _normalize(text, punctuation):
+    text = text.translate(NORMALIZE)
+    if punctuation:
+        text = PUNCTUATION.sub(' ', text)
+    return ' '.join(text.split())
+
+_normalize_short = lru_cache(maxsize=CACHE_SIZE)(_normalize)
+
+def normalize(text, punctuation=False, offsets=False):
+    """
+    Normalized text; with offsets=True, (text, int array) where array[i] is
+    the offset in the original text of the i-th normalized character.
+    """
+    if not text:
+        return ("", np.zeros(0, dtype=np.int64)) if offsets else ""
+    text = str(text)
+    if offsets:
+        return _normalize_offsets(text, punctuation)
+    if len(text) <= SHORT_TEXT:
+        return _normalize_short(text, punctuation)
+    return _normalize(text, punctuation)
+
+def _normalize_offsets(text, punctuation):
+    """Same result as _normalize, computed on a code point array to keep positions"""
+    codes = np.frombuffer(text.translate(FOLD_DIGITS).encode('utf-32-le'), dtype=np.uint32)
+    positions = np.flatnonzero(~np.isin(codes, DROPPED_CODES))
+    codes = codes[positions]
+    if punctuation:
+        # One character to one, on the text without diacritics (which are not \w)
+        text = PUNCTUATION.sub(' ', codes.tobytes().decode('utf-32-le'))
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+    # Collapse whitespace runs to one space and strip both ends
+    space = np.isin(codes, SPACE_CODES)
+    keep = ~space
+    keep[1:] |= space[1:] & ~space[:-1]
+    if len(keep) and space[0]:
+        keep[0] = False
+    codes, space, positions = codes[keep], space[keep], positions[keep]
+    if len(codes) and space[-1]:
+        codes, space, positions = codes[:-1], space[:-1], positions[:-1]
+    codes = np.where(space, ord(' '), codes).astype(np.uint32)
+    return codes.tobytes().decode('utf-32-le'), positions.astype(np.int64)
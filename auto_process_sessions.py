@@ -1,5 +1,4 @@
 import json
-import re
 import os
 import sys
 from datetime import datetime
@@ -47,14 +46,6 @@ def load_mps():
         return json.load(f)
 
 
-def normalize_text(text):
-    if not text:
-        return ""
-    text = text.replace("أ", "ا").replace("إ", "ا").replace("آ", "ا")
-    text = text.replace("ة", "ه").replace("ى", "ي")
-    return re.sub(r'[^\w\s]', '', text).strip()
-
-
 # ================================
 # AI Processing
 # ================================
@@ -108,10 +99,10 @@ def process_transcript_ai(text, file_name):
 # PDF Helper
 # ================================
 def extract_text_from_pdf(pdf_path):
+    # Pages are extracted on a process pool and cached per (file hash, page)
     try:
-        from pypdf import PdfReader
-        reader = PdfReader(pdf_path)
-        return "\n".join([p.extract_text() or "" for p in reader.pages])
+        from pdf_pages import extract_text
+        return extract_text(pdf_path)
     except Exception as e:
         print(f"PDF Error: {e}")
         return None
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bloc and party activity aggregation
+Joins every intervention/segment to the bloc and party the MP belonged to
+on the date of the sitting, then aggregates interventions, points,
+sittings and active MPs per bloc and per party for BlocsDirectoryView /
+PartiesView.
+
+Memberships are turned into an interval index (one row per membership
+period, sorted by MP then start date) so each activity row is assigned
+with a single vectorized searchsorted instead of a Python loop.
+"""
+
+import json
+from datetime import date
+
+import numpy as np
+
+from mp_resolver import MPResolver
+
+MPS_FILE = 'public/data/mps.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+BLOCS_FILE = 'public/data/blocs.json'
+OUTPUT_FILE = 'public/data/bloc_activity.json'
+
+# Spacing between MPs in the composite (mp, day) key, larger than any date ordinal
+DAY_SPAN = 1_000_000
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def to_ordinal(value):
+    return date.fromisoformat(value[:10]).toordinal()
+
+def term_code(ordinary_term):
+    return f"ordinary_{ordinary_term}"
+
+class Codes:
+    """Dictionary-encode strings to dense integer codes"""
+
+    def __init__(self):
+        self.index = {}
+        self.values = []
+
+    def code(self, value):
+        if value not in self.index:
+            self.index[value] = len(self.values)
+            self.values.append(value)
+        return self.index[value]
+
+def term_start_dates(sessions):
+    """Earliest sitting of each ordinary term, used when a membership has no startDate"""
+    starts = {}
+    for session in sessions:
+        if not session.get('date') or not session.get('ordinaryTerm'):
+            continue
+        code = term_code(session['ordinaryTerm'])
+        ordinal = to_ordinal(session['date'])
+        starts[code] = min(starts.get(code, ordinal), ordinal)
+    return starts
+
+class MembershipIndex:
+    """
+    Interval index over membership periods.
+    A period runs from its start date until the next period of the same MP.
+    """
+
+    def __init__(self, mps, term_starts, blocs, parties):
+        self.mp_codes = {mp['id']: i for i, mp in enumerate(mps)}
+        rows = []
+        for mp in mps:
+            mp_idx = self.mp_codes[mp['id']]
+            for membership in mp.get('memberships', []):
+                start = membership.get('startDate')
+                if start:
+                    start = to_ordinal(start)
+                else:
+                    start = term_starts.get(membership.get('session'))
+                if start is None or not membership.get('bloc'):
+                    continue
+                party = membership.get('party') or mp.get('party') or "مستقل"
+                rows.append((
+                    mp_idx * DAY_SPAN + start,
+                    mp_idx,
+                    blocs.code((membership['session'], membership['bloc'])),
+                    parties.code((membership['session'], party)),
+                ))
+
+        rows.sort()
+        table = np.array(rows, dtype=np.int64).reshape(-1, 4)
+        self.keys = table[:, 0]
+        self.mp_idx = table[:, 1]
+        self.bloc = table[:, 2]
+        self.party = table[:, 3]
+
+    def lookup(self, mp_idx, day):
+        """Return (bloc codes, party codes, valid mask) for arrays of MPs and dates"""
+        pos = np.searchsorted(self.keys, mp_idx * DAY_SPAN + day, side='right') - 1
+        safe = np.clip(pos, 0, max(len(self.keys) - 1, 0))
+        valid = (pos >= 0) & (mp_idx >= 0) & (self.mp_idx[safe] == mp_idx)
+        return self.bloc[safe], self.party[safe], valid
+
+def collect_activity(sessions, resolver, mp_codes):
+    """Flatten sessions into activity rows: one row per intervention/segment"""
+    mp_col, day_col, session_col, points_col = [], [], [], []
+    unresolved = 0
+
+    def add_row(mp_id, day, session_idx, points):
+        mp_col.append(mp_codes.get(mp_id, -1))
+        day_col.append(day)
+        session_col.append(session_idx)
+        points_col.append(points)
+
+    for session_idx, session in enumerate(sessions):
+        if not session.get('date'):
+            continue
+        day = to_ordinal(session['date'])
+
+        brief = session.get('brief_summary') or {}
+        for intervention in brief.get('mp_interventions', []):
+            mp_id = resolver.resolve_id(intervention.get('mp_name', ''))
+            if not mp_id:
+                unresolved += 1
+                continue
+            add_row(mp_id, day, session_idx, len(intervention.get('points', [])))
+
+        for segment in session.get('segments', []) or []:
+            mp_id = segment.get('speakerId')
+            if mp_id not in mp_codes:
+                mp_id = resolver.resolve_id(segment.get('speakerName', ''))
+            if not mp_id:
+                unresolved += 1
+                continue
+            add_row(mp_id, day, session_idx, len(segment.get('summaryBullets', [])))
+
+    activity = {
+        'mp': np.array(mp_col, dtype=np.int64),
+        'day': np.array(day_col, dtype=np.int64),
+        'session': np.array(session_col, dtype=np.int64),
+        'points': np.array(points_col, dtype=np.int64),
+    }
+    return activity, unresolved
+
+def count_distinct(group, values, n_groups):
+    """Number of distinct values per group"""
+    if len(group) == 0:
+        return np.zeros(n_groups, dtype=np.int64)
+    pairs = np.unique(np.stack([group, values], axis=1), axis=0)
+    return np.bincount(pairs[:, 0], minlength=n_groups)
+
+def aggregate(group, activity, n_groups):
+    """Per-group activity table"""
+    return {
+        'interventions': np.bincount(group, minlength=n_groups),
+        'points': np.bincount(group, weights=activity['points'], minlength=n_groups).astype(np.int64),
+        'sessions': count_distinct(group, activity['session'], n_groups),
+        'activeMps': count_distinct(group, activity['mp'], n_groups),
+    }
+
+def build_rows(codes, table, name_key):
+    rows = []
+    for code, (session, name) in enumerate(codes.values):
+        rows.append({
+            'session': session,
+            name_key: name,
+            'interventions': int(table['interventions'][code]),
+            'points': int(table['points'][code]),
+            'sessions': int(table['sessions'][code]),
+            'activeMps': int(table['activeMps'][code]),
+        })
+    return rows
+
+def build_bloc_activity(mps, sessions, terms):
+    """Compute per-term bloc and party activity tables"""
+    resolver = MPResolver(mps)
+    blocs, parties = Codes(), Codes()
+
+    index = MembershipIndex(mps, term_start_dates(sessions), blocs, parties)
+    activity, unresolved = collect_activity(sessions, resolver, index.mp_codes)
+
+    bloc_code, party_code, valid = index.lookup(activity['mp'], activity['day'])
+    outside = int((~valid).sum())
+
+    kept = {key: values[valid] for key, values in activity.items()}
+    bloc_table = aggregate(bloc_code[valid], kept, len(blocs.values))
+    party_table = aggregate(party_code[valid], kept, len(parties.values))
+
+    bloc_rows = build_rows(blocs, bloc_table, 'bloc')
+    party_rows = build_rows(parties, party_table, 'party')
+
+    output = []
+    for term in terms:
+        output.append({
+            'id': term['id'],
+            'name': term.get('name'),
+            'blocs': [dict((k, v) for k, v in r.items() if k != 'session') for r in bloc_rows if r['session'] == term['id']],
+            'parties': [dict((k, v) for k, v in r.items() if k != 'session') for r in party_rows if r['session'] == term['id']],
+        })
+
+    stats = {
+        'rows': int(len(activity['mp'])),
+        'unresolved': unresolved,
+        'outsideMembership': outside,
+    }
+    return output, stats
+
+def main():
+    print("=== Bloc / Party Activity Aggregation ===\n")
+
+    mps = load_json(MPS_FILE)
+    sessions = load_json(SESSIONS_FILE)
+    terms = load_json(BLOCS_FILE)
+
+    output, stats = build_bloc_activity(mps, sessions, terms)
+    save_json(OUTPUT_FILE, output)
+
+    print(f"Activity rows: {stats['rows']}")
+    print(f"Unresolved speakers (ministers, staff...): {stats['unresolved']}")
+    print(f"Rows outside any membership period: {stats['outsideMembership']}\n")
+
+    for term in output:
+        print(f"--- {term['name']} ---")
+        for row in sorted(term['blocs'], key=lambda r: -r['interventions']):
+            print(f"  {row['bloc'][:45]}: {row['interventions']} interventions, "
+                  f"{row['activeMps']} MPs, {row['sessions']} sessions")
+
+    print(f"\nSaved to {OUTPUT_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bloc / party name rule engine
+Single place where bloc and party names are canonicalized.
+
+- Canonical names and aliases come from blocs.json (per term) and parties.json
+- Substring rules with explicit priorities come from bloc_rules.json and are
+  compiled into one phrase automaton per term, so a name is scanned once
+- Per-MP overrides in bloc_rules.json win over everything else
+
+Run as a script to canonicalize every bloc/party field in mps.json and
+sessions.json in one pass; import BlocRules to canonicalize at ingest time.
+"""
+
+import json
+import sys
+from collections import Counter
+
+from arabic_text import normalize
+from phrase_automaton import PhraseAutomaton
+
+MPS_FILE = 'public/data/mps.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+BLOCS_FILE = 'public/data/blocs.json'
+PARTIES_FILE = 'public/data/parties.json'
+RULES_FILE = 'bloc_rules.json'
+
+BLOC_FIELDS = {'bloc', 'parliamentaryBloc', 'speakerBloc'}
+PARTY_FIELDS = {'party', 'speakerParty'}
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def normalize_label(text):
+    """Spelling-insensitive key for bloc/party names"""
+    return normalize(text)
+
+class NameRules:
+    """Canonical names + aliases + prioritized substring rules for one namespace"""
+
+    def __init__(self, canonical, aliases, rules, target_key):
+        self.canonical = set(canonical)
+        self.lookup = {normalize_label(name): name for name in canonical}
+        for alias, name in aliases.items():
+            self.lookup.setdefault(normalize_label(alias), name)
+
+        self.automaton = PhraseAutomaton()
+        for rule in rules:
+            self.automaton.add(normalize_label(rule['contains']), (rule.get('priority', 0), rule[target_key]))
+        self.automaton.build()
+
+    def canonical_name(self, name):
+        """Return the canonical name, or None if no rule applies"""
+        if not name or not isinstance(name, str):
+            return None
+        name = name.strip()
+        if name in self.canonical:
+            return name
+
+        key = normalize_label(name)
+        if key in self.lookup:
+            return self.lookup[key]
+
+        best = None
+        for start, end, (priority, target) in self.automaton.finditer(key):
+            rank = (priority, end - start)
+            if best is None or rank > best[0]:
+                best = (rank, target)
+        return best[1] if best else None
+
+class BlocRules:
+    def __init__(self, terms, parties, rules):
+        self.current_term = next((t['id'] for t in terms if t.get('isCurrent')), None)
+        self.blocs = {}
+        for term in terms:
+            canonical = [b['name'] for b in term.get('blocs', [])]
+            aliases = {
+                alias: b['name']
+                for b in term.get('blocs', [])
+                for alias in b.get('aliases', [])
+            }
+            self.blocs[term['id']] = NameRules(
+                canonical, aliases, rules.get('blocs', {}).get(term['id'], []), 'bloc'
+            )
+
+        party_aliases = {alias: p['name'] for p in parties for alias in p.get('aliases', [])}
+        self.parties = NameRules(
+            [p['name'] for p in parties], party_aliases, rules.get('parties', []), 'party'
+        )
+        self.overrides = rules.get('overrides', {})
+        self.unmatched = Counter()
+
+    @classmethod
+    def load(cls, blocs_file=BLOCS_FILE, parties_file=PARTIES_FILE, rules_file=RULES_FILE):
+        return cls(load_json(blocs_file), load_json(parties_file), load_json(rules_file))
+
+    def canonical_bloc(self, name, session=None, mp_id=None):
+        """Canonical bloc name for a term; unknown names are returned unchanged"""
+        session = session or self.current_term
+        override = self.overrides.get(mp_id, {}).get(session)
+        if override and name:
+            return override
+
+        rules = self.blocs.get(session)
+        result = rules.canonical_name(name) if rules else None
+        if result is None:
+            if name:
+                self.unmatched[(session, name)] += 1
+            return name
+        return result
+
+    def same_bloc(self, old, old_session, new, new_session):
+        """
+        True when two names are one bloc across terms, i.e. a rename that
+        blocs.json lists as an alias. Only names and aliases count here; the
+        substring rules are ingest heuristics, not bloc identity.
+        """
+        if old == new:
+            return True
+        old_rules, new_rules = self.blocs.get(old_session), self.blocs.get(new_session)
+        if not old_rules or not new_rules:
+            return False
+        old_key, new_key = normalize_label(old), normalize_label(new)
+        for rules in (new_rules, old_rules):
+            target = rules.lookup.get(old_key)
+            if target and target == rules.lookup.get(new_key):
+                return True
+        return False
+
+    def canonical_party(self, name):
+        result = self.parties.canonical_name(name)
+        if result is None:
+            return name
+        return result
+
+    def _apply(self, record, session, mp_id, changes, where):
+        for field in list(record.keys()):
+            value = record[field]
+            if field in BLOC_FIELDS and isinstance(value, str):
+                new = self.canonical_bloc(value, session, mp_id)
+            elif field in PARTY_FIELDS and isinstance(value, str):
+                new = self.canonical_party(value)
+            else:
+                continue
+            if new != value:
+                record[field] = new
+                changes.append((where, field, value, new))
+
+    def canonicalize_mps(self, mps):
+        """Canonicalize bloc/party fields of every MP in place, return changes"""
+        changes = []
+        for mp in mps:
+            self._apply(mp, self.current_term, mp['id'], changes, mp['id'])
+            for membership in mp.get('memberships', []):
+                self._apply(membership, membership.get('session'), mp['id'], changes, mp['id'])
+        return changes
+
+    def canonicalize_sessions(self, sessions):
+        """Canonicalize any bloc/party field nested inside sessions, return changes"""
+        changes = []
+
+        def walk(node, session, where):
+            if isinstance(node, dict):
+                mp_id = node.get('speakerId') or node.get('mpId')
+                self._apply(node, session, mp_id, changes, where)
+                for value in node.values():
+                    walk(value, session, where)
+            elif isinstance(node, list):
+                for value in node:
+                    walk(value, session, where)
+
+        for session in sessions:
+            term = f"ordinary_{session['ordinaryTerm']}" if session.get('ordinaryTerm') else self.current_term
+            walk(session, term, session.get('id'))
+        return changes
+
+def seat_counts(mps, term_id):
+    return Counter(
+        m.get('bloc') for mp in mps for m in mp.get('memberships', [])
+        if m.get('session') == term_id and m.get('bloc')
+    )
+
+def seat_mismatches(mps, blocs_file=BLOCS_FILE):
+    """[(term id, bloc, members, totalSeats)] for every bloc whose count is off"""
+    mismatches = []
+    for term in load_json(blocs_file):
+        counts = seat_counts(mps, term['id'])
+        for bloc in term.get('blocs', []):
+            actual = counts.pop(bloc['name'], 0)
+            if actual != bloc.get('totalSeats'):
+                mismatches.append((term['id'], bloc['name'], actual, bloc.get('totalSeats')))
+        for name, count in counts.items():
+            mismatches.append((term['id'], name, count, None))
+    return mismatches
+
+def print_counts(mps, blocs_file=BLOCS_FILE):
+    """Compare members per bloc with totalSeats in blocs.json"""
+    terms = load_json(blocs_file)
+    for term in terms:
+        counts = seat_counts(mps, term['id'])
+        print(f"\n=== {term['name']} ===")
+        for bloc in term.get('blocs', []):
+            actual = counts.pop(bloc['name'], 0)
+            status = "OK" if actual == bloc.get('totalSeats') else "MISMATCH"
+            print(f"[{status}] {bloc['name'][:45]}: {actual}/{bloc.get('totalSeats')}")
+        for name, count in counts.items():
+            print(f"[UNEXPECTED] {name}: {count}")
+
+def main():
+    dry_run = '--dry-run' in sys.argv
+
+    print("=== Canonicalizing Bloc / Party Names ===\n")
+    rules = BlocRules.load()
+    mps = load_json(MPS_FILE)
+    sessions = load_json(SESSIONS_FILE)
+
+    mp_changes = rules.canonicalize_mps(mps)
+    session_changes = rules.canonicalize_sessions(sessions)
+
+    for where, field, old, new in (mp_changes + session_changes)[:20]:
+        print(f"  {where} {field}: {old[:35]} -> {new[:35]}")
+    print(f"\nmps.json changes: {len(mp_changes)}")
+    print(f"sessions.json changes: {len(session_changes)}")
+
+    if rules.unmatched:
+        print("\nNames with no rule (left unchanged):")
+        for (session, name), count in rules.unmatched.most_common():
+            print(f"  [{session}] {name}: {count}")
+
+    if not dry_run:
+        if mp_changes:
+            save_json(MPS_FILE, mps)
+        if session_changes:
+            save_json(SESSIONS_FILE, sessions)
+
+    print_counts(mps)
+
+if __name__ == '__main__':
+    main()
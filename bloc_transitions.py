@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bloc transition detector
+Diffs consecutive membership periods of every MP in one sorted sweep and
+writes public/data/transitions.json for TransitionsView.
+
+The feed keeps a hash of its inputs and a fingerprint per MP, so re-runs
+after an edit to mps.json only recompute the MPs whose memberships changed
+(and do nothing at all when the roster is unchanged).
+
+A bloc renamed between terms (listed as an alias of the new name in
+blocs.json) is the same bloc, not a transition.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import date
+
+from bloc_aggregation import term_start_dates, to_ordinal
+from bloc_rules import BlocRules
+
+MPS_FILE = 'public/data/mps.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+BLOCS_FILE = 'public/data/blocs.json'
+OUTPUT_FILE = 'public/data/transitions.json'
+
+DEFAULT_BLOC = "مستقل"
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def digest(value):
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def mp_fingerprint(mp, term_starts, terms_hash):
+    return digest({
+        'name': mp.get('fullName'),
+        'bloc': mp.get('parliamentaryBloc'),
+        'memberships': mp.get('memberships', []),
+        'termStarts': term_starts,
+        'blocs': terms_hash,
+    })
+
+def term_number(session_code):
+    try:
+        return int(session_code.rsplit('_', 1)[-1])
+    except (ValueError, AttributeError):
+        return 0
+
+def membership_periods(mps, term_starts):
+    """One (mp, start, term, bloc) row per membership period, sorted once"""
+    rows = []
+    for mp in mps:
+        for membership in mp.get('memberships', []):
+            session = membership.get('session')
+            start = membership.get('startDate')
+            start = to_ordinal(start) if start else term_starts.get(session, 0)
+            rows.append((mp['id'], start, term_number(session), session, membership.get('bloc')))
+    rows.sort()
+    return rows
+
+def sweep(mps, term_starts, rules):
+    """Emit (per-MP summary, transition events) from a single pass over sorted periods"""
+    by_id = {mp['id']: mp for mp in mps}
+    summaries = {}
+    events = {mp['id']: [] for mp in mps}
+
+    previous = None
+    for row in membership_periods(mps, term_starts):
+        mp_id, start, _, session, bloc = row
+        if (previous and previous[0] == mp_id and bloc and previous[4]
+                and not rules.same_bloc(previous[4], previous[3], bloc, session)):
+            events[mp_id].append({
+                'mpId': mp_id,
+                'name': by_id[mp_id]['fullName'],
+                'fromBloc': previous[4],
+                'toBloc': bloc,
+                'fromSession': previous[3],
+                'toSession': session,
+                'effectiveDate': date.fromordinal(start).isoformat() if start else None,
+            })
+        if bloc or not previous or previous[0] != mp_id:
+            previous = row
+
+    for mp in mps:
+        memberships = {m.get('session'): m for m in mp.get('memberships', [])}
+        term1 = memberships.get('ordinary_1', {}).get('bloc')
+        term2 = memberships.get('ordinary_2', {}).get('bloc') or mp.get('parliamentaryBloc') or DEFAULT_BLOC
+
+        if 'ordinary_1' not in memberships and 'ordinary_2' in memberships:
+            status = 'NEW_ENTRY'
+        elif term1 and not rules.same_bloc(term1, 'ordinary_1', term2, 'ordinary_2'):
+            status = 'SHIFTED'
+        else:
+            status = 'STABLE'
+
+        summaries[mp['id']] = {
+            'mpId': mp['id'],
+            'name': mp['fullName'],
+            'term1Bloc': term1,
+            'term2Bloc': term2,
+            'status': status,
+        }
+
+    return summaries, events
+
+def build_feed(mps, sessions, terms, previous_feed=None):
+    """Return (feed, number of MPs recomputed)"""
+    term_starts = term_start_dates(sessions)
+    terms_hash = digest(terms)
+    fingerprints = {mp['id']: mp_fingerprint(mp, term_starts, terms_hash) for mp in mps}
+
+    old_prints = (previous_feed or {}).get('fingerprints', {})
+    old_rows = {row['mpId']: row for row in (previous_feed or {}).get('mps', [])}
+    old_events = {}
+    for event in (previous_feed or {}).get('transitions', []):
+        old_events.setdefault(event['mpId'], []).append(event)
+
+    changed = [mp for mp in mps if old_prints.get(mp['id']) != fingerprints[mp['id']] or mp['id'] not in old_rows]
+    summaries, events = sweep(changed, term_starts, BlocRules(terms, [], {}))
+
+    rows, transitions = [], []
+    for mp in mps:
+        mp_id = mp['id']
+        if mp_id in summaries:
+            rows.append(summaries[mp_id])
+            transitions.extend(events[mp_id])
+        else:
+            rows.append(old_rows[mp_id])
+            transitions.extend(old_events.get(mp_id, []))
+
+    transitions.sort(key=lambda e: (e['effectiveDate'] or '', e['mpId']))
+
+    feed = {
+        'sourceHash': digest(fingerprints),
+        'fingerprints': fingerprints,
+        'transitions': transitions,
+        'mps': rows,
+    }
+    return feed, len(changed)
+
+def main():
+    force = '--force' in sys.argv
+
+    mps = load_json(MPS_FILE)
+    sessions = load_json(SESSIONS_FILE)
+    terms = load_json(BLOCS_FILE)
+
+    previous_feed = None
+    if os.path.exists(OUTPUT_FILE) and not force:
+        previous_feed = load_json(OUTPUT_FILE)
+
+    feed, recomputed = build_feed(mps, sessions, terms, previous_feed)
+
+    if previous_feed and previous_feed.get('sourceHash') == feed['sourceHash']:
+        print(f"{OUTPUT_FILE} is up to date ({len(feed['transitions'])} transitions)")
+        return
+
+    save_json(OUTPUT_FILE, feed)
+
+    shifted = sum(1 for row in feed['mps'] if row['status'] == 'SHIFTED')
+    print(f"Recomputed {recomputed}/{len(mps)} MPs")
+    print(f"Transitions: {len(feed['transitions'])} ({shifted} MPs shifted bloc)")
+    for event in feed['transitions'][:10]:
+        print(f"  {event['mpId']}: {event['fromBloc'][:30]} -> {event['toBloc'][:30]}")
+    print(f"\nSaved to {OUTPUT_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Boilerplate formula engine
+Finds the ritual formulas of parliamentary speech (opening basmala,
+greetings, addressing the chair, thanks, hand-overs, closing salutations)
+anywhere in a text, so summaries and search are not dominated by them.
+
+The lexicon is compiled once into a phrase automaton over normalized text
+(arabic_text.normalize with offsets), so a segment is scanned once
+whatever the number of formulas. Matches must start and end on word
+boundaries; overlapping matches resolve leftmost-longest. Every span is
+reported in offsets of the original text, so segment offsets
+(startChar/endChar) stay valid after stripping.
+
+Addressing and hand-over formulas are also ordinary words of a sentence
+("أطالب دولة الرئيس بتقديم...", "قالت له تفضل بالجلوس"), so they only
+count at the start of the text or of a clause (after punctuation or
+right after another formula).
+
+    rules = Boilerplate()
+    rules.find(text)          -> [(start, end, category)]
+    rules.strip(text)         -> (clean text, removed spans)
+    python boilerplate.py [FILE ...]    # share of formula text per file
+"""
+
+import re
+import sys
+
+from arabic_text import normalize
+from caption_timeline import CAPTION_DIRS, strip_marks
+from phrase_automaton import PhraseAutomaton
+
+# Normalized form (arabic_text.normalize); "و" + formula is added for each
+FORMULAS = {
+    'opening': [
+        "بسم الله الرحمن الرحيم",
+        "الصلاه والسلام علي رسول الله",
+        "الصلاه والسلام علي اشرف المرسلين",
+        "الصلاه والسلام علي سيدنا محمد",
+        "صباح الخير",
+        "اسعد الله صباحكم",
+        "السلام عليكم",
+        "السلام عليكم ورحمه الله",
+    ],
+    'address': [
+        "سعاده الرئيس",
+        "معالي الرئيس",
+        "سيدي الرئيس",
+        "دوله الرئيس",
+        "اصحاب السعاده",
+        "الزملاء المحترمين",
+        "الزملاء والزميلات",
+        "الزملاء والزميلات الكرام",
+        "زملائي الاعزاء",
+        "الزميلات والزملاء",
+    ],
+    'thanks': [
+        "شكرا",
+        "شكرا جزيلا",
+        "يعطيك العافيه",
+        "الله يعطيك العافيه",
+        "يعطيكم العافيه",
+    ],
+    'handover': [
+        "تفضل",
+        "تفضلي",
+        "تفضلوا",
+    ],
+    'closing': [
+        "السلام عليكم ورحمه الله وبركاته",
+        "ورحمه الله وبركاته",
+    ],
+}
+
+# Categories that are only formulas at the start of a clause
+LEADING = {'address', 'handover'}
+CLAUSE_MARKS = '.،,:;؛!?؟…\n'
+
+TRAILING = re.compile(r'[\s،,:;؛.!]*')
+DROPPED = re.compile(r'[\u064B-\u065F\u0670\u0640]*')
+
+class Boilerplate:
+    """One automaton over a {category: [formula]} lexicon"""
+
+    def __init__(self, formulas=None, leading=LEADING):
+        self.leading = set(leading)
+        self.automaton = PhraseAutomaton()
+        for category, phrases in (formulas or FORMULAS).items():
+            for phrase in phrases:
+                phrase = normalize(phrase, punctuation=True)
+                self.automaton.add(phrase, category)
+                self.automaton.add('و' + phrase, category)
+        self.automaton.build()
+
+    def find(self, text):
+        """Non-overlapping (start, end, category) spans in original offsets"""
+        if not text:
+            return []
+        folded, offsets = normalize(text, punctuation=True, offsets=True)
+        size = len(folded)
+        matches = [
+            (start, end, category) for start, end, category in self.automaton.finditer(folded)
+            if (start == 0 or folded[start - 1] == ' ') and (end == size or folded[end] == ' ')
+        ]
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+
+        spans, last_end = [], 0
+        for start, end, category in matches:
+            if start < last_end:
+                continue
+            original_start = int(offsets[start])
+            if category in self.leading and not self._clause_start(text, original_start, spans):
+                continue
+            last_end = end
+            # Back to the original text, including the marks after the last letter
+            original_end = DROPPED.match(text, int(offsets[end - 1]) + 1).end()
+            spans.append((original_start, original_end, category))
+        return spans
+
+    @staticmethod
+    def _clause_start(text, start, spans):
+        """Nothing but punctuation since the start, a clause mark or the previous formula"""
+        previous_end = spans[-1][1] if spans else 0
+        before = text[previous_end:start].rstrip()
+        return not before.strip(CLAUSE_MARKS + ' ') or before[-1] in CLAUSE_MARKS
+
+    def strip(self, text, categories=None):
+        """
+        Text without its formulas (and the punctuation right after them),
+        whitespace collapsed, plus the removed (start, end, category) spans.
+        """
+        removed = [s for s in self.find(text) if categories is None or s[2] in categories]
+        pieces, position, spans = [], 0, []
+        for start, end, category in removed:
+            end = TRAILING.match(text, end).end()
+            pieces.append(text[position:start])
+            spans.append((start, end, category))
+            position = end
+        pieces.append(text[position:])
+        return ' '.join(' '.join(pieces).split()), spans
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        print("Usage: python boilerplate.py FILE [FILE ...]")
+        print(f"       (caption transcripts live in {', '.join(CAPTION_DIRS)})")
+        return
+    print("=== Boilerplate Formulas ===\n")
+    rules = Boilerplate()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            text = strip_marks(f.read())
+        spans = rules.find(text)
+        chars = sum(end - start for start, end, _ in spans)
+        counts = {}
+        for _, _, category in spans:
+            counts[category] = counts.get(category, 0) + 1
+        print(f"{path}: {len(spans)} formulas, {chars / max(len(text), 1):.1%} of the text {counts}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caption timeline
+YouTube caption transcripts carry real time marks, "(MM:SS)" or
+"(H:MM:SS)", every minute or so. This module strips them from the text and
+keeps them as two sorted arrays: the character offset where each mark
+stood in the clean text and its time in seconds.
+
+A segment's start/end time is then read off those arrays by binary search
+on its character offsets, interpolating linearly between the surrounding
+marks (np.interp). Offsets before the first / after the last mark are
+extrapolated at the transcript's own speaking rate (or the calibrated
+rate from speaking_rate.py when a file has fewer than two marks).
+
+    python caption_timeline.py TRANSCRIPT.txt     # print the marks found
+"""
+
+import json
+import os
+import re
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+CAPTION_DIRS = ['transcripts', 'public/data/transcripts', 'public/data/minutes_verbatim']
+RATES_FILE = 'public/data/speaking_rates.json'
+
+MARK = re.compile(r'\(\s*(?:(\d{1,2}):)?(\d{1,3}):(\d{2})\s*\)[ \t]?')
+VIDEO_ID = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/)([A-Za-z0-9_-]{11})')
+PROBE_WORDS = 8          # words used to find a segment in the transcript
+DEFAULT_CHARS_PER_SECOND = 12.0  # ~130 wpm, until speaking_rate.py has run
+
+def mark_seconds(match):
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+
+@lru_cache(maxsize=1)
+def default_rate():
+    """Calibrated characters per second, for files with fewer than two marks"""
+    try:
+        with open(RATES_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)['global']['charsPerSecond']
+    except (OSError, KeyError, TypeError, ValueError):
+        return DEFAULT_CHARS_PER_SECOND
+
+def strip_marks(text):
+    return MARK.sub('', text)
+
+class CaptionTimeline:
+    """Clean transcript text plus its sorted offset -> time marks"""
+
+    def __init__(self, text, offsets, times, duration=None):
+        self.text = text
+        self.offsets = np.asarray(offsets, dtype=float)
+        self.times = np.asarray(times, dtype=float)
+        self.duration = duration
+        if len(self.offsets) >= 2 and self.times[-1] > self.times[0]:
+            self.rate = (self.offsets[-1] - self.offsets[0]) / (self.times[-1] - self.times[0])
+        else:
+            self.rate = default_rate()
+
+    @classmethod
+    def from_transcript(cls, raw, duration=None):
+        """
+        Remove every mark from the raw transcript. Marks that go back in time
+        (a repeated or mistyped caption) are dropped so times stay sorted.
+        """
+        parts, offsets, times = [], [], []
+        position, length = 0, 0
+        for match in MARK.finditer(raw):
+            parts.append(raw[position:match.start()])
+            length += match.start() - position
+            position = match.end()
+            seconds = mark_seconds(match)
+            if times and seconds < times[-1]:
+                continue
+            if offsets and offsets[-1] == length:
+                times[-1] = seconds
+                continue
+            offsets.append(length)
+            times.append(seconds)
+        parts.append(raw[position:])
+        return cls(''.join(parts), offsets, times, duration)
+
+    @classmethod
+    def from_file(cls, path, duration=None):
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            return cls.from_transcript(f.read(), duration)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def time_at(self, offsets):
+        """Seconds for an array of character offsets into self.text"""
+        offsets = np.asarray(offsets, dtype=float)
+        if not len(self.offsets):
+            result = offsets / self.rate
+        else:
+            result = np.interp(offsets, self.offsets, self.times)
+            before = offsets < self.offsets[0]
+            after = offsets > self.offsets[-1]
+            result[before] = self.times[0] - (self.offsets[0] - offsets[before]) / self.rate
+            result[after] = self.times[-1] + (offsets[after] - self.offsets[-1]) / self.rate
+        return np.clip(result, 0, self.duration if self.duration else None)
+
+    def locate(self, text, start=0):
+        """Offset of a segment's opening words at or after start, or None"""
+        words = strip_marks(text).replace('...', ' ').split()[:PROBE_WORDS]
+        if not words:
+            return None
+        pattern = re.compile(r'\s+'.join(re.escape(w) for w in words))
+        match = pattern.search(self.text, start)
+        return match.start() if match else None
+
+def segment_text(segment):
+    for key in ('fullText', 'sentence', 'text', 'textExcerpt'):
+        if segment.get(key):
+            return segment[key]
+    return ''
+
+def align_segments(segments, timeline):
+    """
+    Set startChar/endChar (when missing) and videoTimestamp/videoEndTimestamp
+    on segments in transcript order. Segments whose text cannot be found
+    start where the previous one did. Returns the number located.
+    """
+    starts, located, cursor = [], 0, 0
+    for segment in segments:
+        start = segment.get('startChar')
+        if start is None:
+            start = timeline.locate(segment_text(segment), cursor)
+        if start is None:
+            start = cursor
+        else:
+            located += 1
+        starts.append(start)
+        cursor = start
+
+    ends = []
+    for index, segment in enumerate(segments):
+        end = segment.get('endChar')
+        if end is None:
+            end = starts[index + 1] if index + 1 < len(starts) else len(timeline.text)
+        ends.append(max(end, starts[index]))
+
+    start_times = timeline.time_at(starts)
+    end_times = timeline.time_at(ends)
+    for segment, start, end, start_time, end_time in zip(segments, starts, ends, start_times, end_times):
+        segment['startChar'] = int(start)
+        segment['endChar'] = int(end)
+        segment['videoTimestamp'] = int(start_time)
+        segment['videoEndTimestamp'] = int(np.ceil(end_time))
+    return located
+
+def video_id_of(session):
+    """YouTube id of a session in either the old or the current layout"""
+    youtube = session.get('youtube') or {}
+    if youtube.get('video_id'):
+        return youtube['video_id']
+    if session.get('youtubeVideoId'):
+        return session['youtubeVideoId']
+    for key in ('youtubeUrl', 'minutesUrl', 'videoUrl'):
+        match = VIDEO_ID.search(session.get(key) or '')
+        if match:
+            return match.group(1)
+    return None
+
+def caption_files(dirs=CAPTION_DIRS):
+    """{video id: path} for every transcript that names its video and has time marks"""
+    found = {}
+    for directory in dirs:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not name.endswith('.txt') or not os.path.isfile(path):
+                continue
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                raw = f.read()
+            video = VIDEO_ID.search(raw)
+            if video and MARK.search(raw):
+                found.setdefault(video.group(1), path)
+    return found
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python caption_timeline.py TRANSCRIPT.txt")
+        return
+    timeline = CaptionTimeline.from_file(sys.argv[1])
+    print(f"Marks: {len(timeline)}  text: {len(timeline.text)} chars  rate: {timeline.rate:.1f} chars/s")
+    for offset, seconds in list(zip(timeline.offsets, timeline.times))[:20]:
+        print(f"  {int(offset):>7}  {int(seconds) // 60:>3}:{int(seconds) % 60:02d}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar corpus export
+Flattens sessions.json into four Parquet tables for analytics (pandas,
+DuckDB, Polars) so nobody has to parse the nested JSON again:
+
+    sessions       one row per sitting (date, term, duration)
+    segments       one row per transcript segment (speaker, bloc, times, topics)
+    interventions  one row per brief_summary.mp_interventions entry
+    items          one row per brief_summary event / decision (+ vote type)
+
+Speaker, bloc, party, role, topic and other low-cardinality columns are
+dictionary-encoded. Speakers are joined to the bloc and party they belonged
+to on the day of the sitting (bloc_aggregation.MembershipIndex).
+Speaking time only comes from timed segments (durationSec); an
+intervention is a short summary, so it only carries the word count of
+its summary points (summaryWords), not a time.
+
+Files are written per session, exports/columnar/<table>/<session id>.parquet,
+and a session is only rewritten when its JSON (or the MP roster or votes it is
+joined with) changed:
+
+    python columnar_export.py             # incremental
+    python columnar_export.py --force
+
+    duckdb> SELECT bloc, strftime(date, '%Y-%m') AS month, sum(durationSec) / 60
+            FROM 'exports/columnar/segments/*.parquet' GROUP BY ALL;
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bloc_aggregation import Codes, MembershipIndex, term_start_dates, to_ordinal
+from caption_timeline import video_id_of
+from mp_resolver import MPResolver
+from speaking_rate import duration_seconds
+
+MPS_FILE = 'public/data/mps.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+VOTES_FILE = 'public/data/votes.json'
+OUT_DIR = Path('exports/columnar')
+MANIFEST_FILE = OUT_DIR / 'manifest.json'
+EXPORT_VERSION = 2
+
+TEXT = pa.string()
+CODE = pa.dictionary(pa.int32(), pa.string())
+
+SCHEMAS = {
+    'sessions': pa.schema([
+        ('sessionId', TEXT), ('title', TEXT), ('date', pa.date32()),
+        ('ordinaryTerm', pa.int8()), ('termCode', CODE),
+        ('durationSec', pa.int32()), ('estimatedDurationMinutes', pa.int32()),
+        ('durationSource', CODE), ('numSpeakers', pa.int16()), ('videoId', TEXT),
+    ]),
+    'segments': pa.schema([
+        ('sessionId', CODE), ('date', pa.date32()), ('segmentId', TEXT), ('order', pa.int32()),
+        ('speakerId', CODE), ('speakerName', CODE), ('speakerRole', CODE),
+        ('bloc', CODE), ('party', CODE),
+        ('startSec', pa.int32()), ('endSec', pa.int32()), ('durationSec', pa.int32()),
+        ('words', pa.int32()), ('stance', CODE), ('topics', pa.list_(CODE)),
+    ]),
+    'interventions': pa.schema([
+        ('sessionId', CODE), ('date', pa.date32()), ('order', pa.int32()),
+        ('mpId', CODE), ('mpName', CODE), ('bloc', CODE), ('party', CODE),
+        ('points', pa.int16()), ('summaryWords', pa.int32()),
+    ]),
+    'items': pa.schema([
+        ('sessionId', CODE), ('date', pa.date32()), ('source', CODE), ('order', pa.int32()),
+        ('text', TEXT), ('voteType', CODE), ('voteOutcome', CODE),
+    ]),
+}
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def load_optional(filepath, default):
+    return load_json(filepath) if os.path.exists(filepath) else default
+
+def content_hash(*parts):
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(json.dumps(part, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return h.hexdigest()
+
+def word_count(text):
+    return len(str(text or '').split())
+
+def iso_day(value):
+    return value[:10] if value and re.match(r'\d{4}-\d{2}-\d{2}', value) else None
+
+class Context:
+    """Everything a session row is joined with"""
+
+    def __init__(self, mps, sessions, votes):
+        self.resolver = MPResolver(mps)
+        self.blocs, self.parties = Codes(), Codes()
+        self.index = MembershipIndex(mps, term_start_dates(sessions), self.blocs, self.parties)
+        # First vote row of each decision / event item: '<session>-<d|e><item>'
+        self.votes = {}
+        for row in votes:
+            self.votes.setdefault(row['id'].rsplit('-', 1)[0], row)
+        self.hash = content_hash(EXPORT_VERSION, mps, votes)
+
+    def memberships(self, mp_ids, day):
+        """(bloc names, party names) for a list of MP ids on one day"""
+        if day is None or not mp_ids:
+            return [None] * len(mp_ids), [None] * len(mp_ids)
+        mp_idx = np.array([self.index.mp_codes.get(mp_id, -1) if mp_id else -1 for mp_id in mp_ids], dtype=np.int64)
+        bloc, party, valid = self.index.lookup(mp_idx, np.full(len(mp_ids), day, dtype=np.int64))
+        blocs = [self.blocs.values[b][1] if ok else None for b, ok in zip(bloc, valid)]
+        parties = [self.parties.values[p][1] if ok else None for p, ok in zip(party, valid)]
+        return blocs, parties
+
+def session_tables(session, context):
+    """{table name: pyarrow.Table} for one session"""
+    session_id = session['id']
+    day_text = iso_day(session.get('date'))
+    day = to_ordinal(day_text) if day_text else None
+    date_value = date.fromisoformat(day_text) if day_text else None
+    stats = session.get('stats') or {}
+
+    tables = {'sessions': [{
+        'sessionId': session_id,
+        'title': (session.get('title') or '').lstrip('﻿'),
+        'date': date_value,
+        'ordinaryTerm': session.get('ordinaryTerm'),
+        'termCode': session.get('term'),
+        'durationSec': duration_seconds(session),
+        'estimatedDurationMinutes': stats.get('estimated_duration_minutes'),
+        'durationSource': stats.get('duration_source'),
+        'numSpeakers': session.get('num_speakers'),
+        'videoId': video_id_of(session),
+    }]}
+
+    segments = session.get('segments') or []
+    speaker_ids = [
+        seg.get('speakerId') if seg.get('speakerId') in context.resolver.by_id
+        else context.resolver.resolve_id(seg.get('speakerName', ''))
+        for seg in segments
+    ]
+    blocs, parties = context.memberships(speaker_ids, day)
+    rows = []
+    for order, (segment, mp_id, bloc, party) in enumerate(zip(segments, speaker_ids, blocs, parties), 1):
+        start, end = segment.get('videoTimestamp'), segment.get('videoEndTimestamp')
+        rows.append({
+            'sessionId': session_id, 'date': date_value,
+            'segmentId': segment.get('id'), 'order': order,
+            'speakerId': mp_id, 'speakerName': segment.get('speakerName'),
+            'speakerRole': segment.get('speakerRole'), 'bloc': bloc, 'party': party,
+            'startSec': start, 'endSec': end,
+            'durationSec': end - start if start is not None and end is not None else None,
+            'words': word_count(segment.get('fullText') or segment.get('sentence') or segment.get('textExcerpt')),
+            'stance': segment.get('stanceTowardGovernment'),
+            'topics': segment.get('topics') or [],
+        })
+    tables['segments'] = rows
+
+    brief = session.get('brief_summary') or {}
+    interventions = [i for i in brief.get('mp_interventions') or [] if isinstance(i, dict)]
+    mp_ids = [context.resolver.resolve_id(i.get('mp_name', '')) for i in interventions]
+    blocs, parties = context.memberships(mp_ids, day)
+    rows = []
+    for order, (intervention, mp_id, bloc, party) in enumerate(zip(interventions, mp_ids, blocs, parties), 1):
+        points = intervention.get('points') or []
+        rows.append({
+            'sessionId': session_id, 'date': date_value, 'order': order,
+            'mpId': mp_id, 'mpName': intervention.get('mp_name'), 'bloc': bloc, 'party': party,
+            'points': len(points), 'summaryWords': sum(word_count(p) for p in points),
+        })
+    tables['interventions'] = rows
+
+    rows = []
+    for source in ('events', 'decisions'):
+        for order, text in enumerate(brief.get(source) or []):
+            if not isinstance(text, str):
+                continue
+            vote = context.votes.get(f"{session_id}-{source[0]}{order}") or {}
+            rows.append({
+                'sessionId': session_id, 'date': date_value, 'source': source, 'order': order,
+                'text': text, 'voteType': vote.get('type'), 'voteOutcome': vote.get('outcome'),
+            })
+    tables['items'] = rows
+
+    return {name: pa.Table.from_pylist(rows, schema=SCHEMAS[name]) for name, rows in tables.items()}
+
+def write_session(session_id, tables, out_dir=OUT_DIR):
+    for name, table in tables.items():
+        path = Path(out_dir) / name / f"{session_id}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.part')
+        pq.write_table(table, tmp, compression='zstd')
+        os.replace(tmp, path)
+
+def remove_session(session_id, out_dir=OUT_DIR):
+    for name in SCHEMAS:
+        path = Path(out_dir) / name / f"{session_id}.parquet"
+        if path.exists():
+            path.unlink()
+
+def run(force=False, out_dir=OUT_DIR):
+    """Export changed sessions; returns (written ids, unchanged count, removed ids)"""
+    sessions = load_json(SESSIONS_FILE)
+    context = Context(load_json(MPS_FILE), sessions, load_optional(VOTES_FILE, []))
+    manifest_file = Path(out_dir) / MANIFEST_FILE.name
+    manifest = {} if force or not manifest_file.exists() else load_json(manifest_file)
+
+    written, unchanged, current = [], 0, {}
+    for session in sessions:
+        key = content_hash(context.hash, session)
+        current[session['id']] = key
+        if manifest.get(session['id']) == key and all(
+                (Path(out_dir) / name / f"{session['id']}.parquet").exists() for name in SCHEMAS):
+            unchanged += 1
+            continue
+        write_session(session['id'], session_tables(session, context), out_dir)
+        written.append(session['id'])
+
+    removed = [session_id for session_id in manifest if session_id not in current]
+    for session_id in removed:
+        remove_session(session_id, out_dir)
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    save_json(manifest_file, current)
+    return written, unchanged, removed
+
+def main():
+    print("=== Columnar Corpus Export ===\n")
+    written, unchanged, removed = run(force='--force' in sys.argv)
+    print(f"Sessions written: {len(written)}, unchanged: {unchanged}, removed: {len(removed)}")
+    for name in SCHEMAS:
+        files = sorted((OUT_DIR / name).glob('*.parquet'))
+        rows = sum(pq.ParquetFile(f).metadata.num_rows for f in files)
+        size = sum(f.stat().st_size for f in files)
+        print(f"  {name}: {rows} rows in {len(files)} files, {size / 1024:.0f} KB")
+    print(f"\nSaved to {OUT_DIR}/")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Committee membership index
+Builds a committee dimension table and an inverted index
+(committee x session -> MP ids) from memberships[].committees in mps.json
+and saves it to public/data/committees.json.
+
+CommitteeIndex answers rosters, an MP's committees, overlaps between two
+committees and term-over-term changes without scanning the MP roster.
+"""
+
+import hashlib
+import json
+import sys
+
+from arabic_text import normalize
+
+MPS_FILE = 'public/data/mps.json'
+OUTPUT_FILE = 'public/data/committees.json'
+
+# Category prefix the official site puts before every standing committee
+CATEGORY_PREFIXES = ("اللجان الدائمة",)
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def committee_key(name):
+    """Spelling-insensitive key used to merge committee name variants"""
+    return normalize(name).replace("خطبه العرش", "خطاب العرش")
+
+def normalize_committee(value):
+    """
+    Clean a committee value as parsed from the profile text.
+    "اللجان الدائمة / اللجنة القانونية" -> "اللجنة القانونية"
+    "لجنة الرد على خطاب العرش / لجنة الرد على خطبة العرش" -> "لجنة الرد على خطاب العرش"
+    Returns None for bare category labels.
+    """
+    if not value:
+        return None
+    parts = [p.strip() for p in value.split("/") if p.strip()]
+    if not parts:
+        return None
+    # "لجنة الرد على خطاب العرش / لجنة الرد على خطبة العرش": the category is the committee
+    name = parts[0] if parts[0].startswith(("لجنة", "اللجنة")) else parts[-1]
+    name = " ".join(name.split())
+    if not name or name in CATEGORY_PREFIXES or name == "لا يوجد":
+        return None
+    return name
+
+def committee_id(name):
+    return "cmt_" + hashlib.sha1(committee_key(name).encode('utf-8')).hexdigest()[:8]
+
+def build_committee_index(mps):
+    """Return the committees.json artefact for a list of MPs"""
+    committees = {}
+    rosters = {}
+    by_mp = {}
+
+    for mp in mps:
+        for membership in mp.get('memberships', []):
+            session = membership.get('session')
+            for raw in membership.get('committees', []) or []:
+                name = normalize_committee(raw)
+                if not name or not session:
+                    continue
+                cid = committee_id(name)
+                committees.setdefault(cid, name)
+                members = rosters.setdefault(cid, {}).setdefault(session, [])
+                if mp['id'] not in members:
+                    members.append(mp['id'])
+                mine = by_mp.setdefault(mp['id'], {}).setdefault(session, [])
+                if cid not in mine:
+                    mine.append(cid)
+
+    sessions = sorted({s for roster in rosters.values() for s in roster})
+    changes = {}
+    for cid, roster in rosters.items():
+        term_changes = {}
+        for previous, current in zip(sessions, sessions[1:]):
+            before, after = set(roster.get(previous, [])), set(roster.get(current, []))
+            term_changes[current] = {
+                'joined': sorted(after - before),
+                'left': sorted(before - after),
+                'stayed': sorted(before & after),
+            }
+        changes[cid] = term_changes
+
+    return {
+        'sessions': sessions,
+        'committees': [
+            {'id': cid, 'name': name, 'memberCounts': {s: len(m) for s, m in sorted(rosters[cid].items())}}
+            for cid, name in sorted(committees.items(), key=lambda x: x[1])
+        ],
+        'rosters': {cid: {s: sorted(m) for s, m in roster.items()} for cid, roster in rosters.items()},
+        'byMp': by_mp,
+        'changes': changes,
+    }
+
+class CommitteeIndex:
+    """Query API over committees.json"""
+
+    def __init__(self, data):
+        self.data = data
+        self.names = {c['id']: c['name'] for c in data['committees']}
+        self.ids = {committee_key(c['name']): c['id'] for c in data['committees']}
+        self.rosters = {
+            cid: {session: frozenset(members) for session, members in roster.items()}
+            for cid, roster in data['rosters'].items()
+        }
+
+    @classmethod
+    def load(cls, filepath=OUTPUT_FILE):
+        return cls(load_json(filepath))
+
+    def resolve(self, committee):
+        """Accept a committee id or any spelling of its name"""
+        if committee in self.names:
+            return committee
+        name = normalize_committee(committee)
+        return self.ids.get(committee_key(name)) if name else None
+
+    def roster(self, committee, session):
+        """MP ids of a committee in a session"""
+        return self.rosters.get(self.resolve(committee), {}).get(session, frozenset())
+
+    def committees_of(self, mp_id, session):
+        return [self.names[cid] for cid in self.data['byMp'].get(mp_id, {}).get(session, [])]
+
+    def overlap(self, first, second, session):
+        """MPs sitting on both committees in a session"""
+        return self.roster(first, session) & self.roster(second, session)
+
+    def changes(self, committee, session):
+        """joined / left / stayed lists going into a session (vs the previous one)"""
+        return self.data['changes'].get(self.resolve(committee), {}).get(session)
+
+def main():
+    mps = load_json(MPS_FILE)
+    data = build_committee_index(mps)
+    save_json(OUTPUT_FILE, data)
+
+    print(f"Committees: {len(data['committees'])} across sessions {', '.join(data['sessions'])}")
+    for committee in data['committees']:
+        counts = ", ".join(f"{s}: {n}" for s, n in committee['memberCounts'].items())
+        print(f"  {committee['name']} ({counts})")
+
+    if len(sys.argv) > 1:
+        index = CommitteeIndex(data)
+        for name in sys.argv[1:]:
+            for session in data['sessions']:
+                members = sorted(index.roster(name, session))
+                print(f"\n{name} [{session}]: {len(members)} members")
+                for mp_id in members:
+                    print(f"  {mp_id}")
+
+    print(f"\nSaved to {OUTPUT_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,31 @@
 
 import React, { useState, useEffect } from 'react';
 import { Layers, Search, ChevronDown, ChevronUp, Users, History, Clock } from 'lucide-react';
-import { getBlocMemberships } from '../services/api';
-import { BlocMembership } from '../types';
+import { getBlocMemberships, getBlocActivity, getPhotoAtlas, spriteStyle } from '../services/api';
+import { BlocMembership, TermActivity, PhotoAtlas } from '../types';
+import SpritePhoto from './SpritePhoto';
 import { normalizeForSearch } from '../utils/dataProcessing';
 
 const BlocsDirectoryView: React.FC = () => {
     const [activeTerm, setActiveTerm] = useState<1 | 2>(2);
     const [members, setMembers] = useState<BlocMembership[]>([]);
+    const [activity, setActivity] = useState<TermActivity | undefined>();
     const [searchQuery, setSearchQuery] = useState('');
     const [expandedBloc, setExpandedBloc] = useState<string | null>(null);
     const [loading, setLoading] = useState(true);
+    const [photoAtlas, setPhotoAtlas] = useState<PhotoAtlas | undefined>();
+
+    useEffect(() => { getPhotoAtlas().then(setPhotoAtlas); }, []);
 
     useEffect(() => {
         const load = async () => {
             setLoading(true);
-            const data = await getBlocMemberships(activeTerm);
+            const [data, termActivity] = await Promise.all([
+                getBlocMemberships(activeTerm),
+                getBlocActivity(activeTerm)
+            ]);
             setMembers(data);
+            setActivity(termActivity);
             setLoading(false);
         };
         load();
@@ -25,16 +34,22 @@ const BlocsDirectoryView: React.FC = () => {
     // Group members by bloc
     const blocsMap = members.reduce((acc, m) => {
         if (!acc[m.blocName]) acc[m.blocName] = [];
-        acc[m.blocName].push(m.memberName);
+        acc[m.blocName].push(m);
+        return acc;
+    }, {} as Record<string, BlocMembership[]>);
+    const session = activeTerm === 1 ? 'ordinary_1' : 'ordinary_2';
+
+    const activityByBloc = (activity?.blocs || []).reduce((acc, b) => {
+        acc[b.bloc] = b.interventions;
         return acc;
-    }, {} as Record<string, string[]>);
+    }, {} as Record<string, number>);
 
     const filteredBlocNames = Object.keys(blocsMap).filter(blocName => {
         if (!searchQuery) return true;
         const normalizedQuery = normalizeForSearch(searchQuery);
         // Match bloc name or any member in the bloc
         return normalizeForSearch(blocName).includes(normalizedQuery) || 
-               blocsMap[blocName].some(m => normalizeForSearch(m).includes(normalizedQuery));
+               blocsMap[blocName].some(m => normalizeForSearch(m.memberName).includes(normalizedQuery));
     });
 
     return (
@@ -93,7 +108,7 @@ const BlocsDirectoryView: React.FC = () => {
                                     </div>
                                     <div className="text-right">
                                         <h3 className="font-black text-parliament-greenMain text-lg">{blocName}</h3>
-                                        <p className="text-[10px] font-black text-parliament-textMuted uppercase tracking-widest">{blocsMap[blocName].length} عضواً</p>
+                                        <p className="text-[10px] font-black text-parliament-textMuted uppercase tracking-widest">{blocsMap[blocName].length} عضواً{activityByBloc[blocName] ? ` · ${activityByBloc[blocName]} مداخلة` : ''}</p>
                                     </div>
                                 </div>
                                 {expandedBloc === blocName ? <ChevronUp size={20} className="text-parliament-wood" /> : <ChevronDown size={20} className="text-parliament-wood" />}
@@ -102,10 +117,11 @@ const BlocsDirectoryView: React.FC = () => {
                             {expandedBloc === blocName && (
                                 <div className="p-6 bg-parliament-wall/10 border-t border-parliament-wall animate-fade-in">
                                     <div className="grid grid-cols-1 gap-2">
-                                        {blocsMap[blocName].sort().map((name, idx) => (
-                                            <div key={idx} className="flex items-center gap-3 p-3 bg-white rounded-xl border border-parliament-wood/5 text-sm font-bold text-parliament-text">
+                                        {[...blocsMap[blocName]].sort((a, b) => a.memberName.localeCompare(b.memberName)).map((m, idx) => (
+                                            <div key={m.mpId} className="flex items-center gap-3 p-3 bg-white rounded-xl border border-parliament-wood/5 text-sm font-bold text-parliament-text">
                                                 <span className="w-6 h-6 bg-parliament-wall text-[10px] flex items-center justify-center rounded-full text-parliament-woodDark">{idx + 1}</span>
-                                                {name}
+                                                <SpritePhoto sprite={spriteStyle(photoAtlas, 'bloc', `${session}/${blocName}`, m.mpId)} alt={m.memberName} className="w-8 h-8 rounded-full shrink-0 bg-parliament-wall" />
+                                                {m.memberName}
                                             </div>
                                         ))}
                                     </div>
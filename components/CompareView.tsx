@@ -1,7 +1,7 @@
 
 import React, { useState, useEffect } from 'react';
 import { MP } from '../types';
-import { getMPs } from '../services/api';
+import { getMPs, mpPhoto } from '../services/api';
 import ImageWithFallback from './ImageWithFallback';
 import { BarChart, Bar, XAxis, YAxis, Tooltip, Legend, ResponsiveContainer, RadarChart, PolarGrid, PolarAngleAxis, PolarRadiusAxis, Radar } from 'recharts';
 import { Search, ArrowRightLeft, Users } from 'lucide-react';
@@ -68,7 +68,7 @@ const CompareView: React.FC = () => {
                                         onClick={() => setMp1(mp)}
                                         className="w-full flex items-center gap-3 p-2 hover:bg-parliament-wallWarm/20 rounded-md text-right transition-colors"
                                     >
-                                        <ImageWithFallback src={mp.photoUrl} alt={mp.fullName} className="w-8 h-8 rounded-full object-cover"/>
+                                        <ImageWithFallback src={mpPhoto(mp, 'avatar')} alt={mp.fullName} className="w-8 h-8 rounded-full object-cover"/>
                                         <div className="text-sm font-bold text-parliament-text">{mp.fullName}</div>
                                     </button>
                                 ))}
@@ -77,7 +77,7 @@ const CompareView: React.FC = () => {
                     ) : (
                         <div className="text-center relative">
                             <button onClick={() => setMp1(null)} className="absolute top-0 left-0 text-xs text-red-500 hover:underline">تغيير</button>
-                            <ImageWithFallback src={mp1.photoUrl} alt={mp1.fullName} className="w-24 h-24 rounded-full mx-auto mb-4 object-cover border-4 border-parliament-wood/20 shadow-md"/>
+                            <ImageWithFallback src={mpPhoto(mp1, 'card')} alt={mp1.fullName} className="w-24 h-24 rounded-full mx-auto mb-4 object-cover border-4 border-parliament-wood/20 shadow-md"/>
                             <h3 className="text-xl font-black text-parliament-greenMain">{mp1.fullName}</h3>
                             <div className="text-parliament-textMuted text-sm mt-1">{mp1.district || mp1.governorate}</div>
                             <span className="inline-block bg-parliament-wood/10 text-parliament-woodDark px-3 py-1 rounded-full text-xs font-bold mt-2">{mp1.party || 'مستقل'}</span>
@@ -106,7 +106,7 @@ const CompareView: React.FC = () => {
                                         onClick={() => setMp2(mp)}
                                         className="w-full flex items-center gap-3 p-2 hover:bg-parliament-wallWarm/20 rounded-md text-right transition-colors"
                                     >
-                                        <ImageWithFallback src={mp.photoUrl} alt={mp.fullName} className="w-8 h-8 rounded-full object-cover"/>
+                                        <ImageWithFallback src={mpPhoto(mp, 'avatar')} alt={mp.fullName} className="w-8 h-8 rounded-full object-cover"/>
                                         <div className="text-sm font-bold text-parliament-text">{mp.fullName}</div>
                                     </button>
                                 ))}
@@ -115,7 +115,7 @@ const CompareView: React.FC = () => {
                     ) : (
                         <div className="text-center relative">
                              <button onClick={() => setMp2(null)} className="absolute top-0 left-0 text-xs text-red-500 hover:underline">تغيير</button>
-                            <ImageWithFallback src={mp2.photoUrl} alt={mp2.fullName} className="w-24 h-24 rounded-full mx-auto mb-4 object-cover border-4 border-parliament-wood/20 shadow-md"/>
+                            <ImageWithFallback src={mpPhoto(mp2, 'card')} alt={mp2.fullName} className="w-24 h-24 rounded-full mx-auto mb-4 object-cover border-4 border-parliament-wood/20 shadow-md"/>
                             <h3 className="text-xl font-black text-parliament-greenMain">{mp2.fullName}</h3>
                             <div className="text-parliament-textMuted text-sm mt-1">{mp2.district || mp2.governorate}</div>
                             <span className="inline-block bg-parliament-wood/10 text-parliament-woodDark px-3 py-1 rounded-full text-xs font-bold mt-2">{mp2.party || 'مستقل'}</span>
@@ -1,7 +1,8 @@
 
-import React from 'react';
-import { ArrowRight, Calendar, FileText, Check, Clock, ExternalLink, HelpCircle, Lightbulb } from 'lucide-react';
-import { Law } from '../types';
+import React, { useState, useEffect } from 'react';
+import { ArrowRight, Calendar, FileText, Check, Clock, ExternalLink, HelpCircle, Lightbulb, MessageSquare } from 'lucide-react';
+import { Law, LawArticles } from '../types';
+import { getLawArticles } from '../services/api';
 import DataMeta from './DataMeta';
 
 interface LawDetailViewProps {
@@ -9,7 +10,18 @@ interface LawDetailViewProps {
   onBack: () => void;
 }
 
+const AMENDMENT_LABELS = { amend: 'تعديل', replace: 'استبدال نص', repeal: 'إلغاء', add: 'إضافة' };
+
 const LawDetailView: React.FC<LawDetailViewProps> = ({ law, onBack }) => {
+  const [articles, setArticles] = useState<LawArticles | undefined>();
+
+  useEffect(() => {
+    setArticles(undefined);
+    getLawArticles(law).then(setArticles);
+  }, [law.id]);
+
+  const parsedDocument = articles?.documents.find(d => d.status === 'parsed');
+
   return (
     <div className="space-y-8 animate-fade-in">
        <button onClick={onBack} className="flex items-center gap-2 text-slate-500 hover:text-slate-900 transition-colors font-medium">
@@ -112,6 +124,38 @@ const LawDetailView: React.FC<LawDetailViewProps> = ({ law, onBack }) => {
             </div>
         </div>
 
+        {/* Articles (parsed from the bill PDF) */}
+        {parsedDocument && (
+            <div className="mb-8">
+                <h3 className="font-bold text-slate-800 text-lg mb-4">مواد المشروع</h3>
+                <div className="space-y-3">
+                    {parsedDocument.articles.map(article => {
+                        const cited = articles?.citations[String(article.number)] || [];
+                        return (
+                            <div key={article.number} className="border border-slate-200 rounded-xl p-4">
+                                <div className="flex flex-wrap items-center gap-2 mb-2">
+                                    <span className="font-black text-slate-900">المادة {article.number}</span>
+                                    {article.amends && (
+                                        <span className="bg-amber-50 text-amber-700 border border-amber-100 px-2 py-0.5 rounded-full text-xs font-bold">
+                                            {AMENDMENT_LABELS[article.amends.action]} المادة ({article.amends.article}) من القانون الأصلي
+                                        </span>
+                                    )}
+                                    {cited.length > 0 && (
+                                        <span className="text-xs text-slate-500 flex items-center gap-1"><MessageSquare size={12} /> {cited.length} إشارة في الجلسات</span>
+                                    )}
+                                </div>
+                                <div className="space-y-1 text-sm text-slate-700 leading-relaxed">
+                                    {article.clauses.map((clause, idx) => (
+                                        <p key={idx}>{clause.label && <span className="font-bold">{clause.label}- </span>}{clause.text}</p>
+                                    ))}
+                                </div>
+                            </div>
+                        );
+                    })}
+                </div>
+            </div>
+        )}
+
         {law.pdfUrl && (
              <div className="bg-slate-50 border border-slate-200 rounded-xl p-6 flex justify-between items-center mt-8">
                 <div>
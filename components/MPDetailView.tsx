@@ -2,7 +2,7 @@
 import React, { useState, useEffect } from 'react';
 import { ArrowRight, MapPin, Twitter, Link as LinkIcon, Award, Mail, Calendar, Mic, History, ChevronLeft, HelpCircle, Bell, BellRing, Play, Landmark } from 'lucide-react';
 import { MP, ParliamentSession, TranscriptSegment } from '../types';
-import { getSessions, addSubscription, getSubscriptions, getUserEmail, setUserEmail } from '../services/api';
+import { getSessions, addSubscription, getSubscriptions, getUserEmail, setUserEmail, mpPhoto } from '../services/api';
 import { getSegmentsForMP, getMPInterventionHistory } from '../utils/dataProcessing';
 import ImageWithFallback from './ImageWithFallback';
 import SubscriptionModal from './SubscriptionModal';
@@ -90,7 +90,7 @@ const MPDetailView: React.FC<MPDetailViewProps> = ({ mp, onBack, onSessionClick,
                             <div className="absolute -inset-1 bg-gradient-to-br from-[#B18154] to-[#2D463E] rounded-[28px] blur opacity-25 group-hover:opacity-50 transition duration-1000"></div>
                             <div className="relative bg-white p-1.5 rounded-[26px] shadow-2xl border border-white">
                                 <ImageWithFallback
-                                    src={mp.photoUrl}
+                                    src={mpPhoto(mp, 'detail')}
                                     alt={mp.fullName}
                                     className="w-40 h-40 md:w-48 md:h-48 rounded-[20px] object-cover bg-parliament-wall"
                                 />
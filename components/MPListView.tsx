@@ -1,9 +1,9 @@
 
 import React, { useState, useEffect } from 'react';
 import { Search, Users, ChevronLeft, Bell, BellRing, MapPin, Flag, Home, Filter } from 'lucide-react';
-import { MP, Subscription } from '../types';
-import { getMPs, getSubscriptions, addSubscription, removeSubscription, getUserEmail, setUserEmail, normalizeForSearch } from '../services/api';
-import ImageWithFallback from './ImageWithFallback';
+import { MP, Subscription, PhotoAtlas } from '../types';
+import { getMPs, getSubscriptions, addSubscription, removeSubscription, getUserEmail, setUserEmail, normalizeForSearch, mpPhoto, getPhotoAtlas, spriteStyle } from '../services/api';
+import SpritePhoto from './SpritePhoto';
 import SubscriptionModal from './SubscriptionModal';
 
 interface MPListViewProps {
@@ -15,6 +15,7 @@ interface MPListViewProps {
 const MPListView: React.FC<MPListViewProps> = ({ onMpSelect, selectedCommittee, onClearCommittee }) => {
     const [mps, setMps] = useState<MP[]>([]);
     const [filteredMps, setFilteredMps] = useState<MP[]>([]);
+    const [photoAtlas, setPhotoAtlas] = useState<PhotoAtlas | undefined>();
     const [subs, setSubs] = useState<Subscription[]>([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState<string | null>(null);
@@ -34,8 +35,9 @@ const MPListView: React.FC<MPListViewProps> = ({ onMpSelect, selectedCommittee,
         setLoading(true);
         setError(null);
         try {
-            const data = await getMPs();
+            const [data, atlas] = await Promise.all([getMPs(), getPhotoAtlas()]);
             setMps(data);
+            setPhotoAtlas(atlas);
             setSubs(getSubscriptions());
 
             const govSet = new Set<string>();
@@ -218,7 +220,7 @@ const MPListView: React.FC<MPListViewProps> = ({ onMpSelect, selectedCommittee,
                             </button>
 
                             <div className="relative pt-[110%] bg-slate-50 overflow-hidden shrink-0">
-                                <ImageWithFallback src={mp.photoUrl} alt={mp.fullName} className="absolute inset-0 w-full h-full object-cover group-hover:scale-105 transition-transform duration-700" />
+                                <SpritePhoto sprite={spriteStyle(photoAtlas, 'governorate', mp.governorate, mp.id)} src={mpPhoto(mp, 'card')} alt={mp.fullName} className="absolute inset-0 w-full h-full object-cover group-hover:scale-105 transition-transform duration-700" />
                                 {/* تدرج أقوى لضمان وضوح النص */}
                                 <div className="absolute inset-0 bg-gradient-to-t from-black/90 via-black/40 to-transparent"></div>
 
@@ -1,8 +1,8 @@
 
 import React, { useState, useEffect } from 'react';
-import { Users, Landmark, Layers, Shield, Search, Info, ChevronLeft, Clock, History } from 'lucide-react';
-import { Party, MP, BlocMembership } from '../types';
-import { getParties, getMPs, getBlocMemberships } from '../services/api';
+import { Users, Landmark, Layers, Shield, Search, Info, ChevronLeft, Clock, History, MessageSquare } from 'lucide-react';
+import { Party, MP, BlocMembership, TermActivity, GroupActivity } from '../types';
+import { getParties, getMPs, getBlocMemberships, getBlocActivity } from '../services/api';
 
 interface Bloc {
     id: string;
@@ -26,6 +26,7 @@ const PartiesView: React.FC<PartiesViewProps> = ({ onPartySelect, onMpSelect })
     const [blocs, setBlocs] = useState<Bloc[]>([]);
     const [mps, setMps] = useState<MP[]>([]);
     const [blocMemberships, setBlocMemberships] = useState<BlocMembership[]>([]);
+    const [activity, setActivity] = useState<TermActivity | undefined>();
     const [loading, setLoading] = useState(true);
 
     const [allBlocsData, setAllBlocsData] = useState<any[]>([]);
@@ -86,6 +87,24 @@ const PartiesView: React.FC<PartiesViewProps> = ({ onPartySelect, onMpSelect })
         }
     }, [selectedTerm, viewMode]);
 
+    useEffect(() => {
+        getBlocActivity(selectedTerm).then(setActivity);
+    }, [selectedTerm]);
+
+    const termLabel = selectedTerm === 1 ? 'الدورة الأولى' : 'الدورة الثانية';
+    const blocActivity = (name: string) => activity?.blocs.find(b => b.bloc === name);
+    const partyActivity = (name: string) => activity?.parties.find(p => p.party === name);
+
+    const renderActivity = (stats?: GroupActivity) => stats && stats.interventions > 0 && (
+        <div className="flex items-center gap-3 p-4 bg-parliament-wall/20 rounded-2xl border border-parliament-wood/10 mb-4">
+            <MessageSquare className="text-parliament-wood" size={24} />
+            <div>
+                <div className="text-[10px] font-black text-parliament-textMuted uppercase">النشاط تحت القبة ({termLabel})</div>
+                <div className="text-sm font-black text-parliament-text">{stats.interventions} مداخلة · {stats.activeMps} نائباً · {stats.sessions} جلسة</div>
+            </div>
+        </div>
+    );
+
     const getBlocMembers = (blocName: string) => {
         // If viewing current data or specific term
         return blocMemberships.filter(m => m.blocName === blocName);
@@ -194,6 +213,8 @@ const PartiesView: React.FC<PartiesViewProps> = ({ onPartySelect, onMpSelect })
                                             <div className="text-xl font-black text-parliament-text">{members.length} نائباً</div>
                                         </div>
                                     </div>
+
+                                    {renderActivity(blocActivity(bloc.name))}
                                 </div>
 
                                 <div className="mt-auto border-t border-parliament-wall">
@@ -285,6 +306,8 @@ const PartiesView: React.FC<PartiesViewProps> = ({ onPartySelect, onMpSelect })
                                         </div>
                                     </div>
 
+                                    {renderActivity(partyActivity(party.name))}
+
                                     {/* ملاحظة إن وجدت */}
                                     {party.note && (
                                         <div className="text-[10px] text-amber-700 bg-amber-50 p-2 rounded-lg border border-amber-200 font-bold">
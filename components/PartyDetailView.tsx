@@ -3,6 +3,7 @@ import React, { useState } from 'react';
 import { ArrowRight, Users, MapPin, Search, Shield, ChevronLeft, Info, Flag, Home } from 'lucide-react';
 import { Party, MP } from '../types';
 import DataMeta from './DataMeta';
+import { mpPhoto } from '../services/api';
 
 interface PartyDetailViewProps {
     party: Party;
@@ -113,7 +114,7 @@ const PartyDetailView: React.FC<PartyDetailViewProps> = ({ party, partyMps = [],
                         >
                             <div className="w-20 h-20 rounded-full bg-white p-1 shadow-sm mb-3 border border-parliament-wood/10 group-hover:border-parliament-greenMain transition-colors overflow-hidden">
                                 {mp.photoUrl ? (
-                                    <img src={mp.photoUrl} alt={mp.fullName} className="w-full h-full object-cover rounded-full group-hover:scale-110 transition-transform duration-700" />
+                                    <img src={mpPhoto(mp, 'avatar')} loading="lazy" alt={mp.fullName} className="w-full h-full object-cover rounded-full group-hover:scale-110 transition-transform duration-700" />
                                 ) : (
                                     <div className="w-full h-full flex items-center justify-center text-parliament-wood/20"><Users size={24} /></div>
                                 )}
@@ -0,0 +1,37 @@
+import React, { useEffect, useRef, useState } from 'react';
+import ImageWithFallback from './ImageWithFallback';
+
+interface SpritePhotoProps {
+  sprite?: React.CSSProperties;
+  src?: string;
+  alt: string;
+  className?: string;
+}
+
+// Cell of a shared sprite sheet when one is available, the MP's own photo otherwise.
+// The sheet is only requested once the cell comes near the viewport, so a long
+// list does not download every governorate's sheet up front.
+const SpritePhoto: React.FC<SpritePhotoProps> = ({ sprite, src, alt, className }) => {
+  const ref = useRef<HTMLDivElement>(null);
+  const [visible, setVisible] = useState(typeof IntersectionObserver === 'undefined');
+
+  useEffect(() => {
+    if (!sprite || visible || !ref.current) return;
+    const observer = new IntersectionObserver(entries => {
+      if (entries.some(entry => entry.isIntersecting)) {
+        setVisible(true);
+        observer.disconnect();
+      }
+    }, { rootMargin: '200px' });
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [sprite, visible]);
+
+  if (sprite) {
+    const { backgroundImage, ...cell } = sprite;
+    return <div ref={ref} role="img" aria-label={alt} className={className} style={visible ? sprite : cell} />;
+  }
+  return <ImageWithFallback src={src} loading="lazy" alt={alt} className={className} />;
+};
+
+export default SpritePhoto;
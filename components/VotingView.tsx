@@ -1,11 +1,33 @@
 
 import React, { useState, useEffect } from 'react';
 import { PieChart, Pie, Cell, ResponsiveContainer, BarChart, Bar, XAxis, YAxis, Tooltip, Legend } from 'recharts';
-import { Party, MP, Law, Subscription } from '../types';
-import { getMPs, getLaws, getParties, getSubscriptions, addSubscription, removeSubscription } from '../services/api';
+import { Party, MP, Law, Subscription, VoteRow, VoteType } from '../types';
+import { getMPs, getLaws, getParties, getVotes, getSubscriptions, addSubscription, removeSubscription, mpPhoto } from '../services/api';
 import { Search, Filter, ChevronRight, AlertCircle, RefreshCw, Bell, BellRing } from 'lucide-react';
 import ImageWithFallback from './ImageWithFallback';
 
+const VOTE_TYPE_LABELS: Record<VoteType, string> = {
+  election: 'انتخاب',
+  law: 'قانون',
+  proposal: 'مقترح',
+  referral: 'إحالة',
+  motion: 'قرار',
+};
+
+const OUTCOME_LABELS: Record<VoteRow['outcome'], string> = {
+  elected: 'فاز',
+  referred: 'أحيل',
+  approved: 'أُقر',
+  rejected: 'رُفض',
+};
+
+const METHOD_LABELS: Record<string, string> = {
+  acclamation: 'بالتزكية',
+  unanimous: 'بالإجماع',
+  majority: 'بالأغلبية',
+  count: 'بعدّ الأصوات',
+};
+
 interface VotingViewProps {
     onMpSelect?: (id: string) => void;
 }
@@ -14,6 +36,8 @@ const VotingView: React.FC<VotingViewProps> = ({ onMpSelect }) => {
   const [mps, setMps] = useState<MP[]>([]);
   const [laws, setLaws] = useState<Law[]>([]);
   const [parties, setParties] = useState<Party[]>([]);
+  const [votes, setVotes] = useState<VoteRow[]>([]);
+  const [voteType, setVoteType] = useState<VoteType | 'all'>('all');
   const [subs, setSubs] = useState<Subscription[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -23,10 +47,11 @@ const VotingView: React.FC<VotingViewProps> = ({ onMpSelect }) => {
     setLoading(true);
     setError(null);
     try {
-        const [mpsData, lawsData, partiesData] = await Promise.all([getMPs(), getLaws(), getParties()]);
+        const [mpsData, lawsData, partiesData, votesData] = await Promise.all([getMPs(), getLaws(), getParties(), getVotes()]);
         setMps(mpsData);
         setLaws(lawsData);
         setParties(partiesData);
+        setVotes(votesData);
         setSubs(getSubscriptions());
     } catch (e) {
         setError('تعذر تحميل بيانات التصويت.');
@@ -50,12 +75,29 @@ const VotingView: React.FC<VotingViewProps> = ({ onMpSelect }) => {
 
   const isSubscribed = (name: string) => subs.some(s => s.type === 'speaker' && s.value === name);
 
-  const recentLaw = laws.find(l => l.status === 'passed' && l.voteBreakdown) || laws[0];
+  // Each decision once: events rows that restate a decisions row are dropped
+  const decisions = votes.filter(v => !v.duplicateOf).sort((a, b) => b.date.localeCompare(a.date));
+  const typeCounts = decisions.reduce<Record<string, number>>((acc, v) => {
+    acc[v.type] = (acc[v.type] || 0) + 1;
+    return acc;
+  }, {});
+  const shownDecisions = decisions.filter(v => voteType === 'all' || v.type === voteType);
+  const mpName = (id: string | null | undefined) => mps.find(m => m.id === id)?.fullName;
+  const lawTitle = (id: string | null | undefined) => laws.find(l => l.id === id)?.title;
+
+  // Without a recorded breakdown, fall back to the latest counted vote on a law
+  const countedVote = decisions.find(v => v.lawId && v.votesFor && v.votesTotal);
+  const recentLaw = laws.find(l => l.status === 'passed' && l.voteBreakdown)
+    || laws.find(l => l.id === countedVote?.lawId)
+    || laws[0];
   const votingData = recentLaw?.voteBreakdown ? [
     { name: 'مع', value: recentLaw.voteBreakdown.with, color: '#436058' },
     { name: 'ضد', value: recentLaw.voteBreakdown.against, color: '#8B0000' },
     { name: 'امتناع', value: recentLaw.voteBreakdown.abstain, color: '#C6986F' },
     { name: 'غياب', value: recentLaw.voteBreakdown.absent, color: '#A9A9A9' },
+  ] : countedVote && countedVote.lawId === recentLaw?.id ? [
+    { name: 'مع', value: countedVote.votesFor!, color: '#436058' },
+    { name: 'لم يؤيد', value: countedVote.votesTotal! - countedVote.votesFor!, color: '#8B0000' },
   ] : [];
 
   const filteredMps = mps.filter(mp => mp.fullName.includes(mpSearch) || mp.district?.includes(mpSearch));
@@ -111,6 +153,63 @@ const VotingView: React.FC<VotingViewProps> = ({ onMpSelect }) => {
         </div>
       </div>
 
+      {decisions.length > 0 && (
+      <div className="parliament-card overflow-hidden">
+        <div className="p-6 border-b border-parliament-wood/30 flex flex-col md:flex-row justify-between items-center gap-4 bg-parliament-wall/30">
+            <h3 className="font-bold text-lg text-parliament-greenMain">القرارات والتصويتات ({decisions.length})</h3>
+            <div className="flex flex-wrap gap-2">
+                {(['all', ...Object.keys(VOTE_TYPE_LABELS)] as (VoteType | 'all')[]).map(type => (
+                    <button
+                        key={type}
+                        onClick={() => setVoteType(type)}
+                        className={`px-3 py-1.5 rounded-md text-xs font-bold border transition-colors ${voteType === type ? 'bg-parliament-greenMain text-white border-parliament-greenMain' : 'bg-white text-parliament-greenMain border-parliament-wood/30 hover:bg-parliament-wall'}`}
+                    >
+                        {type === 'all' ? 'الكل' : VOTE_TYPE_LABELS[type]} ({type === 'all' ? decisions.length : typeCounts[type] || 0})
+                    </button>
+                ))}
+            </div>
+        </div>
+
+        <div className="overflow-x-auto">
+            <table className="w-full text-right">
+                <thead className="bg-parliament-greenMain text-parliament-wall text-xs font-bold uppercase tracking-wider">
+                    <tr>
+                        <th className="px-6 py-4">التاريخ</th>
+                        <th className="px-6 py-4">النوع</th>
+                        <th className="px-6 py-4">الموضوع</th>
+                        <th className="px-6 py-4">النتيجة</th>
+                    </tr>
+                </thead>
+                <tbody className="divide-y divide-parliament-wood/20">
+                    {shownDecisions.slice(0, 15).map(v => (
+                        <tr key={v.id} className="hover:bg-parliament-wallWarm/30 transition-colors">
+                            <td className="px-6 py-4 text-sm text-parliament-textMuted whitespace-nowrap">{v.date}</td>
+                            <td className="px-6 py-4 text-sm font-bold text-parliament-greenMain whitespace-nowrap">{VOTE_TYPE_LABELS[v.type]}</td>
+                            <td className="px-6 py-4 text-sm text-parliament-text">
+                                {v.type === 'election' && v.candidates && v.candidates.length > 0 ? (
+                                    <span>
+                                        {v.candidates.map(c => `${mpName(c.mpId) || '—'} (${c.votes})`).join(' · ')}
+                                    </span>
+                                ) : (
+                                    <span>{lawTitle(v.lawId) || (v.type === 'election' && mpName(v.winnerId)) || v.text}</span>
+                                )}
+                                {v.committee && <span className="block text-xs text-parliament-textMuted mt-1">← {v.committee}</span>}
+                            </td>
+                            <td className="px-6 py-4 text-sm whitespace-nowrap">
+                                <span className={`font-bold ${v.outcome === 'rejected' ? 'text-red-800' : 'text-parliament-greenMain'}`}>{OUTCOME_LABELS[v.outcome]}</span>
+                                {v.method && <span className="text-parliament-textMuted"> {METHOD_LABELS[v.method]}</span>}
+                                {v.votesFor !== undefined && (
+                                    <span className="block text-xs text-parliament-textMuted">{v.votesFor}{v.votesTotal ? ` من ${v.votesTotal}` : ''} صوتاً</span>
+                                )}
+                            </td>
+                        </tr>
+                    ))}
+                </tbody>
+            </table>
+        </div>
+      </div>
+      )}
+
       <div className="parliament-card overflow-hidden">
         <div className="p-6 border-b border-parliament-wood/30 flex flex-col md:flex-row justify-between items-center gap-4 bg-parliament-wall/30">
             <h3 className="font-bold text-lg text-parliament-greenMain">قائمة النواب ({mps.length})</h3>
@@ -149,7 +248,7 @@ const VotingView: React.FC<VotingViewProps> = ({ onMpSelect }) => {
                               <td className="px-6 py-4">
                                   <div className="flex items-center gap-3">
                                       <div className="relative">
-                                        <ImageWithFallback src={mp.photoUrl} alt={mp.fullName} className="w-10 h-10 rounded-full object-cover border border-parliament-wood/50" />
+                                        <ImageWithFallback src={mpPhoto(mp, 'avatar')} alt={mp.fullName} className="w-10 h-10 rounded-full object-cover border border-parliament-wood/50" />
                                         <button 
                                           onClick={(e) => handleToggleSub(e, mp.fullName)}
                                           className={`absolute -top-1 -left-1 p-1 rounded-full shadow-sm border transition-all ${subscribed ? 'bg-parliament-wood text-white border-parliament-wood' : 'bg-white text-parliament-wood border-parliament-wood/20 hover:scale-110'}`}
@@ -1,48 +1,343 @@
-import json
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Session segment audit (round trip)
+Exports segments for manual review and applies the reviewed file back in
+one command:
+
+    python export_session_audit.py export [SESSION_ID ...] [--out FILE]
+    python export_session_audit.py import FILE [--dry-run]
+
+Export streams one row per segment (CSV, or Parquet when FILE ends in
+.parquet and pyarrow is installed) keyed by Session_Id + Segment_Id. Segments
+without an id get a stable one written back to sessions.json first, so a
+file stays valid however segments are reordered later.
+
+Import reads every edited row and validates it before anything is written:
+- CORRECT_SPEAKER_NAME must be an exact (unambiguous) MP name variation
+  (mp_resolver confidence 1.0), stored as the MP's fullName, or a role
+  label (chair, secretary-general, minister, rapporteur); fuzzy matches
+  are rejected, since a misspelt name may belong to another MP, and so
+  is a title such as "النائب" in front of a name that does not resolve
+- CORRECT_START_TIME (HH:MM:SS, MM:SS or seconds) must lie inside the video
+  and between the original times of the neighbouring segments; two
+  corrected neighbours that end up out of order are both reported
+Valid corrections are applied as one batched upsert: sessions.json is
+loaded once, updated in memory and replaced atomically, and the time
+indexes (segment_index.py) of the touched sessions are re-exported next
+to it (<sessions dir>/segment_index/).
+"""
+
 import csv
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from arabic_text import normalize
+from mp_resolver import MPResolver
+from segment_index import export_indexes
+from speaking_rate import duration_seconds, speaker_key
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+MPS_FILE = 'public/data/mps.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+DEFAULT_OUT = 'session_audit.csv'
+
+COLUMNS = [
+    'Session_Id',
+    'Segment_Id',
+    'Segment_Order',
+    'Current_Speaker_Name',
+    'Text_Excerpt (First 50 chars)',
+    'Current_Timestamp_Estimate (Seconds)',
+    'CORRECT_SPEAKER_NAME (Please Edit)',
+    'CORRECT_START_TIME (HH:MM:SS) (Please Edit)',
+]
+SPEAKER_COLUMN = COLUMNS[6]
+TIME_COLUMN = COLUMNS[7]
+PARQUET_BATCH = 1000
+CHAIR_ROLE = 'رئيس المجلس'
+# Office words of a non-MP speaker; MP titles (النائب, سعادة...) are not roles
+ROLE_LABEL = re.compile(r'رئيس|رئاسه|الامين|وزير|مقرر')
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    """Write through a temporary file so a failed run never leaves half a file"""
+    tmp = filepath + '.part'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, filepath)
+
+def format_time(seconds):
+    seconds = int(seconds or 0)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+def parse_time(value):
+    """'1:02:03', '62:03' or '3723' -> seconds; None for blank; ValueError otherwise"""
+    value = str(value or '').strip()
+    if not value:
+        return None
+    parts = value.split(':')
+    if len(parts) > 3 or not all(p.strip().isdigit() for p in parts):
+        raise ValueError(f"bad time '{value}'")
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+def ensure_segment_ids(sessions):
+    """Give every segment a stable id; returns how many were assigned"""
+    assigned = 0
+    for session in sessions:
+        taken = {seg.get('id') for seg in session.get('segments') or []}
+        for index, segment in enumerate(session.get('segments') or []):
+            if segment.get('id'):
+                continue
+            candidate = f"{session['id']}-seg{index + 1:04d}"
+            while candidate in taken:
+                candidate += 'x'
+            segment['id'] = candidate
+            taken.add(candidate)
+            assigned += 1
+    return assigned
+
+def audit_rows(sessions, session_ids=None):
+    """One dict per segment of the selected sessions, in session order"""
+    wanted = set(session_ids or [])
+    for session in sessions:
+        if wanted and session['id'] not in wanted:
+            continue
+        for order, segment in enumerate(session.get('segments') or [], 1):
+            text = segment.get('textExcerpt') or segment.get('text') or ''
+            yield dict(zip(COLUMNS, [
+                session['id'],
+                segment['id'],
+                order,
+                segment.get('speakerName', ''),
+                text[:50] + "...",
+                segment.get('videoTimestamp', 0),
+                segment.get('speakerName', ''),
+                '',
+            ]))
+
+def write_csv(rows, path):
+    count = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+def write_parquet(rows, path):
+    schema = pa.schema([(name, pa.int64() if name in (COLUMNS[2], COLUMNS[5]) else pa.string())
+                        for name in COLUMNS])
+    count, batch = 0, []
+    with pq.ParquetWriter(path, schema) as writer:
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= PARQUET_BATCH:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+def read_rows(path):
+    if path.endswith('.parquet'):
+        if not HAS_PYARROW:
+            raise RuntimeError("pyarrow is required to read Parquet audit files")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=PARQUET_BATCH):
+            yield from batch.to_pylist()
+        return
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        yield from csv.DictReader(f)
+
+def export_audit(session_ids=None, out=DEFAULT_OUT, sessions_file=SESSIONS_FILE):
+    sessions = load_json(sessions_file)
+    if ensure_segment_ids(sessions):
+        save_json(sessions_file, sessions)
+    rows = audit_rows(sessions, session_ids)
+    if out.endswith('.parquet'):
+        if not HAS_PYARROW:
+            raise RuntimeError("pyarrow is required to write Parquet audit files")
+        return write_parquet(rows, out)
+    return write_csv(rows, out)
+
+def collect_changes(rows, sessions, resolver):
+    """
+    Validate the edited rows against the current sessions.
+    Returns ({session id: {segment id: change}}, [error strings]) where a
+    change may hold 'speakerName', 'speakerId', 'speakerRole', 'videoTimestamp'.
+    """
+    segments = {
+        (session['id'], segment.get('id')): (session, segment)
+        for session in sessions for segment in session.get('segments') or []
+    }
+    changes, errors = {}, []
+    for line, row in enumerate(rows, 2):
+        session, segment = segments.get((row.get('Session_Id'), row.get('Segment_Id')), (None, None))
+        if segment is None:
+            errors.append(f"row {line}: unknown segment {row.get('Session_Id')}/{row.get('Segment_Id')}")
+            continue
+
+        change = {}
+        name = (row.get(SPEAKER_COLUMN) or '').strip()
+        if name and name != segment.get('speakerName', ''):
+            key = speaker_key(name, resolver)
+            if key in resolver.by_id:
+                if resolver.confidence(name)[1] < 1.0:
+                    errors.append(f"row {line}: '{name}' is not an exact MP name "
+                                  f"(closest: {key} {resolver.by_id[key]['fullName']})")
+                    continue
+                change['speakerName'] = resolver.by_id[key]['fullName']
+                change['speakerId'] = key
+            elif key == 'chair' or (key and ROLE_LABEL.search(normalize(name, punctuation=True))):
+                change['speakerName'] = name
+                change['speakerId'] = None
+                if key == 'chair':
+                    change['speakerRole'] = CHAIR_ROLE
+            else:
+                errors.append(f"row {line}: '{name}' is not an exact MP name or a known role")
+                continue
+
+        try:
+            start = parse_time(row.get(TIME_COLUMN))
+        except ValueError as e:
+            errors.append(f"row {line}: {e}")
+            continue
+        if start is not None and start != segment.get('videoTimestamp'):
+            limit = duration_seconds(session)
+            if limit and start > limit:
+                errors.append(f"row {line}: {format_time(start)} is after the end of the video ({format_time(limit)})")
+                continue
+            change['videoTimestamp'] = start
+
+        if change:
+            changes.setdefault(session['id'], {})[segment['id']] = change
+    return changes, errors
+
+def _out_of_order(starts, index):
+    """Does starts[index] fall before the previous timed segment or after the next?"""
+    before = [t for t in starts[:index] if isinstance(t, (int, float))]
+    after = [t for t in starts[index + 1:] if isinstance(t, (int, float))]
+    return bool((before and starts[index] < before[-1]) or (after and starts[index] > after[0]))
+
+def check_order(session, changes):
+    """
+    Validate corrected starts against the segment order.
+    Returns (ids out of order with the original neighbouring times,
+    [(id, id)] pairs of corrected neighbours that are fine alone but
+    out of order with each other).
+    """
+    segments = session.get('segments') or []
+    original = [seg.get('videoTimestamp') for seg in segments]
+    corrected = [i for i, seg in enumerate(segments)
+                 if 'videoTimestamp' in changes.get(seg.get('id'), {})]
+
+    bad, kept = [], []
+    for index in corrected:
+        starts = list(original)
+        starts[index] = changes[segments[index]['id']]['videoTimestamp']
+        (bad if _out_of_order(starts, index) else kept).append(index)
+
+    starts = list(original)
+    for index in kept:
+        starts[index] = changes[segments[index]['id']]['videoTimestamp']
+    timed = [i for i, t in enumerate(starts) if isinstance(t, (int, float))]
+    kept_set = set(kept)
+    conflicts = [
+        (segments[a]['id'], segments[b]['id']) for a, b in zip(timed, timed[1:])
+        if starts[a] > starts[b] and a in kept_set and b in kept_set
+    ]
+    return [segments[i]['id'] for i in bad], conflicts
+
+def apply_changes(sessions, changes):
+    """Upsert the validated changes in memory; returns the number of segments touched"""
+    touched = 0
+    for session in sessions:
+        session_changes = changes.get(session['id'])
+        if not session_changes:
+            continue
+        segments = session.get('segments') or []
+        for index, segment in enumerate(segments):
+            change = session_changes.get(segment.get('id'))
+            if not change:
+                continue
+            segment.update(change)
+            if 'videoTimestamp' in change and index and 'videoEndTimestamp' in segments[index - 1]:
+                segments[index - 1]['videoEndTimestamp'] = change['videoTimestamp']
+            touched += 1
+    return touched
+
+def import_audit(path, dry_run=False, sessions_file=SESSIONS_FILE, mps_file=MPS_FILE):
+    """Validate and apply an edited audit file; returns (applied, errors)"""
+    sessions = load_json(sessions_file)
+    resolver = MPResolver(load_json(mps_file))
+    changes, errors = collect_changes(read_rows(path), sessions, resolver)
+
+    by_id = {s['id']: s for s in sessions}
+    for session_id in list(changes):
+        session_changes = changes[session_id]
+        bad, conflicts = check_order(by_id[session_id], session_changes)
+        rejected = {segment_id: "is out of order with the neighbouring segments" for segment_id in bad}
+        for a, b in conflicts:
+            rejected[a] = f"conflicts with the correction of {b}"
+            rejected[b] = f"conflicts with the correction of {a}"
+        for segment_id, reason in rejected.items():
+            change = session_changes[segment_id]
+            errors.append(f"{session_id}/{segment_id}: {format_time(change.pop('videoTimestamp'))} {reason}")
+            if not change:
+                del session_changes[segment_id]
+        if not session_changes:
+            del changes[session_id]
+
+    applied = apply_changes(sessions, changes)
+    if applied and not dry_run:
+        index_dir = Path(sessions_file).parent / 'segment_index'
+        export_indexes([s for s in sessions if s['id'] in changes], index_dir)
+        save_json(sessions_file, sessions)
+    return applied, errors
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] not in ('export', 'import'):
+        print(__doc__)
+        return
+
+    if args[0] == 'export':
+        out = DEFAULT_OUT
+        if '--out' in args:
+            i = args.index('--out')
+            out = args[i + 1]
+            del args[i:i + 2]
+        count = export_audit(args[1:], out)
+        print(f"Successfully exported {count} segments to {out}")
+        return
+
+    if len(args) < 2:
+        print("Usage: python export_session_audit.py import FILE [--dry-run]")
+        return
+    dry_run = '--dry-run' in args
+    applied, errors = import_audit(args[1], dry_run)
+    for error in errors:
+        print(f"  [SKIP] {error}")
+    verb = "Would apply" if dry_run else "Applied"
+    print(f"{verb} corrections to {applied} segments ({len(errors)} rows rejected)")
 
-def export_segments_to_csv():
-    json_path = 'c:/Users/Ultimate/Downloads/jordan-parliament-monitor-(al-majlis) (10)/public/data/sessions.json'
-    csv_path = 'c:/Users/Ultimate/Downloads/jordan-parliament-monitor-(al-majlis) (10)/session_6_data_audit.csv'
-
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            sessions = json.load(f)
-
-        session_6 = next((s for s in sessions if s['id'] == 'sess_2024_06_legislative'), None)
-        if not session_6:
-            print("Session 6 not found.")
-            return
-
-        segments = session_6.get('segments', [])
-
-        with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.writer(f)
-            # Header
-            writer.writerow([
-                'Segment_Order',
-                'Current_Speaker_Name',
-                'Text_Excerpt (First 50 chars)',
-                'Current_Timestamp_Estimate (Seconds)',
-                'CORRECT_SPEAKER_NAME (Please Edit)',
-                'CORRECT_START_TIME (HH:MM:SS) (Please Edit)'
-            ])
-
-            for i, seg in enumerate(segments):
-                text_preview = seg.get('textExcerpt', '')[:50] + "..."
-                writer.writerow([
-                    i + 1,
-                    seg.get('speakerName', ''),
-                    text_preview,
-                    seg.get('videoTimestamp', 0),
-                    seg.get('speakerName', ''), # Default to current
-                    '' # Empty for user to fill
-                ])
-        
-        print(f"Successfully exported {len(segments)} segments to {csv_path}")
-
-    except Exception as e:
-        print(f"Error: {e}")
-
-if __name__ == "__main__":
-    export_segments_to_csv()
+if __name__ == '__main__':
+    main()
@@ -2,16 +2,21 @@
 # -*- coding: utf-8 -*-
 """
 Fix MP photo order - map photos correctly to MPs
+Photos are assigned by the names next to them in the exported document
+(one global assignment), so a missing image no longer shifts the rest
 """
 
 import os
 import sys
 import json
 from pathlib import Path
-from PIL import Image
 import shutil
 import re
 
+from image_pipeline import convert_to_jpg
+from photo_store import publish
+from photo_assignment import assign_from_html, print_report
+
 # تفعيل دعم UTF-8 في Windows
 if sys.platform == 'win32':
     import codecs
@@ -21,7 +26,6 @@ if sys.platform == 'win32':
 # المسارات
 TEMP_PHOTOS_DIR = Path("temp_mp_photos")
 TARGET_DIR = Path("public/images/mps")
-DIST_DIR = Path("dist/images/mps")
 MPS_JSON = Path("public/data/mps.json")
 
 def extract_number(filename):
@@ -58,21 +62,6 @@ def find_all_images():
     
     return [img for img, _ in images_with_numbers]
 
-def convert_to_jpg(image_path, output_path, quality=85):
-    """تحويل الصورة إلى JPG"""
-    with Image.open(image_path) as img:
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        img.save(output_path, 'JPEG', quality=quality, optimize=True)
-        return output_path
-
 def main():
     print("=" * 60)
     print("         إصلاح ترتيب صور النواب")
@@ -100,37 +89,47 @@ def main():
     
     if len(images) != len(mps_data):
         print(f"[!] تحذير: عدد الصور ({len(images)}) لا يطابق عدد النواب ({len(mps_data)})")
+    
+    # 3. ربط الصور بالنواب حسب الأسماء في ملف HTML المصدَّر
+    html_files = sorted(images[0].parent.parent.glob('*.html'))
+    if not html_files:
+        print("[!] لم يتم العثور على ملف HTML بجانب الصور!")
         return
+    assignments, unassigned = assign_from_html(html_files[0], mps_data)
+    print_report(assignments, unassigned)
+    images_by_name = {img.name: img for img in images}
+    mps_by_id = {mp['id']: mp for mp in mps_data}
     
-    # 3. معالجة ونقل الصور بالترتيب الصحيح
-    print("\n[*] معالجة ونقل الصور بالترتيب الصحيح...")
+    # 4. معالجة ونقل الصور
+    print("\n[*] معالجة ونقل الصور...")
     processed = 0
     errors = []
     
-    for idx, img_path in enumerate(images, 1):
+    for idx, assignment in enumerate(assignments, 1):
+        img_path = images_by_name.get(assignment['image'])
+        if not img_path:
+            errors.append(f"لم يتم العثور على صورة: {assignment['image']}")
+            continue
         try:
             # اسم الملف الجديد
-            target_name = f"mp_{idx:03d}.jpg"
+            target_name = f"{assignment['mpId']}.jpg"
             target_path = TARGET_DIR / target_name
-            dist_path = DIST_DIR / target_name
             
             # المعالجة
             if img_path.suffix.lower() in ['.png']:
                 # تحويل PNG إلى JPG
                 convert_to_jpg(img_path, target_path)
-                if DIST_DIR.exists():
-                    shutil.copy2(target_path, dist_path)
-                print(f"   [+] [{idx}/{len(images)}] {img.name} -> {target_name} (PNG->JPG)")
+                print(f"   [+] [{idx}/{len(assignments)}] {img_path.name} -> {target_name} (PNG->JPG)")
             else:
                 # نسخ JPG مباشرة
                 shutil.copy2(img_path, target_path)
-                if DIST_DIR.exists():
-                    shutil.copy2(img_path, dist_path)
-                print(f"   [+] [{idx}/{len(images)}] {img_path.name} -> {target_name}")
+                print(f"   [+] [{idx}/{len(assignments)}] {img_path.name} -> {target_name}")
             
             # عرض اسم النائب المقابل
-            mp_name = mps_data[idx-1]['fullName']
+            mp_name = mps_by_id[assignment['mpId']]['fullName']
             print(f"       -> {mp_name}")
+            if not assignment['confident']:
+                print(f"       [!] تطابق ضعيف (score {assignment['score']})")
             
             processed += 1
             
@@ -144,6 +143,10 @@ def main():
     print("                        النتائج")
     print("=" * 60)
     print(f"[+] تم معالجة: {processed} صورة")
+
+    # الصور منسوخة إلى مجلد التجهيز فقط؛ photoUrl يشير إلى نسخة مخزن الصور
+    changed = publish(mps_data, MPS_JSON)
+    print(f"[+] تم تحديث photoUrl لـ {changed} نائب (public/images/store)")
     
     if errors:
         print(f"\n[X] أخطاء ({len(errors)}):")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single-pass (text block, next image) extractor for Google Doc HTML exports
+Replaces the BeautifulSoup walk that called find_next('img') for every
+block (quadratic in document size) with one streaming HTMLParser pass:
+each p/div/span/h1-h3 block is paired with the first <img> that follows
+its opening tag, in document order.
+
+Results are cached under .cache/html_blocks keyed by the file's hash, so
+scripts that read the same export share one parse.
+
+    python html_blocks.py "temp_mp_photos/MPs pics.ht_" windows-1256
+"""
+
+import hashlib
+import json
+import os
+import sys
+from html.parser import HTMLParser
+
+CACHE_DIR = '.cache/html_blocks'
+CACHE_VERSION = 1
+
+BLOCK_TAGS = frozenset({'p', 'div', 'span', 'h1', 'h2', 'h3'})
+VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+})
+CHUNK_SIZE = 1 << 16
+
+class BlockImageParser(HTMLParser):
+    """
+    Collects one record per block element:
+        {'tag', 'text', 'image': {'id', 'src'} | None}
+    Records become ready (see pop_ready) once the block is closed and its
+    following image has been seen, so they can be consumed while parsing.
+    """
+
+    def __init__(self, block_tags=BLOCK_TAGS):
+        super().__init__(convert_charrefs=True)
+        self.block_tags = block_tags
+        self.records = []       # in opening-tag order
+        self.stack = []         # open elements: (tag, record index or None)
+        self.open_blocks = []   # indexes of open blocks collecting text
+        self.awaiting = []      # indexes still waiting for their next <img>
+        self.ready_from = 0
+        self.texts = {}
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'img':
+            attrs = dict(attrs)
+            image = {'id': attrs.get('id', ''), 'src': attrs.get('src', '')}
+            for index in self.awaiting:
+                self.records[index]['image'] = image
+            self.awaiting = []
+            return
+        if tag in VOID_TAGS:
+            return
+
+        index = None
+        if tag in self.block_tags:
+            index = len(self.records)
+            self.records.append({'tag': tag, 'text': None, 'image': None})
+            self.texts[index] = []
+            self.open_blocks.append(index)
+            self.awaiting.append(index)
+        self.stack.append((tag, index))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # Pop up to the matching open tag; a stray end tag is ignored
+        if not any(open_tag == tag for open_tag, _ in self.stack):
+            return
+        while self.stack:
+            open_tag, index = self.stack.pop()
+            if index is not None:
+                self._close(index)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        for index in self.open_blocks:
+            self.texts[index].append(data)
+
+    def _close(self, index):
+        self.open_blocks.remove(index)
+        self.records[index]['text'] = ' '.join(''.join(self.texts.pop(index)).split())
+
+    def close(self):
+        super().close()
+        while self.stack:
+            _, index = self.stack.pop()
+            if index is not None:
+                self._close(index)
+        self.awaiting = []
+
+    def pop_ready(self, final=False):
+        """Records (in document order) whose text and image are both settled"""
+        ready = []
+        while self.ready_from < len(self.records):
+            index = self.ready_from
+            record = self.records[index]
+            if not final and (record['text'] is None or index in self.awaiting):
+                break
+            ready.append(record)
+            self.records[index] = None
+            self.ready_from += 1
+        return ready
+
+def iter_blocks(path, encoding='utf-8', block_tags=BLOCK_TAGS):
+    """Stream block records from an HTML file in one pass"""
+    parser = BlockImageParser(block_tags)
+    with open(path, 'r', encoding=encoding, errors='replace') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), ''):
+            parser.feed(chunk)
+            yield from parser.pop_ready()
+    parser.close()
+    yield from parser.pop_ready(final=True)
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def extract_blocks(path, encoding='utf-8', cache_dir=CACHE_DIR):
+    """All block records of an export, parsed once per file content"""
+    key = hashlib.sha1(f"{file_hash(path)}:{encoding}:{CACHE_VERSION}".encode()).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{key}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    blocks = list(iter_blocks(path, encoding))
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = cache_path + '.part'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(blocks, f, ensure_ascii=False)
+    os.replace(tmp, cache_path)
+    return blocks
+
+def text_image_pairs(path, encoding='utf-8', tags=BLOCK_TAGS, predicate=None):
+    """[(text, image)] for blocks of the given tags that have a following image"""
+    return [
+        (block['text'], block['image'])
+        for block in extract_blocks(path, encoding)
+        if block['tag'] in tags and block['image'] and (predicate is None or predicate(block['text']))
+    ]
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python html_blocks.py FILE [ENCODING]")
+        return
+    path = sys.argv[1]
+    encoding = sys.argv[2] if len(sys.argv) > 2 else 'utf-8'
+
+    blocks = extract_blocks(path, encoding)
+    with_images = [b for b in blocks if b['image']]
+    print(f"{len(blocks)} blocks, {len(with_images)} followed by an image")
+    for block in with_images[:10]:
+        print(f"  <{block['tag']}> {block['text'][:40]} -> {block['image']['id'] or block['image']['src']}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MP photo pipeline
+Builds resized variants of every portrait in the photo store
+(public/images/store, see photo_store.py) on a process pool and records
+them in public/data/photo_manifest.json.
+
+Each source yields avatar / card / detail sizes in WebP and JPEG. The
+manifest maps MP id -> variants with dimensions and content hashes; a
+source whose hash matches the manifest (and whose outputs exist) is
+skipped, so re-runs only touch new or changed photos.
+
+    python image_pipeline.py             # incremental
+    python image_pipeline.py --force     # rebuild everything
+    python image_pipeline.py --source DIR    # mp_XXX.* files instead of the store
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+STORE_INDEX = 'public/data/photo_store.json'
+VARIANTS_DIR = Path('public/images/mps/variants')
+MANIFEST_FILE = 'public/data/photo_manifest.json'
+PUBLIC_ROOT = Path('public')
+
+# name -> bounding box (portraits keep their aspect ratio inside it)
+VARIANTS = {
+    'avatar': (96, 96),
+    'card': (320, 352),
+    'detail': (640, 704),
+}
+FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 6}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def to_rgb(img):
+    """Flatten transparency onto white and return an RGB image"""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+def convert_to_jpg(image_path, output_path, quality=85):
+    """تحويل الصورة إلى JPG"""
+    with Image.open(image_path) as img:
+        to_rgb(img).save(output_path, 'JPEG', quality=quality, optimize=True)
+    return output_path
+
+def public_url(path):
+    return '/' + Path(path).relative_to(PUBLIC_ROOT).as_posix()
+
+def build_variants(source, mp_id, out_dir=VARIANTS_DIR):
+    """Worker: render every size x format of one source, return its manifest entry"""
+    out_dir = Path(out_dir)
+    entry = {'source': Path(source).as_posix(), 'sourceHash': file_hash(source), 'variants': {}}
+
+    with Image.open(source) as img:
+        img = to_rgb(img)
+        entry['width'], entry['height'] = img.size
+        for name, box in VARIANTS.items():
+            resized = img.copy()
+            resized.thumbnail(box, Image.LANCZOS)
+            variant = {'width': resized.width, 'height': resized.height}
+            for ext, (fmt, options) in FORMATS.items():
+                path = out_dir / f"{mp_id}-{name}.{ext}"
+                tmp = path.with_name(path.name + '.part')
+                resized.save(tmp, fmt, **options)
+                os.replace(tmp, path)
+                variant[ext] = {'url': public_url(path), 'hash': file_hash(path), 'bytes': path.stat().st_size}
+            entry['variants'][name] = variant
+    return mp_id, entry
+
+def store_sources(index_file=STORE_INDEX, public_root=PUBLIC_ROOT):
+    """mp_id -> its portrait in the content-addressed store"""
+    index = load_json(index_file)
+    return {
+        mp_id: Path(public_root) / index['blobs'][key]['url'].lstrip('/')
+        for mp_id, key in sorted(index['mps'].items())
+    }
+
+def find_sources(source_dir):
+    """mp_id -> source image in a directory of mp_XXX files (one per MP, .jpg preferred)"""
+    sources = {}
+    for path in sorted(Path(source_dir).iterdir()):
+        if path.is_file() and path.suffix.lower() in SOURCE_EXTENSIONS and path.stem.startswith('mp_'):
+            if path.stem not in sources or path.suffix.lower() == '.jpg':
+                sources[path.stem] = path
+    return sources
+
+def is_current(entry, source_hash, public_root=PUBLIC_ROOT):
+    if not entry or entry.get('sourceHash') != source_hash:
+        return False
+    return all(
+        (Path(public_root) / variant[ext]['url'].lstrip('/')).exists()
+        for variant in entry.get('variants', {}).values()
+        for ext in FORMATS
+    )
+
+def run(force=False, workers=None, source_dir=None, out_dir=VARIANTS_DIR, manifest_file=MANIFEST_FILE):
+    """Return (manifest, rebuilt ids, skipped count); sources come from the store unless source_dir"""
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    manifest = load_json(manifest_file) if os.path.exists(manifest_file) and not force else {}
+    sources = find_sources(source_dir) if source_dir else store_sources()
+
+    todo = []
+    for mp_id, source in sources.items():
+        if force or not is_current(manifest.get(mp_id), file_hash(source)):
+            todo.append((source, mp_id))
+        else:   # same content, possibly another copy of it
+            manifest[mp_id]['source'] = Path(source).as_posix()
+
+    rebuilt = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(build_variants, source, mp_id, out_dir) for source, mp_id in todo]
+            for future in futures:
+                mp_id, entry = future.result()
+                manifest[mp_id] = entry
+                rebuilt.append(mp_id)
+
+    # Drop MPs whose source photo is gone
+    for mp_id in list(manifest):
+        if mp_id not in sources:
+            del manifest[mp_id]
+
+    manifest = dict(sorted(manifest.items()))
+    save_json(manifest_file, manifest)
+    return manifest, rebuilt, len(sources) - len(todo)
+
+def main():
+    force = '--force' in sys.argv
+    workers = int(sys.argv[sys.argv.index('--workers') + 1]) if '--workers' in sys.argv else None
+    source_dir = sys.argv[sys.argv.index('--source') + 1] if '--source' in sys.argv else None
+
+    print("=== MP Photo Variants ===\n")
+    manifest, rebuilt, skipped = run(force=force, workers=workers, source_dir=source_dir)
+
+    print(f"Rebuilt: {len(rebuilt)}")
+    print(f"Unchanged (skipped): {skipped}")
+    total = {ext: 0 for ext in FORMATS}
+    for entry in manifest.values():
+        for ext in FORMATS:
+            total[ext] += entry['variants']['avatar'][ext]['bytes']
+    for ext, size in total.items():
+        print(f"Avatar {ext} total: {size / 1024:.0f} KB")
+    print(f"\nSaved to {MANIFEST_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Weighted interval selection
+Segmenters produce competing speaker hand-over candidates: the same
+name found by several patterns, a short form inside a longer one, two
+"تفضل" a few words apart. Instead of keeping whichever comes first in
+sort order, select_intervals() picks the set of non-overlapping
+candidates with the largest total weight (weighted interval scheduling:
+sort by end, binary search for the last compatible candidate, one
+dynamic-programming pass; O(n log n)).
+
+Ties go to the solution found first over candidates sorted by
+(end, start, input order), so results do not depend on the order
+candidates were collected in.
+"""
+
+from bisect import bisect_right
+
+TITLE_WEIGHT = 10       # a title before the name counts like ten more matched characters
+MIN_CONFIDENCE = 0.25   # a name the resolver cannot place still counts for something
+
+def handover_weight(chars, titled=False, confidence=1.0):
+    """Matched name length scaled by resolver confidence, plus a bonus for a title"""
+    return chars * max(confidence, MIN_CONFIDENCE) + (TITLE_WEIGHT if titled else 0)
+
+def select_intervals(intervals, min_gap=0):
+    """
+    intervals: sequence of (start, end, weight), end exclusive.
+    Two intervals are compatible when the later one starts at least
+    min_gap after the earlier one ends. Returns the indices of the
+    chosen intervals in start order.
+    """
+    order = sorted(range(len(intervals)), key=lambda i: (intervals[i][1], intervals[i][0], i))
+    ends = [intervals[i][1] for i in order]
+    best = [0.0] * (len(order) + 1)
+    previous = [0] * (len(order) + 1)
+    for k, i in enumerate(order, 1):
+        start, _, weight = intervals[i]
+        # Number of intervals (among the first k - 1) that end in time
+        previous[k] = bisect_right(ends, start - min_gap, 0, k - 1)
+        best[k] = max(best[k - 1], weight + best[previous[k]])
+
+    chosen, k = [], len(order)
+    while k:
+        i = order[k - 1]
+        if best[k] != best[k - 1] and best[k] == intervals[i][2] + best[previous[k]]:
+            chosen.append(i)
+            k = previous[k]
+        else:
+            k -= 1
+    return sorted(chosen, key=lambda i: (intervals[i][0], intervals[i][1]))
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Article-level law parser and clause index
+Splits the bills in public/data/pdfs into articles (المادة), clauses
+(أ- / ب- / أولاً: ...) and amendments (which article of the original law
+each one amends, replaces, repeals or adds), and finds the sessions that
+cite each article.
+
+Outputs:
+    public/data/laws/<law id>.json   documents -> articles -> clauses,
+                                     plus citations per article number
+    public/data/law_articles.json    law id -> article number -> text,
+                                     amendment target and citing sessions
+    laws.json                        articlesUrl on every law with either
+
+PDFs are matched to laws through pdfUrl in laws.json, or by file name for
+PDFs no law links yet (e.g. an earlier draft). Page text comes from
+pdf_pages (cached per page); pages extracted in visual order (each word's
+letters reversed) are put back in logical order first. Documents whose
+font encoding cannot be read are kept with status "unreadable".
+
+    python law_articles.py
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+from arabic_text import ascii_digits, fold
+from pdf_pages import PDF_DIR, file_hash, iter_pages
+from phrase_automaton import PhraseAutomaton
+
+LAWS_FILE = 'public/data/laws.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+LAW_DIR = 'public/data/laws'
+INDEX_FILE = 'public/data/law_articles.json'
+PUBLIC_ROOT = Path('public')
+
+SESSION_FIELDS = ('summary', 'decisions', 'mp_highlights')
+SNIPPET_CHARS = 80
+EXPLICIT_LAW_GAP = 6   # 'من ' / 'في ' between an article and the law named after it
+
+ARABIC_TOKEN = re.compile(r'[ء-ي٠-٩۰-۹]')
+ARTICLE_HEADER = re.compile(r'^المادة\s*(\d+)?\s*[-–]\s*')
+CLAUSE_MARKER = re.compile(
+    r'^(?:(?P<ordinal>(?:أولا|ثانيا|ثالثا|رابعا|خامسا|سادسا|سابعا|ثامنا|تاسعا|عاشرا)ً?)\s*[:-]*(?=\s)'
+    r'|(?P<letter>[أابجدهزحطيكلمنسعفصقرشت])\s*-?(?=\s))\s*'
+)
+RUNNING_FOOTER = re.compile(r'^(?:م\.\s?ش|ش\.\s?م)(?:\s|$)')
+HAS_TEXT = re.compile(r'[ء-ي0-9]')
+INTRODUCES_TEXT = re.compile(r'(?:التالي|التاليين|يلي)\s*:-?$')
+# Comparison tables are extracted one word per line
+TABLE_WORDS_PER_LINE = 1.5
+TABLE_MIN_LINES = 30
+AMENDMENT_RULES = [
+    ('replace', re.compile(r'(?:يلغي|الغاء) نص الماده \(?(\d+)\)?')),
+    ('repeal', re.compile(r'(?:تلغي|يلغي|الغاء) الماده \(?(\d+)\)?')),
+    ('amend', re.compile(r'تعدل الماده \(?(\d+)\)?')),
+    ('add', re.compile(r'(?:تضاف|باضافه) (?:ماده|الماده) (?:جديده )?(?:بالرقم )?\(?(\d+)\)?')),
+]
+
+# Cited articles in session text (folded)
+ORDINALS = {
+    'الاولي': 1, 'الثانيه': 2, 'الثالثه': 3, 'الرابعه': 4, 'الخامسه': 5,
+    'السادسه': 6, 'السابعه': 7, 'الثامنه': 8, 'التاسعه': 9, 'العاشره': 10,
+    'الحاديه': 1,
+}
+ARTICLE_MENTION = re.compile(
+    r'(?:ال|بال|لل)ماده\s*(?:\(\s*(\d+)\s*\)|(\d+)|(' + '|'.join(ORDINALS) + r')(\s+عشره)?)'
+)
+OTHER_SOURCE = re.compile(r'^\s*\)?\s*(?:من|في)\s+(?:الدستور|النظام الداخلي)')
+TITLE_PREFIXES = ('مشروع قانون معدل لقانون', 'قانون معدل لقانون', 'مشروع قانون', 'قانون')
+TITLE_SUFFIX = re.compile(r'\s*(?:لسنة|للسنة المالية)\s*\d{4}.*$')
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def law_core(title):
+    """'مشروع قانون معدل لقانون العمل لسنة 2024' -> 'العمل'"""
+    core = TITLE_SUFFIX.sub('', title.strip())
+    for prefix in TITLE_PREFIXES:
+        if core.startswith(prefix + ' '):
+            return core[len(prefix):].strip()
+    return core
+
+# ----------------------------------------------------------------------
+# PDF text -> articles
+# ----------------------------------------------------------------------
+
+def is_visual_order(text):
+    """True when most definite articles appear at the end of words (ال reversed)"""
+    words = fold(text).split()
+    reversed_count = sum(1 for w in words if len(w) > 3 and w.rstrip('.:،-)(').endswith('لا'))
+    logical_count = sum(1 for w in words if len(w) > 3 and w.lstrip('.:،-)(').startswith('ال'))
+    return reversed_count > logical_count
+
+def logical_order(text):
+    """Reverse the letters of every Arabic token"""
+    lines = []
+    for line in text.split('\n'):
+        tokens = [
+            token[::-1] if ARABIC_TOKEN.search(token) else token
+            for token in line.split()
+        ]
+        lines.append(' '.join(tokens))
+    return '\n'.join(lines)
+
+def clean_lines(text):
+    for line in ascii_digits(text).split('\n'):
+        line = ' '.join(line.split())
+        if not HAS_TEXT.search(line) or line.isdigit() or RUNNING_FOOTER.match(line):
+            continue
+        yield line
+
+def split_clauses(lines):
+    """[{'label', 'text'}] from an article's lines; text before the first marker has no label"""
+    clauses = []
+    for line in lines:
+        match = CLAUSE_MARKER.match(line)
+        if match and (match.group('ordinal') or match.group('letter') != 'و'):
+            label = (match.group('ordinal') or match.group('letter')).rstrip('ً')
+            clauses.append({'label': label, 'text': line[match.end():]})
+        elif clauses:
+            clauses[-1]['text'] += ' ' + line
+        else:
+            clauses.append({'label': None, 'text': line})
+    return clauses
+
+def amendment(text):
+    """{'action', 'article'} for the first amendment clause of an article, or None"""
+    folded = fold(text)
+    found = []
+    for action, pattern in AMENDMENT_RULES:
+        match = pattern.search(folded)
+        if match:
+            found.append((match.start(), action, int(match.group(1))))
+    if not found:
+        return None
+    _, action, article = min(found)
+    return {'action': action, 'article': article}
+
+def parse_articles(lines):
+    """
+    (preamble, articles) from cleaned lines. A header only opens a new
+    article when its number follows the previous one (a missing number is
+    inferred unless the previous line introduces quoted text), so articles
+    quoted inside amendment text stay in the body.
+    """
+    preamble, articles = [], []
+    current = None
+    for line in lines:
+        match = ARTICLE_HEADER.match(line)
+        if match:
+            expected = articles[-1]['number'] + 1 if articles else 1
+            quoted = current and current['lines'] and INTRODUCES_TEXT.search(current['lines'][-1])
+            number = int(match.group(1)) if match.group(1) else (None if quoted else expected)
+            if number == expected:
+                current = {'number': number, 'lines': [line[match.end():]] if line[match.end():] else []}
+                articles.append(current)
+                continue
+        if current:
+            current['lines'].append(line)
+        else:
+            preamble.append(line)
+
+    for article in articles:
+        lines = article.pop('lines')
+        article['text'] = ' '.join(lines)
+        article['clauses'] = split_clauses(lines)
+        article['amends'] = amendment(article['text'])
+    return ' '.join(preamble), articles
+
+def document_pages(path):
+    """Page texts of a PDF in page order (from the pdf_pages cache)"""
+    pages = {index: text for _, index, text in iter_pages([path])}
+    return [pages[index] for index in sorted(pages)]
+
+def is_table(lines):
+    words = sum(len(line.split()) for line in lines)
+    return len(lines) >= TABLE_MIN_LINES and words / len(lines) < TABLE_WORDS_PER_LINE
+
+def parse_document(path):
+    """Structured document for one PDF"""
+    pages = document_pages(path)
+    lines, tables = [], 0
+    for page in pages:
+        page_lines = list(clean_lines(logical_order(page) if is_visual_order(page) else page))
+        if is_table(page_lines):
+            tables += 1
+        else:
+            lines.extend(page_lines)
+    preamble, articles = parse_articles(lines)
+    return {
+        'source': '/' + Path(path).relative_to(PUBLIC_ROOT).as_posix(),
+        'sourceHash': file_hash(path),
+        'pages': len(pages),
+        'tablePages': tables,
+        'status': 'parsed' if articles else 'unreadable',
+        'preamble': preamble,
+        'articles': articles,
+    }
+
+def match_pdfs(laws, pdf_dir=PDF_DIR):
+    """{law id: [pdf paths]} via pdfUrl first, then by law name in the file name"""
+    by_url = {law['pdfUrl']: law['id'] for law in laws if law.get('pdfUrl')}
+    cores = [(fold(law_core(law['title'])), law['id']) for law in laws]
+    matched = {}
+    for path in sorted(Path(pdf_dir).glob('*.pdf')):
+        url = '/' + path.relative_to(PUBLIC_ROOT).as_posix()
+        law_id = by_url.get(url)
+        if not law_id:
+            name = fold(law_core(re.sub(r'\d{4}', '', path.stem).strip()))
+            candidates = [(len(core), lid) for core, lid in cores if name and (name in core or core in name)]
+            law_id = max(candidates)[1] if candidates else None
+        if law_id:
+            matched.setdefault(law_id, []).append(str(path))
+    return matched
+
+# ----------------------------------------------------------------------
+# Session citations
+# ----------------------------------------------------------------------
+
+def build_law_automaton(laws):
+    automaton = PhraseAutomaton()
+    for law in laws:
+        automaton.add(fold('قانون ' + law_core(law['title'])), law)
+    return automaton.build()
+
+def law_at(mentions, start, end, session_year):
+    """
+    Law a mention spanning start:end refers to: one named right after it
+    ("المادة 5 من قانون ..."), else the closest one named before it
+    (longest phrase, then nearest year).
+    """
+    best = None
+    for m_start, m_end, law in mentions:
+        if m_start >= end:
+            if m_start - end <= EXPLICIT_LAW_GAP:
+                best = ((float('inf'), m_end - m_start, 0), law)
+            break
+        if m_start >= start:
+            continue
+        rank = (m_start, m_end - m_start, -abs(law.get('year', session_year) - session_year))
+        if best is None or rank > best[0]:
+            best = (rank, law)
+    return best[1] if best else None
+
+def article_number(match):
+    if match.group(1) or match.group(2):
+        return int(match.group(1) or match.group(2))
+    number = ORDINALS[match.group(3)]
+    if match.group(4):
+        number += 10
+    return number
+
+def find_citations(sessions, laws):
+    """{law id: {article number: [citation]}} from session summaries"""
+    automaton = build_law_automaton(laws)
+    citations = {}
+    for session in sessions:
+        content = session.get('raw_content') or {}
+        if not isinstance(content, dict):
+            continue
+        year = int(str(session.get('date') or '0')[:4] or 0)
+        for field in SESSION_FIELDS:
+            text = content.get(field)
+            if not isinstance(text, str):
+                continue
+            folded = fold(text)
+            mentions = sorted(automaton.finditer(folded), key=lambda m: (m[0], m[1]))
+            for match in ARTICLE_MENTION.finditer(folded):
+                if OTHER_SOURCE.match(folded[match.end():]):
+                    continue
+                law = law_at(mentions, match.start(), match.end(), year)
+                if not law:
+                    continue
+                number = article_number(match)
+                snippet = text[max(0, match.start() - SNIPPET_CHARS):match.end() + SNIPPET_CHARS]
+                citations.setdefault(law['id'], {}).setdefault(number, []).append({
+                    'sessionId': session['id'],
+                    'date': session.get('date'),
+                    'field': field,
+                    'snippet': ' '.join(snippet.split()),
+                })
+    return citations
+
+# ----------------------------------------------------------------------
+
+def build(laws, sessions, pdf_dir=PDF_DIR):
+    """Return ({law id: law document}, index)"""
+    pdfs = match_pdfs(laws, pdf_dir)
+    citations = find_citations(sessions, laws)
+
+    documents, index = {}, {}
+    for law in laws:
+        docs = [parse_document(path) for path in pdfs.get(law['id'], [])]
+        cited = citations.get(law['id'], {})
+        if not docs and not cited:
+            continue
+        documents[law['id']] = {
+            'lawId': law['id'],
+            'title': law['title'],
+            'documents': docs,
+            'citations': {str(n): cited[n] for n in sorted(cited)},
+        }
+
+        entries = {}
+        for doc_index, doc in enumerate(docs):
+            for article in doc['articles']:
+                # The first readable document of a law wins for each number
+                entries.setdefault(article['number'], {
+                    'text': article['text'],
+                    'document': doc_index,
+                    'amends': article['amends'],
+                })
+        for number, refs in cited.items():
+            entries.setdefault(number, {'text': None, 'document': None, 'amends': None})
+            entries[number]['citations'] = [{'sessionId': r['sessionId'], 'field': r['field']} for r in refs]
+        index[law['id']] = {
+            'file': f"/data/laws/{law['id']}.json",
+            'articles': {str(n): dict({'citations': []}, **entries[n]) for n in sorted(entries)},
+        }
+    return documents, index
+
+def main():
+    print("=== Law Articles ===\n")
+    laws = load_json(LAWS_FILE)
+    sessions = load_json(SESSIONS_FILE)
+    documents, index = build(laws, sessions)
+
+    os.makedirs(LAW_DIR, exist_ok=True)
+    for law_id, document in documents.items():
+        save_json(os.path.join(LAW_DIR, f"{law_id}.json"), document)
+    save_json(INDEX_FILE, index)
+
+    changed = False
+    for law in laws:
+        url = index[law['id']]['file'] if law['id'] in index else None
+        if law.get('articlesUrl') != url:
+            if url:
+                law['articlesUrl'] = url
+            else:
+                law.pop('articlesUrl', None)
+            changed = True
+    if changed:
+        save_json(LAWS_FILE, laws)
+
+    for law_id, document in documents.items():
+        parsed = ', '.join(
+            f"{Path(d['source']).name}: {len(d['articles'])} articles" if d['status'] == 'parsed'
+            else f"{Path(d['source']).name}: unreadable"
+            for d in document['documents']
+        )
+        cited = sum(len(refs) for refs in document['citations'].values())
+        print(f"{law_id}: {cited} citations of {len(document['citations'])} articles" + (f" | {parsed}" if parsed else ""))
+    print(f"\nSaved {len(documents)} law documents to {LAW_DIR} and {INDEX_FILE}")
+
+if __name__ == '__main__':
+    main()
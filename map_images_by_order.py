@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Map MP photos from MPs pics_files directory in ORDER
-Uses numbered images (image001.jpg, image002.jpg, etc.) and maps them to MPs in order
+Map MP photos from MPs pics_files directory
+Images (image001.jpg, image002.jpg, etc.) are assigned to MPs by the names
+written next to them in MPs pics.htm (one global assignment), not by index,
+so a missing or extra image no longer shifts every MP after it
 """
 
 import os
@@ -10,7 +12,10 @@ import sys
 import json
 import shutil
 from pathlib import Path
-from PIL import Image
+
+from image_pipeline import convert_to_jpg
+from photo_store import publish
+from photo_assignment import assign_from_html, print_report
 
 # تفعيل دعم UTF-8 في Windows
 if sys.platform == 'win32':
@@ -20,27 +25,10 @@ if sys.platform == 'win32':
 
 # المسارات
 SOURCE_DIR = Path("temp_mp_photos/MPs pics_files")
+HTML_FILE = Path("temp_mp_photos/MPs pics.htm")
 TARGET_DIR = Path("public/images/mps")
-DIST_DIR = Path("dist/images/mps")
 MPS_JSON = Path("public/data/mps.json")
 
-def convert_to_jpg(image_path, output_path, quality=85):
-    """تحويل الصورة إلى JPG"""
-    with Image.open(image_path) as img:
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            if img.mode in ('RGBA', 'LA'):
-                background.paste(img, mask=img.split()[-1])
-            else:
-                background.paste(img)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        img.save(output_path, 'JPEG', quality=quality, optimize=True)
-
 def main():
     print("=" * 60)
     print("     تحديث صور النواب حسب الترتيب")
@@ -54,65 +42,62 @@ def main():
     
     # 2. إنشاء المجلدات إذا لم تكن موجودة
     TARGET_DIR.mkdir(parents=True, exist_ok=True)
-    if not DIST_DIR.exists():
-        DIST_DIR.mkdir(parents=True, exist_ok=True)
     
-    # 3. معالجة الصور بالترتيب
-    print("\n[*] معالجة ونقل الصور بالترتيب...")
+    # 3. ربط الصور بالنواب حسب الأسماء المجاورة لها في HTML
+    print("\n[*] ربط الصور بالنواب...")
+    assignments, unassigned = assign_from_html(HTML_FILE, mps_data, 'windows-1256')
+    print_report(assignments, unassigned)
+    mps_by_id = {mp['id']: mp for mp in mps_data}
+    
+    # 4. معالجة الصور
+    print("\n[*] معالجة ونقل الصور...")
     processed = 0
     errors = []
     
-    for idx in range(1, len(mps_data) + 1):
+    for idx, assignment in enumerate(assignments, 1):
         try:
-            # البحث عن الصورة بالرقم
-            source_image = None
-            for ext in ['.jpg', '.gif', '.png', '.jpeg', '.JPG', '.GIF', '.PNG', '.JPEG']:
-                # تنسيق الرقم مع أصفار (001, 002, etc.)
-                image_name = f"image{idx:03d}{ext}"
-                image_path = SOURCE_DIR / image_name
-                if image_path.exists():
-                    source_image = image_path
-                    break
+            source_image = SOURCE_DIR / assignment['image']
             
-            if not source_image:
-                error_msg = f"لم يتم العثور على صورة رقم {idx}"
+            if not source_image.exists():
+                error_msg = f"لم يتم العثور على صورة {assignment['image']}"
                 errors.append(error_msg)
                 print(f"   [X] [{idx}/{len(mps_data)}] {error_msg}")
                 continue
             
             # اسم الملف الهدف
-            target_name = f"mp_{idx:03d}.jpg"
+            target_name = f"{assignment['mpId']}.jpg"
             target_path = TARGET_DIR / target_name
-            dist_path = DIST_DIR / target_name
             
             # المعالجة
             if source_image.suffix.lower() in ['.png', '.gif']:
                 convert_to_jpg(source_image, target_path)
-                if DIST_DIR.exists():
-                    shutil.copy2(target_path, dist_path)
                 print(f"   [+] [{idx}/{len(mps_data)}] {source_image.name} -> {target_name} (محول)")
             else:
                 shutil.copy2(source_image, target_path)
-                if DIST_DIR.exists():
-                    shutil.copy2(target_path, dist_path)
                 print(f"   [+] [{idx}/{len(mps_data)}] {source_image.name} -> {target_name}")
             
             # عرض اسم النائب
-            mp_name = mps_data[idx-1]['fullName']
+            mp_name = mps_by_id[assignment['mpId']]['fullName']
             print(f"       -> {mp_name}")
+            if not assignment['confident']:
+                print(f"       [!] تطابق ضعيف (score {assignment['score']})")
             
             processed += 1
             
         except Exception as e:
-            error_msg = f"خطأ في معالجة الصورة رقم {idx}: {e}"
+            error_msg = f"خطأ في معالجة الصورة {assignment['image']}: {e}"
             errors.append(error_msg)
             print(f"   [X] {error_msg}")
     
-    # 4. النتائج
+    # 5. النتائج
     print("\n" + "=" * 60)
     print("                        النتائج")
     print("=" * 60)
     print(f"[+] تم معالجة: {processed} صورة")
+
+    # الصور منسوخة إلى مجلد التجهيز فقط؛ photoUrl يشير إلى نسخة مخزن الصور
+    changed = publish(mps_data, MPS_JSON)
+    print(f"[+] تم تحديث photoUrl لـ {changed} نائب (public/images/store)")
     
     if errors:
         print(f"\n[!] أخطاء ({len(errors)}):")
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Council member directory scraper
+Fetches the CouncilMembers page, keeps every raw HTML response as a dated
+snapshot under snapshots/<page>/<YYYY-MM-DD>.html, extracts
+(RepresentativeID, name) pairs with one compiled pattern and maps them to
+mps.json through MPResolver.
+
+With --offline (or when today's snapshot already exists) nothing is
+fetched: the latest snapshot is replayed, so re-runs are instant and
+deterministic.
+
+    python member_directory.py             # fetch (once a day) and match
+    python member_directory.py --offline   # replay the latest snapshot
+    python member_directory.py --refresh   # fetch even if today's snapshot exists
+    python member_directory.py --check     # replay the committed fixture, compare with expected.json
+
+Live snapshots are not committed (snapshots/ is git-ignored); a trimmed
+page under fixtures/member_directory/ is, so the replay path can be
+exercised without network.
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from datetime import date, datetime, timezone
+from urllib.parse import urlparse
+
+from mp_resolver import MPResolver
+from photo_sync import make_session
+
+MPS_FILE = 'public/data/mps.json'
+SNAPSHOT_DIR = 'snapshots'
+FIXTURE_DIR = 'fixtures/member_directory'
+MEMBERS_URL = "https://www.representatives.jo/Ar/Pages/CouncilMembers"
+
+# <a ... href="...RepresentativeID=2076...">name</a>
+MEMBER_LINK = re.compile(
+    r'<a\b[^>]*?href\s*=\s*["\'][^"\']*?RepresentativeID=(\d+)[^"\']*["\'][^>]*>(.*?)</a\s*>',
+    re.IGNORECASE | re.DOTALL,
+)
+TAG = re.compile(r'<[^>]+>')
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def page_slug(url):
+    parsed = urlparse(url)
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', f"{parsed.netloc}{parsed.path}").strip('_')
+    return f"{slug}_{hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]}"
+
+class SnapshotStore:
+    """Raw HTML per URL and date, with an index.json of what was fetched when"""
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+
+    def directory(self, url):
+        return os.path.join(self.root, page_slug(url))
+
+    def dates(self, url):
+        directory = self.directory(url)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-5] for name in os.listdir(directory) if name.endswith('.html'))
+
+    def path(self, url, day):
+        return os.path.join(self.directory(url), f"{day}.html")
+
+    def read(self, url, day=None):
+        """(day, html) of a snapshot (the latest one by default), or (None, None)"""
+        days = self.dates(url)
+        day = day or (days[-1] if days else None)
+        if not day or not os.path.exists(self.path(url, day)):
+            return None, None
+        with open(self.path(url, day), 'r', encoding='utf-8') as f:
+            return day, f.read()
+
+    def write(self, url, content, day=None):
+        day = day or date.today().isoformat()
+        directory = self.directory(url)
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path(url, day), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        index_path = os.path.join(directory, 'index.json')
+        index = load_json(index_path) if os.path.exists(index_path) else {'url': url, 'snapshots': {}}
+        index['snapshots'][day] = {
+            'fetchedAt': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'sha1': hashlib.sha1(content.encode('utf-8')).hexdigest(),
+            'bytes': len(content.encode('utf-8')),
+        }
+        save_json(index_path, index)
+        return day
+
+def fetch_page(url, store, offline=False, refresh=False, session=None):
+    """
+    (day, html) for a page: today's or the latest snapshot unless a fetch
+    is needed and allowed. Raises LookupError when offline with no snapshot.
+    """
+    today = date.today().isoformat()
+    if offline or (not refresh and today in store.dates(url)):
+        day, content = store.read(url)
+        if content is None:
+            raise LookupError(f"No snapshot of {url} in {store.directory(url)}")
+        return day, content
+
+    session = session or make_session(workers=1)
+    response = session.get(url, timeout=30)
+    response.raise_for_status()
+    content = decode(response)
+    return store.write(url, content), content
+
+def decode(response):
+    """
+    Page text: the header charset when there is one, else UTF-8 (the site's
+    encoding), else the detected one. requests falls back to ISO-8859-1 for
+    text/html without a charset, which turns the Arabic names into mojibake.
+    """
+    if 'charset=' in response.headers.get('content-type', '').lower():
+        return response.text
+    try:
+        return response.content.decode('utf-8')
+    except UnicodeDecodeError:
+        return response.content.decode(response.apparent_encoding or 'utf-8', errors='replace')
+
+def extract_members(content):
+    """{RepresentativeID: name} from the directory HTML (first non-empty name wins)"""
+    members = {}
+    for rep_id, inner in MEMBER_LINK.findall(content):
+        name = ' '.join(html.unescape(TAG.sub(' ', inner)).split())
+        if name:
+            members.setdefault(rep_id, name)
+    return members
+
+def match_members(members, resolver):
+    """
+    Map scraped members to MP ids through the resolver index.
+    Returns ({mp_id: rep_id}, [unmatched names], [(mp_id, rep_ids)] claimed twice).
+    """
+    matches, unmatched, conflicts = {}, [], {}
+    for rep_id, name in members.items():
+        mp_id = resolver.resolve_id(name)
+        if not mp_id:
+            unmatched.append(name)
+        elif mp_id in matches and matches[mp_id] != rep_id:
+            conflicts.setdefault(mp_id, [matches[mp_id]]).append(rep_id)
+        else:
+            matches[mp_id] = rep_id
+    return matches, unmatched, sorted(conflicts.items())
+
+def representative_ids(mps, offline=False, refresh=False, store=None, url=MEMBERS_URL):
+    """{mp_id: RepresentativeID} for the roster, plus the snapshot day used"""
+    store = store or SnapshotStore()
+    day, content = fetch_page(url, store, offline=offline, refresh=refresh)
+    matches, unmatched, conflicts = match_members(extract_members(content), MPResolver(mps))
+    return matches, unmatched, conflicts, day
+
+def check_fixture(mps, fixture_dir=FIXTURE_DIR):
+    """Replay the fixture snapshot offline; returns [differences from expected.json]"""
+    expected = load_json(os.path.join(fixture_dir, 'expected.json'))
+    store = SnapshotStore(os.path.join(fixture_dir, 'snapshots'))
+    matches, unmatched, conflicts, day = representative_ids(mps, offline=True, store=store)
+    actual = {
+        'day': day,
+        'matches': matches,
+        'unmatched': unmatched,
+        'conflicts': [[mp_id, rep_ids] for mp_id, rep_ids in conflicts],
+    }
+    return [
+        f"{key}: expected {expected.get(key)!r}, got {actual[key]!r}"
+        for key in actual if actual[key] != expected.get(key)
+    ]
+
+def main():
+    offline = '--offline' in sys.argv
+    refresh = '--refresh' in sys.argv
+
+    print("=== Council Member Directory ===\n")
+    mps = load_json(MPS_FILE)
+    if '--check' in sys.argv:
+        differences = check_fixture(mps)
+        for difference in differences:
+            print(f"[FAIL] {difference}")
+        print("Fixture replay: " + ("FAILED" if differences else "OK"))
+        sys.exit(1 if differences else 0)
+
+    try:
+        matches, unmatched, conflicts, day = representative_ids(mps, offline, refresh)
+    except LookupError as e:
+        print(f"[ERROR] {e}")
+        return
+
+    print(f"Snapshot: {day}")
+    print(f"Matched: {len(matches)}/{len(mps)}")
+    if unmatched:
+        print(f"Unmatched ({len(unmatched)}): {unmatched[:5]}...")
+    for mp_id, rep_ids in conflicts:
+        print(f"[CONFLICT] {mp_id} matched by RepresentativeIDs {rep_ids}")
+
+if __name__ == '__main__':
+    main()
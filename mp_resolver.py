@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Indexed MP name resolver
+Maps free-text speaker names (with titles, roles in brackets, spelling
+variants) to MP records in mps.json through a token index instead of
+scanning the whole roster for every lookup.
+"""
+
+import json
+import re
+import difflib
+from functools import lru_cache
+
+from arabic_text import normalize
+
+MPS_FILE = 'public/data/mps.json'
+FIRST_NAME_RATIO = 0.8      # راكان / راكين = 0.8; زياد / اياد = 0.75 are two names
+
+TITLES = {
+    "سعاده", "معالي", "السيد", "السيده", "النائب", "الدكتور", "الدكتوره",
+    "المهندس", "المهندسه", "المحامي", "المحاميه", "الانسه", "الزميل",
+    "الزميله", "الاخ", "الاخت", "الشيخ", "دوله", "د"
+}
+
+def load_mps():
+    with open(MPS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=4096)
+def normalize_name(name):
+    """Normalize a person name for matching (letters, titles, brackets)"""
+    if not name:
+        return ""
+    # Drop roles in brackets: "أحمد الصفدي (رئيس المجلس)"
+    name = normalize(re.sub(r'\(.*?\)', ' ', str(name)), punctuation=True)
+    # Compound names are written both ways: "عبد الباسط" / "عبدالباسط"
+    name = re.sub(r'\b(عبد|ابو)\s+', r'\1', name)
+    tokens = [t for t in name.split() if t not in TITLES]
+    return " ".join(tokens)
+
+def token_key(token):
+    """Family names appear with and without the article (القبلان / قبلان)"""
+    if token.startswith("ال") and len(token) > 4:
+        return token[2:]
+    return token
+
+def name_variations(full_name):
+    """Short forms used in sessions: full, first+last, first+second+last"""
+    norm = normalize_name(full_name)
+    parts = norm.split()
+    variations = {norm}
+    if len(parts) >= 2:
+        variations.add(f"{parts[0]} {parts[-1]}")
+    if len(parts) >= 3:
+        variations.add(f"{parts[0]} {parts[1]} {parts[-1]}")
+    return variations
+
+class MPResolver:
+    """
+    Resolve names to MPs using an exact variation index backed by a
+    token -> MP index for fuzzy candidates.
+    """
+
+    def __init__(self, mps, min_ratio=0.85):
+        self.mps = mps
+        self.min_ratio = min_ratio
+        self.by_id = {mp['id']: mp for mp in mps}
+        self.variation_index = {}
+        self.token_index = {}
+        self.normalized = {}
+        self._cache = {}
+
+        for mp in mps:
+            norm = normalize_name(mp.get('fullName', ''))
+            self.normalized[mp['id']] = norm
+            for variation in name_variations(mp.get('fullName', '')):
+                self.variation_index.setdefault(variation, set()).add(mp['id'])
+            for token in set(map(token_key, norm.split())):
+                self.token_index.setdefault(token, set()).add(mp['id'])
+
+    def resolve_id(self, name):
+        """Return the MP id for a name, or None if it is not an MP"""
+        norm = normalize_name(name)
+        if not norm:
+            return None
+        if norm in self._cache:
+            return self._cache[norm]
+
+        mp_id = None
+        exact = self.variation_index.get(norm)
+        if exact and len(exact) == 1:
+            mp_id = next(iter(exact))
+        else:
+            mp_id = self._resolve_fuzzy(norm)
+
+        self._cache[norm] = mp_id
+        return mp_id
+
+    def resolve(self, name):
+        mp_id = self.resolve_id(name)
+        return self.by_id.get(mp_id) if mp_id else None
+
+    def confidence(self, name):
+        """(mp id, 0..1): 1.0 for an unambiguous name variation, else the fuzzy ratio"""
+        mp_id = self.resolve_id(name)
+        if not mp_id:
+            return None, 0.0
+        norm = normalize_name(name)
+        if self.variation_index.get(norm) == {mp_id}:
+            return mp_id, 1.0
+        return mp_id, difflib.SequenceMatcher(None, norm, self.normalized[mp_id]).ratio()
+
+    def _resolve_fuzzy(self, norm):
+        tokens = [token_key(t) for t in norm.split()]
+        scores = {}
+        for token in set(tokens):
+            for mp_id in self.token_index.get(token, ()):
+                scores[mp_id] = scores.get(mp_id, 0) + 1
+
+        # Need at least first name + one more token in common, or a full
+        # name where only the first name is spelled slightly differently
+        # (راكان / راكين) - another first name is another person
+        candidates = []
+        for mp_id, shared in scores.items():
+            first = token_key(self.normalized[mp_id].split()[0])
+            if shared >= min(2, len(tokens)) and first == tokens[0]:
+                candidates.append(mp_id)
+            elif (len(tokens) >= 4 and shared >= len(tokens) - 1
+                  and difflib.SequenceMatcher(None, first, tokens[0]).ratio() >= FIRST_NAME_RATIO):
+                candidates.append(mp_id)
+        if not candidates:
+            return None
+
+        best_id = None
+        best_key = (0, 0.0)
+        for mp_id in sorted(candidates):
+            ratio = difflib.SequenceMatcher(None, norm, self.normalized[mp_id]).ratio()
+            key = (scores[mp_id], ratio)
+            if key > best_key:
+                best_key = key
+                best_id = mp_id
+
+        shared, ratio = best_key
+        # All tokens of a short form present, or a close full-name match
+        if shared == len(set(tokens)) or ratio >= self.min_ratio:
+            return best_id
+        return None
+
+def main():
+    import sys
+
+    resolver = MPResolver(load_mps())
+    for name in sys.argv[1:]:
+        mp = resolver.resolve(name)
+        if mp:
+            print(f"{name} -> {mp['id']} {mp['fullName']}")
+        else:
+            print(f"{name} -> (no match)")
+
+if __name__ == '__main__':
+    main()
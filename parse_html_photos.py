@@ -9,9 +9,12 @@ import sys
 import json
 import re
 from pathlib import Path
-from PIL import Image
 import shutil
-from bs4 import BeautifulSoup
+
+from html_blocks import text_image_pairs
+from image_pipeline import convert_to_jpg
+from photo_store import publish
+from photo_assignment import assign_photos, print_report
 
 # تفعيل دعم UTF-8 في Windows
 if sys.platform == 'win32':
@@ -23,38 +26,29 @@ if sys.platform == 'win32':
 HTML_FILE = Path("temp_mp_photos/MPs pics.ht_")
 IMAGES_DIR = Path("temp_mp_photos")
 TARGET_DIR = Path("public/images/mps")
-DIST_DIR = Path("dist/images/mps")
 MPS_JSON = Path("public/data/mps.json")
 
 def parse_html_for_mp_images():
     """تحليل ملف HTML للحصول على ترتيب الصور"""
     print("[*] قراءة ملف HTML...")
     
-    with open(HTML_FILE, 'r', encoding='windows-1256') as f:
-        content = f.read()
-    
-    soup = BeautifulSoup(content, 'html.parser')
-    
     # البحث عن جميع أسماء النواب والصور المرتبطة بهم
+    # (تمريرة واحدة على الملف، والنتيجة محفوظة حسب بصمة الملف)
     mp_image_mapping = []
     
-    # البحث عن كل عنصر يحتوي على اسم النائب (h1 أو h2 أو h3)
-    for heading in soup.find_all(['h1', 'h2', 'h3', 'p']):
-        text = heading.get_text().strip()
-        
-        # تحقق إذا كان النص يحتوي على "سعادة" أو "معالي" (دلالة على اسم نائب)
-        if 'سعادة' in text or 'معالي' in text:
-            # البحث عن الصورة التالية
-            next_elem = heading.find_next('img')
-            if next_elem and 'id' in next_elem.attrs:
-                image_id = next_elem['id']
-                mp_name = text
-                mp_image_mapping.append({
-                    'name': mp_name,
-                    'image_id': image_id,
-                    'src': next_elem.get('src', '')
-                })
-                print(f"   [{len(mp_image_mapping)}] {mp_name} -> {image_id}")
+    # تحقق إذا كان النص يحتوي على "سعادة" أو "معالي" (دلالة على اسم نائب)
+    pairs = text_image_pairs(
+        HTML_FILE, 'windows-1256', tags={'h1', 'h2', 'h3', 'p'},
+        predicate=lambda text: 'سعادة' in text or 'معالي' in text
+    )
+    for mp_name, image in pairs:
+        if image['id']:
+            mp_image_mapping.append({
+                'name': mp_name,
+                'image_id': image['id'],
+                'src': image['src']
+            })
+            print(f"   [{len(mp_image_mapping)}] {mp_name} -> {image['id']}")
     
     return mp_image_mapping
 
@@ -85,23 +79,6 @@ def find_image_file(image_id):
     
     return None
 
-def convert_to_jpg(image_path, output_path, quality=85):
-    """تحويل الصورة إلى JPG"""
-    with Image.open(image_path) as img:
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            if img.mode in ('RGBA', 'LA'):
-                background.paste(img, mask=img.split()[-1])
-            else:
-                background.paste(img)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        img.save(output_path, 'JPEG', quality=quality, optimize=True)
-
 def main():
     print("=" * 60)
     print("     تحديث صور النواب من ملف HTML")
@@ -121,59 +98,62 @@ def main():
         mps_data = json.load(f)
     print(f"[+] وجدت {len(mps_data)} نائب في البيانات")
     
-    # 3. معالجة ونقل الصور
-    print("\n[*] معالجة ونقل الصور بالترتيب الصحيح...")
+    # 3. ربط الصور بالنواب (تعيين أمثل واحد بدلاً من الترتيب)
+    print("\n[*] ربط الصور بالنواب حسب الأسماء...")
+    assignments, unassigned = assign_photos(
+        [(mapping['name'], mapping['image_id']) for mapping in mp_mappings], mps_data
+    )
+    print_report(assignments, unassigned)
+    
+    # 4. معالجة ونقل الصور
+    print("\n[*] معالجة ونقل الصور...")
     processed = 0
     errors = []
     
-    for idx, mapping in enumerate(mp_mappings, 1):
+    for idx, mapping in enumerate(assignments, 1):
         try:
             # البحث عن ملف الصورة
-            image_file = find_image_file(mapping['image_id'])
+            image_file = find_image_file(mapping['image'])
             
             if not image_file:
-                error_msg = f"لم يتم العثور على صورة: {mapping['image_id']}"
+                error_msg = f"لم يتم العثور على صورة: {mapping['image']}"
                 errors.append(error_msg)
-                print(f"   [X] [{idx}/{len(mp_mappings)}] {error_msg}")
+                print(f"   [X] [{idx}/{len(assignments)}] {error_msg}")
                 continue
             
             # اسم الملف الجديد
-            target_name = f"mp_{idx:03d}.jpg"
+            target_name = f"{mapping['mpId']}.jpg"
             target_path = TARGET_DIR / target_name
-            dist_path = DIST_DIR / target_name
             
             # المعالجة
             if image_file.suffix.lower() in ['.png', '.gif']:
                 convert_to_jpg(image_file, target_path)
-                if DIST_DIR.exists():
-                    shutil.copy2(target_path, dist_path)
-                print(f"   [+] [{idx}/{len(mp_mappings)}] {image_file.name} -> {target_name} (محول)")
+                print(f"   [+] [{idx}/{len(assignments)}] {image_file.name} -> {target_name} (محول)")
             else:
                 shutil.copy2(image_file, target_path)
-                if DIST_DIR.exists():
-                    shutil.copy2(target_path, dist_path)
-                print(f"   [+] [{idx}/{len(mp_mappings)}] {image_file.name} -> {target_name}")
+                print(f"   [+] [{idx}/{len(assignments)}] {image_file.name} -> {target_name}")
             
             # عرض اسم النائب من HTML
-            print(f"       -> {mapping['name']}")
-            
-            if idx <= len(mps_data):
-                json_name = mps_data[idx-1]['fullName']
-                if json_name not in mapping['name']:
-                    print(f"       [!] تحذير: اسم مختلف في JSON: {json_name}")
+            print(f"       -> {mapping['text']}")
+            if not mapping['confident']:
+                print(f"       [!] تحذير: تطابق ضعيف (score {mapping['score']})")
             
             processed += 1
             
         except Exception as e:
-            error_msg = f"خطأ في معالجة {mapping.get('image_id', 'unknown')}: {e}"
+            error_msg = f"خطأ في معالجة {mapping.get('image', 'unknown')}: {e}"
             errors.append(error_msg)
             print(f"   [X] {error_msg}")
     
-    # 4. النتائج
+    # 5. النتائج
     print("\n" + "=" * 60)
     print("                        النتائج")
     print("=" * 60)
     print(f"[+] تم معالجة: {processed} صورة")
+
+    # الصور منسوخة إلى مجلد التجهيز فقط؛ photoUrl يشير إلى نسخة مخزن الصور
+    changed = publish(mps_data, MPS_JSON)
+    print(f"[+] تم تحديث photoUrl لـ {changed} نائب (public/images/store)")
     
     if errors:
         print(f"\n[!] أخطاء ({len(errors)}):")
@@ -3,21 +3,15 @@ import json
 import re
 import os
 
+from arabic_text import normalize
+from caption_timeline import CaptionTimeline
+from interval_selection import handover_weight, select_intervals
+
 # Configuration
 MPS_FILE = 'public/data/mps.json'
 TRANSCRIPT_FILE = 'sample_transcript.txt'
 OUTPUT_FILE = 'transcript_segments.json'
 
-def normalize_text(text):
-    """Normalize Arabic text for comparison."""
-    if not text:
-        return ""
-    text = text.replace("أ", "ا").replace("إ", "ا").replace("آ", "ا")
-    text = text.replace("ة", "ه")
-    text = text.replace("ى", "ي")
-    text = re.sub(r'[^\w\s]', '', text) # Remove punctuation
-    return text.strip()
-
 def load_mps(filepath):
     """Load MPs and generate name variations for matching."""
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -26,7 +20,7 @@ def load_mps(filepath):
     mp_map = {}
     for mp in mps:
         full_name = mp['fullName']
-        norm_full = normalize_text(full_name)
+        norm_full = normalize(full_name, punctuation=True)
         
         parts = full_name.split()
         variations = set()
@@ -34,10 +28,10 @@ def load_mps(filepath):
         
         if len(parts) >= 2:
             # First + Last
-            variations.add(normalize_text(f"{parts[0]} {parts[-1]}"))
+            variations.add(normalize(f"{parts[0]} {parts[-1]}", punctuation=True))
         if len(parts) >= 3:
              # First + Second + Last
-            variations.add(normalize_text(f"{parts[0]} {parts[1]} {parts[-1]}"))
+            variations.add(normalize(f"{parts[0]} {parts[1]} {parts[-1]}", punctuation=True))
             
         mp_map[mp['id']] = {
             'obj': mp,
@@ -45,9 +39,17 @@ def load_mps(filepath):
         }
     return mp_map
 
+def variation_owners(mp_map):
+    """How many MPs share each name variation"""
+    owners = {}
+    for data in mp_map.values():
+        for variation in data['variations']:
+            owners[variation] = owners.get(variation, 0) + 1
+    return owners
+
 def parse_transcript(transcript_path, mp_map):
     with open(transcript_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        raw = f.read()
     
     segments = []
     current_speaker = "Unknown" # Initially unknown or 'Speaker of House'
@@ -57,18 +59,9 @@ def parse_transcript(transcript_path, mp_map):
     # Keywords that often precede or follow a name in a handover
     # invalid_starters = ["بسم", "والصلاة", "شكرا"] 
 
-    full_text = ""
-    for line in lines:
-        # Extract timestamp if present (MM:SS)
-        timestamp_match = re.match(r'\((\d{2}:\d{2})\)', line)
-        line_text = line
-        if timestamp_match:
-            current_line_time = timestamp_match.group(1)
-            line_text = line[timestamp_match.end():].strip()
-        else:
-            current_line_time = None
-        
-        full_text += " " + line_text.strip()
+    # Caption marks (MM:SS) come out of the text but are kept as offset -> time
+    timeline = CaptionTimeline.from_transcript(raw)
+    full_text = timeline.text
     
     # Heuristic splitting based on "Speaker Handover" patterns involves looking for keywords
     # followed by a matching MP name.
@@ -84,7 +77,8 @@ def parse_transcript(transcript_path, mp_map):
     # 2. Filter for those that look like a "call to speak" (e.g. preceded/followed by "تفضل", "الكلمة", "النائب").
     # 3. Use those indices to split the text.
 
-    normalized_full_text = normalize_text(full_text)
+    # offsets maps each normalized character back to full_text
+    normalized_full_text, offsets = normalize(full_text, punctuation=True, offsets=True)
     
     # Find all occurrences of MP names
     matches = []
@@ -95,11 +89,7 @@ def parse_transcript(transcript_path, mp_map):
             # \b is word boundary (might be tricky with non-normalized text, so we search in normalized)
             # But we need original indices.
             
-            # Let's simplify: scan the normalized text, map back to roughly original if possible, 
-            # OR just segment the normalized text for now (User just wants structured data).
-            # Actually, we need the original text for the content.
-            
-            # Regex search in normalized text
+            # Regex search in normalized text, indices mapped back to the original
             pattern = re.escape(name_var)
             for m in re.finditer(pattern, normalized_full_text):
                 # Context check: is it a handover?
@@ -114,32 +104,20 @@ def parse_transcript(transcript_path, mp_map):
                     matches.append({
                         'mp_id': mp_id,
                         'name_found': name_var,
-                        'start_index': m.start(),
-                        'end_index': m.end()
+                        'start_index': int(offsets[m.start()]),
+                        'end_index': int(offsets[m.end() - 1]) + 1
                     })
     
-    # Sort matches by position
-    matches.sort(key=lambda x: x['start_index'])
-    
-    # Deduplicate overlapping matches (longest match wins)
-    unique_matches = []
-    if matches:
-        current_match = matches[0]
-        for next_match in matches[1:]:
-            if next_match['start_index'] < current_match['end_index']:
-                # Overlap
-                if (next_match['end_index'] - next_match['start_index']) > (current_match['end_index'] - current_match['start_index']):
-                    current_match = next_match
-            else:
-                unique_matches.append(current_match)
-                current_match = next_match
-        unique_matches.append(current_match)
+    # Overlapping matches: keep the heaviest non-overlapping set
+    owners = variation_owners(mp_map)
+    chosen = select_intervals([
+        (m['start_index'], m['end_index'], handover_weight(len(m['name_found']), confidence=1 / owners[m['name_found']]))
+        for m in matches
+    ])
+    unique_matches = [matches[i] for i in chosen]
     
     # Now build segments
-    # Note: We are working with indices in 'normalized_full_text', which maps 1:1 to characters 
-    # only if normalization didn't change length.
-    # My normalization removed punctuation, so length changed!
-    # Providing indices for original text is hard with this method.
+    # Note: match indices point into the original full_text.
     
     # ALTERNATIVE: Token-based sliding window over the *original* text words.
     # 1. Tokenize original text.
@@ -157,7 +135,14 @@ def parse_transcript(transcript_path, mp_map):
     
     # Let's try searching for the names in the original text (with loose regex for common Arabic variations).
     
-    return process_with_regex(full_text, mp_map)
+    segments = process_with_regex(full_text, mp_map)
+    if segments:
+        start_times = timeline.time_at([s['start_char'] for s in segments])
+        end_times = timeline.time_at([s['end_char'] for s in segments])
+        for segment, start, end in zip(segments, start_times, end_times):
+            segment['start_sec'] = int(start)
+            segment['end_sec'] = int(round(end))
+    return segments
 
 def process_with_regex(full_text, mp_map):
     segments = []
@@ -220,27 +205,21 @@ def process_with_regex(full_text, mp_map):
                     'name_match': name_var,
                     'start': m.start(),
                     'end': m.end(),
-                    'match_text': m.group()
+                    'match_text': m.group(),
+                    'titled': bool(re.search(titles, m.group()))
                 })
 
-    # Sort and filter
-    found_transitions.sort(key=lambda x: x['start'])
-    
-    # Remove overlapping
     if not found_transitions:
         return []
 
-    unique = []
-    curr = found_transitions[0]
-    for nxt in found_transitions[1:]:
-        if nxt['start'] < curr['end']:
-            # Overlap: keep the one that matches more specific name (longer) or verified keyword
-            if len(nxt['name_match']) > len(curr['name_match']):
-                curr = nxt
-        else:
-            unique.append(curr)
-            curr = nxt
-    unique.append(curr)
+    # Overlapping hand-overs: keep the heaviest non-overlapping set
+    # (longer name, a title, a name variation only one MP has)
+    owners = variation_owners(mp_map)
+    chosen = select_intervals([
+        (t['start'], t['end'], handover_weight(len(t['name_match']), t['titled'], 1 / owners[t['name_match']]))
+        for t in found_transitions
+    ])
+    unique = [found_transitions[i] for i in chosen]
     
     # Now assume text between transitions belongs to the PREVIOUS speaker.
     # First segment: Start to first transition (Speaker of House / Admin)
@@ -306,6 +285,8 @@ if __name__ == "__main__":
         output.append({
             'speaker': name,
             'mp_id': s['speaker_id'],
+            'start_sec': s['start_sec'],
+            'end_sec': s['end_sec'],
             'text': s['text'][:100] + "..." if len(s['text']) > 100 else s['text'] # Preview
         })
         
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF page text extraction
+Extracts the pages of one or more PDFs in parallel on a process pool and
+caches each page's text under .cache/pdf_pages/<file hash>/<page>.txt, so
+re-running on an unchanged file never opens it with pypdf again.
+
+Pages are yielded as soon as they are ready (cached pages first), so
+consumers can start on page 5 of a bill while page 2 is still being
+extracted; extract_text() reassembles a whole document in page order.
+
+    python pdf_pages.py                    # every PDF in public/data/pdfs
+    python pdf_pages.py FILE.pdf ... [--workers N]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+PDF_DIR = 'public/data/pdfs'
+CACHE_DIR = '.cache/pdf_pages'
+CACHE_VERSION = 1
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+@lru_cache(maxsize=8)
+def _reader(path):
+    """One parsed PdfReader per file per worker process"""
+    from pypdf import PdfReader
+    return PdfReader(path)
+
+def _extract_page(path, index):
+    """Worker: text of one page"""
+    return index, _reader(path).pages[index].extract_text() or ""
+
+class PageCache:
+    """Page texts of one PDF, keyed by the file's content hash"""
+
+    def __init__(self, path, cache_dir=CACHE_DIR):
+        self.path = str(path)
+        self.directory = os.path.join(cache_dir, f"{file_hash(path)}-v{CACHE_VERSION}")
+        self.meta_path = os.path.join(self.directory, 'meta.json')
+
+    def page_count(self):
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)['pages']
+        count = len(_reader(self.path).pages)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'source': self.path, 'pages': count}, f, ensure_ascii=False)
+        return count
+
+    def page_path(self, index):
+        return os.path.join(self.directory, f"{index:05d}.txt")
+
+    def get(self, index):
+        try:
+            with open(self.page_path(index), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, index, text):
+        path = self.page_path(index)
+        tmp = path + '.part'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+def iter_pages(paths, workers=None, cache_dir=CACHE_DIR):
+    """
+    Yield (path, page index, text) for every page of the given PDFs.
+    Cached pages come first; the rest are yielded in completion order.
+    """
+    caches = [PageCache(path, cache_dir) for path in paths]
+    missing = []
+    for cache in caches:
+        for index in range(cache.page_count()):
+            text = cache.get(index)
+            if text is None:
+                missing.append((cache, index))
+            else:
+                yield cache.path, index, text
+
+    if not missing:
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_extract_page, cache.path, index): cache for cache, index in missing}
+        for future in as_completed(futures):
+            cache = futures[future]
+            index, text = future.result()
+            cache.put(index, text)
+            yield cache.path, index, text
+
+def extract_text(path, workers=None, cache_dir=CACHE_DIR):
+    """Whole document text, pages joined in order"""
+    pages = {index: text for _, index, text in iter_pages([path], workers, cache_dir)}
+    return "\n".join(pages[index] for index in sorted(pages))
+
+def main():
+    args = sys.argv[1:]
+    workers = None
+    if '--workers' in args:
+        i = args.index('--workers')
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    paths = args or sorted(str(p) for p in Path(PDF_DIR).glob('*.pdf'))
+
+    print("=== PDF Page Extraction ===\n")
+    start = time.time()
+    counts = {}
+    chars = 0
+    for path, _, text in iter_pages(paths, workers):
+        counts[path] = counts.get(path, 0) + 1
+        chars += len(text)
+
+    for path in paths:
+        print(f"  {os.path.basename(path)}: {counts.get(str(path), 0)} pages")
+    print(f"\n{sum(counts.values())} pages, {chars} characters in {time.time() - start:.2f}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Photo -> MP assignment solver
+Scores every document image against every MP by the names written around
+it and solves the optimal one-to-one assignment in one shot, instead of
+taking the first MP with two matching words or trusting image order.
+
+- Candidates come from MPResolver's token index, so only MPs sharing a
+  name token with a block are scored; scores are kept as (row, col,
+  score) entries, never as a dense images x MPs matrix
+- The assignment maximizes the total score (Hungarian method, NumPy) on
+  each connected component of the candidate graph separately, so only
+  small dense blocks are ever built
+- Pairs with a low score or a close runner-up are reported for review
+
+    python photo_assignment.py HTML_FILE [ENCODING]
+"""
+
+import difflib
+import json
+import sys
+from pathlib import Path
+from urllib.parse import unquote
+
+import numpy as np
+
+from html_blocks import text_image_pairs
+from mp_resolver import MPResolver, normalize_name, token_key
+
+MPS_FILE = 'public/data/mps.json'
+
+MIN_SCORE = 0.5        # below this an image is left unassigned
+CONFIDENT_SCORE = 0.8  # below this (or with a close runner-up) a pair is flagged
+MIN_MARGIN = 0.1
+MAX_NAME_TOKENS = 12   # longer blocks are containers, not name lines
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def name_score(text_norm, text_tokens, mp_norm, mp_tokens):
+    """Share of the MP's name tokens found in the text, blended with string similarity"""
+    coverage = len(text_tokens & mp_tokens) / len(mp_tokens)
+    first = 1.0 if mp_norm.split()[0] in text_norm.split() else 0.0
+    ratio = difflib.SequenceMatcher(None, text_norm, mp_norm).ratio()
+    return 0.6 * coverage + 0.2 * first + 0.2 * ratio
+
+def score_matrix(pairs, resolver):
+    """
+    Build the sparse image x MP score matrix from (text, image key) pairs.
+    Several blocks pointing at the same image keep the best score per MP.
+    Returns (image keys, mp ids, {(image row, mp column): score}, texts)
+    where texts[i] is the best scoring block of image i.
+    """
+    mp_ids = [mp['id'] for mp in resolver.mps]
+    column = {mp_id: j for j, mp_id in enumerate(mp_ids)}
+    mp_tokens = {
+        mp_id: {token_key(t) for t in norm.split()}
+        for mp_id, norm in resolver.normalized.items()
+    }
+
+    images, row, texts, best = [], {}, [], []
+    entries = {}
+    for text, image in pairs:
+        norm = normalize_name(text)
+        tokens = {token_key(t) for t in norm.split()}
+        if not tokens or len(tokens) > MAX_NAME_TOKENS:
+            continue
+        candidates = set()
+        for token in tokens:
+            candidates |= resolver.token_index.get(token, set())
+        if not candidates:
+            continue
+
+        if image not in row:
+            row[image] = len(images)
+            images.append(image)
+            texts.append(text)
+            best.append(0.0)
+        i = row[image]
+        for mp_id in candidates:
+            if len(tokens & mp_tokens[mp_id]) < 2:
+                continue
+            score = name_score(norm, tokens, resolver.normalized[mp_id], mp_tokens[mp_id])
+            key = (i, column[mp_id])
+            if score > entries.get(key, 0.0):
+                entries[key] = score
+            if score > best[i]:
+                best[i] = score
+                texts[i] = text
+
+    return images, mp_ids, entries, texts
+
+def components(entries):
+    """Connected components of the candidate graph: [(image rows, mp columns)]"""
+    parent = {}
+
+    def find(node):
+        while parent.setdefault(node, node) != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for i, j in entries:
+        parent[find(('image', i))] = find(('mp', j))
+    groups = {}
+    for node in list(parent):
+        rows, cols = groups.setdefault(find(node), ([], []))
+        (rows if node[0] == 'image' else cols).append(node[1])
+    return [(sorted(rows), sorted(cols)) for rows, cols in groups.values()]
+
+def linear_sum_assignment(cost):
+    """
+    Minimum-cost one-to-one assignment of a rectangular cost matrix
+    (shortest augmenting paths, O(n^2 m)). Returns (rows, cols).
+    """
+    cost = np.asarray(cost, dtype=float)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    match = np.zeros(m + 1, dtype=int)   # match[j] = row (1-based) assigned to column j
+    way = np.zeros(m + 1, dtype=int)
+
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            u[match[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    rows, cols = [], []
+    for j in range(1, m + 1):
+        if match[j]:
+            rows.append(match[j] - 1)
+            cols.append(j - 1)
+    rows, cols = np.array(rows, dtype=int), np.array(cols, dtype=int)
+    if transposed:
+        rows, cols = cols, rows
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+def assign_photos(pairs, mps, min_score=MIN_SCORE):
+    """
+    One global assignment of document images to MPs.
+    Returns (assignments, unassigned mp ids) where each assignment is
+    {'mpId', 'image', 'text', 'score', 'runnerUp', 'confident'}.
+    """
+    resolver = MPResolver(mps)
+    images, mp_ids, entries, texts = score_matrix(pairs, resolver)
+    if not images:
+        return [], [mp['id'] for mp in mps]
+
+    by_image, by_mp = {}, {}
+    for (i, j), score in entries.items():
+        by_image.setdefault(i, []).append((score, j))
+        by_mp.setdefault(j, []).append((score, i))
+
+    matched = []
+    for rows, cols in components(entries):
+        block = np.zeros((len(rows), len(cols)))
+        col_of = {j: c for c, j in enumerate(cols)}
+        for r, i in enumerate(rows):
+            for score, j in by_image[i]:
+                block[r, col_of[j]] = score
+        matched.extend((rows[r], cols[c]) for r, c in zip(*linear_sum_assignment(-block)))
+
+    assignments = []
+    for i, j in sorted(matched):
+        score = entries.get((i, j), 0.0)
+        if score < min_score:
+            continue
+        # Best alternative for this image or for this MP
+        runner_up = max(
+            max((s for s, other in by_image[i] if other != j), default=0.0),
+            max((s for s, other in by_mp[j] if other != i), default=0.0),
+        )
+        assignments.append({
+            'mpId': mp_ids[j],
+            'image': images[i],
+            'text': texts[i],
+            'score': round(score, 3),
+            'runnerUp': round(float(runner_up), 3),
+            'confident': score >= CONFIDENT_SCORE and score - runner_up >= MIN_MARGIN,
+        })
+
+    assigned = {a['mpId'] for a in assignments}
+    return assignments, [mp_id for mp_id in mp_ids if mp_id not in assigned]
+
+def image_file_name(src):
+    """'MPs%20pics_files/image002.jpg' -> 'image002.jpg'"""
+    return Path(unquote(src)).name
+
+def assign_from_html(html_path, mps, encoding='utf-8', tags=('p', 'div', 'span', 'h1', 'h2', 'h3')):
+    """Assignment for a document export; image keys are file names"""
+    pairs = [
+        (text, image_file_name(image['src']))
+        for text, image in text_image_pairs(html_path, encoding, tags=set(tags))
+        if image['src']
+    ]
+    return assign_photos(pairs, mps)
+
+def print_report(assignments, unassigned, limit=20):
+    low = [a for a in assignments if not a['confident']]
+    print(f"Assigned: {len(assignments)}")
+    print(f"Low confidence: {len(low)}")
+    for a in low[:limit]:
+        print(f"  [?] {a['mpId']} <- {a['image']} (score {a['score']}, runner-up {a['runnerUp']}): {a['text'][:40]}")
+    if unassigned:
+        print(f"Unassigned MPs ({len(unassigned)}): {unassigned[:10]}")
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python photo_assignment.py HTML_FILE [ENCODING]")
+        return
+    encoding = sys.argv[2] if len(sys.argv) > 2 else 'utf-8'
+    mps = load_json(MPS_FILE)
+    assignments, unassigned = assign_from_html(sys.argv[1], mps, encoding)
+    print_report(assignments, unassigned)
+
+if __name__ == '__main__':
+    main()
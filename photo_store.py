@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed MP photo store
+Copies every MP portrait into public/images/store/<sha256 prefix>.jpg
+(one file per distinct image, however many MPs or copies point at it),
+points photoUrl at it and keeps public/data/photo_store.json:
+
+    blobs: key -> url, sha256, size, dimensions, dHash, pHash
+    mps:   mp_id -> key
+
+A perceptual-hash index (dHash + pHash computed with NumPy) is compared
+across the whole set in one pass to flag identical and near-identical
+portraits assigned to different MPs. --scan DIR also checks loose copies
+(backup_mp_photos, temp_mp_photos, ...) named mp_XXX against the store and
+reports files that look like a different MP.
+
+The store is the only tracked copy of a portrait: downloads are staged
+as public/images/mps/mp_XXX.jpg (git-ignored) and ingested from there
+(publish(), called by every script that stages photos), and
+image_pipeline.py builds its variants from the store.
+
+    python photo_store.py                      # ingest + duplicate report
+    python photo_store.py --scan backup_mp_photos
+    python photo_store.py --gc                 # drop unreferenced blobs
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+MPS_FILE = 'public/data/mps.json'
+INDEX_FILE = 'public/data/photo_store.json'
+SOURCE_DIR = Path('public/images/mps')
+STORE_DIR = Path('public/images/store')
+PUBLIC_ROOT = Path('public')
+
+KEY_LENGTH = 16
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+# Hamming distance (out of 64 bits) under which two portraits are "the same photo"
+DHASH_THRESHOLD = 6
+PHASH_THRESHOLD = 10
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _bits_to_int(bits):
+    return int(''.join('1' if b else '0' for b in bits.ravel()), 2)
+
+def _dct_matrix(n):
+    k = np.arange(n)
+    matrix = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n))
+    matrix[0] /= np.sqrt(2)
+    return matrix * np.sqrt(2 / n)
+
+DCT_32 = _dct_matrix(32)
+
+def perceptual_hashes(path):
+    """(dHash, pHash) of an image as 64-bit ints"""
+    with Image.open(path) as img:
+        gray = img.convert('L')
+        small = np.asarray(gray.resize((9, 8), Image.LANCZOS), dtype=np.int16)
+        big = np.asarray(gray.resize((32, 32), Image.LANCZOS), dtype=np.float64)
+
+    dhash = _bits_to_int(small[:, 1:] > small[:, :-1])
+
+    low = (DCT_32 @ big @ DCT_32.T)[:8, :8].ravel()
+    phash = _bits_to_int(low > np.median(low[1:]))
+    return dhash, phash
+
+def popcount64(arr):
+    return np.unpackbits(arr.view(np.uint8).reshape(arr.shape + (8,)), axis=-1).sum(axis=-1)
+
+def hamming_matrix(values):
+    """Pairwise Hamming distances of a list of 64-bit ints, as an NxN array"""
+    arr = np.array(values, dtype=np.uint64)
+    return popcount64(arr[:, None] ^ arr[None, :])
+
+class PhotoStore:
+    def __init__(self, index=None, store_dir=STORE_DIR, index_file=INDEX_FILE):
+        self.index = index or {'blobs': {}, 'mps': {}}
+        self.store_dir = Path(store_dir)
+        self.index_file = index_file
+        self.by_sha = {blob['sha256']: key for key, blob in self.index['blobs'].items()}
+
+    @classmethod
+    def load(cls, index_file=INDEX_FILE, **kwargs):
+        index = load_json(index_file) if os.path.exists(index_file) else None
+        return cls(index, index_file=index_file, **kwargs)
+
+    def save(self):
+        self.index['blobs'] = dict(sorted(self.index['blobs'].items()))
+        self.index['mps'] = dict(sorted(self.index['mps'].items()))
+        save_json(self.index_file, self.index)
+
+    def put(self, path):
+        """Add an image file to the store (no-op if its content is already there), return its key"""
+        path = Path(path)
+        sha = sha256_file(path)
+        if sha in self.by_sha:
+            key = self.by_sha[sha]
+            if (PUBLIC_ROOT / self.index['blobs'][key]['url'].lstrip('/')).exists():
+                return key
+
+        key = sha[:KEY_LENGTH]
+        ext = '.jpg' if path.suffix.lower() in ('.jpg', '.jpeg') else path.suffix.lower()
+        target = self.store_dir / f"{key}{ext}"
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        if not target.exists():
+            tmp = target.with_name(target.name + '.part')
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, target)
+
+        with Image.open(target) as img:
+            width, height = img.size
+        dhash, phash = perceptual_hashes(target)
+        self.index['blobs'][key] = {
+            'url': '/' + target.relative_to(PUBLIC_ROOT).as_posix(),
+            'sha256': sha,
+            'bytes': target.stat().st_size,
+            'width': width,
+            'height': height,
+            'dhash': f"{dhash:016x}",
+            'phash': f"{phash:016x}",
+        }
+        self.by_sha[sha] = key
+        return key
+
+    def ingest(self, mps, source_dir=SOURCE_DIR):
+        """Store each MP's portrait and point photoUrl at it; return number of MPs changed"""
+        changed = 0
+        for mp in mps:
+            source = Path(source_dir) / f"{mp['id']}.jpg"
+            if not source.exists():
+                continue
+            key = self.put(source)
+            self.index['mps'][mp['id']] = key
+            url = self.index['blobs'][key]['url']
+            if mp.get('photoUrl') != url:
+                mp['photoUrl'] = url
+                changed += 1
+        return changed
+
+    def gc(self):
+        """Delete blobs no MP points at, return their keys"""
+        used = set(self.index['mps'].values())
+        removed = []
+        for key in list(self.index['blobs']):
+            if key not in used:
+                blob = self.index['blobs'].pop(key)
+                self.by_sha.pop(blob['sha256'], None)
+                path = PUBLIC_ROOT / blob['url'].lstrip('/')
+                if path.exists():
+                    path.unlink()
+                removed.append(key)
+        return removed
+
+    def hash_arrays(self):
+        """(mp ids, dHash list, pHash list) in index order"""
+        mp_ids = sorted(self.index['mps'])
+        blobs = [self.index['blobs'][self.index['mps'][mp_id]] for mp_id in mp_ids]
+        return (
+            mp_ids,
+            [int(b['dhash'], 16) for b in blobs],
+            [int(b['phash'], 16) for b in blobs],
+        )
+
+    def duplicates(self, dhash_threshold=DHASH_THRESHOLD, phash_threshold=PHASH_THRESHOLD):
+        """
+        Pairs of MPs with the same or a near-identical portrait:
+        [(mp_a, mp_b, 'identical' | 'near', dhash distance, phash distance)]
+        """
+        mp_ids, dhashes, phashes = self.hash_arrays()
+        if len(mp_ids) < 2:
+            return []
+        d = hamming_matrix(dhashes)
+        p = hamming_matrix(phashes)
+        close = (d <= dhash_threshold) & (p <= phash_threshold)
+        pairs = []
+        for i, j in zip(*np.nonzero(np.triu(close, k=1))):
+            a, b = mp_ids[i], mp_ids[j]
+            kind = 'identical' if self.index['mps'][a] == self.index['mps'][b] else 'near'
+            pairs.append((a, b, kind, int(d[i, j]), int(p[i, j])))
+        return pairs
+
+    def check_files(self, paths, dhash_threshold=DHASH_THRESHOLD, phash_threshold=PHASH_THRESHOLD):
+        """
+        Match loose image files against the store. Returns
+        [(path, claimed mp_id or None, best mp_id, dhash distance, phash distance)]
+        for files whose closest stored portrait is within the thresholds.
+        """
+        mp_ids, dhashes, phashes = self.hash_arrays()
+        if not mp_ids:
+            return []
+        stored_d = np.array(dhashes, dtype=np.uint64)
+        stored_p = np.array(phashes, dtype=np.uint64)
+
+        results = []
+        for path in paths:
+            try:
+                dhash, phash = perceptual_hashes(path)
+            except OSError:
+                continue
+            d = popcount64(stored_d ^ np.uint64(dhash))
+            p = popcount64(stored_p ^ np.uint64(phash))
+            best = int(np.argmin(d + p))
+            if d[best] <= dhash_threshold and p[best] <= phash_threshold:
+                claimed = re.search(r'mp_\d{3}', Path(path).name)
+                results.append((str(path), claimed.group(0) if claimed else None,
+                                mp_ids[best], int(d[best]), int(p[best])))
+        return results
+
+def publish(mps, mps_file=MPS_FILE):
+    """
+    Ingest the portraits staged in SOURCE_DIR, point photoUrl at the store
+    and save the index and mps.json; every photo script ends with this.
+    Returns the number of MPs whose photoUrl changed.
+    """
+    store = PhotoStore.load()
+    changed = store.ingest(mps)
+    store.save()
+    if changed:
+        save_json(mps_file, mps)
+    return changed
+
+def iter_images(directory):
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                yield Path(root) / name
+
+def main():
+    args = sys.argv[1:]
+    scan_dirs = [args[i + 1] for i, a in enumerate(args) if a == '--scan' and i + 1 < len(args)]
+
+    print("=== MP Photo Store ===\n")
+    mps = load_json(MPS_FILE)
+    store = PhotoStore.load()
+    changed = store.ingest(mps)
+
+    if '--gc' in args:
+        removed = store.gc()
+        print(f"Removed {len(removed)} unreferenced blobs")
+
+    store.save()
+    if changed:
+        save_json(MPS_FILE, mps)
+
+    print(f"MPs in store: {len(store.index['mps'])}")
+    print(f"Distinct images: {len(store.index['blobs'])}")
+    print(f"photoUrl updated for {changed} MPs")
+
+    pairs = store.duplicates()
+    print(f"\nDuplicate / near-duplicate portraits: {len(pairs)}")
+    for a, b, kind, d, p in pairs:
+        print(f"  [{kind}] {a} ~ {b} (dHash {d}, pHash {p})")
+
+    for directory in scan_dirs:
+        results = store.check_files(iter_images(directory))
+        mismatched = [r for r in results if r[1] and r[1] != r[2]]
+        print(f"\n{directory}: {len(results)} files match a stored portrait, {len(mismatched)} look like another MP")
+        for path, claimed, best, d, p in mismatched:
+            print(f"  {path}: named {claimed}, looks like {best} (dHash {d}, pHash {p})")
+
+    print(f"\nSaved to {INDEX_FILE}")
+
+if __name__ == '__main__':
+    main()
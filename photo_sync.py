@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MP photo sync
+Fetches RepresentativeImages/{rep_id}.jpg for every MP through one pooled
+HTTP session and a bounded thread pool.
+
+- Requests are conditional (If-None-Match / If-Modified-Since), so an
+  unchanged portrait costs a 304 and no download
+- Per-photo state (RepresentativeID, ETag, Last-Modified, hash) lives in
+  .cache/photo_sync/state.json (not committed) and is flushed while the
+  run progresses; an interrupted run picks up where it stopped
+- MPs without a known RepresentativeID get the sequential guess; --probe
+  also tries the other offsets the old scripts used (skipping IDs already
+  claimed by another MP), and the ID that answers is remembered
+
+    python photo_sync.py                       # sync all MPs
+    python photo_sync.py --restart             # ignore an interrupted run
+    python photo_sync.py --probe               # guess IDs of missing MPs harder
+    python photo_sync.py --serve DIR [PORT]    # offline fixture server
+    python photo_sync.py --base-url http://127.0.0.1:8765
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from photo_store import publish
+
+MPS_FILE = 'public/data/mps.json'
+STATE_FILE = '.cache/photo_sync/state.json'
+IMAGES_DIR = Path('public/images/mps')
+
+BASE_URL = "https://www.representatives.jo"
+PHOTO_PATH = "/RepresentativeImages/{rep_id}.jpg"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# RepresentativeID of mp_001; the council's IDs are mostly sequential from here
+FIRST_REP_ID = 2076
+MIN_PHOTO_BYTES = 1000
+WORKERS = 16
+TIMEOUT = (5, 15)
+FLUSH_EVERY = 10
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    tmp = f"{filepath}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, filepath)
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+def make_session(workers=WORKERS):
+    """One keep-alive session whose pool is sized for the worker count"""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=('GET', 'HEAD'))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+def rep_id_guesses(mp_num, probe=False):
+    """Candidate RepresentativeIDs for an MP without a known one"""
+    guesses = [FIRST_REP_ID + (mp_num - 1)]  # sequential
+    if probe:
+        guesses += [
+            2163 + (mp_num - 88),  # after the gap in the second half
+            2100 + mp_num,
+            2000 + mp_num,
+        ]
+    seen = set()
+    return [g for g in guesses if g > 0 and not (g in seen or seen.add(g))]
+
+class PhotoSync:
+    def __init__(self, mps, state=None, base_url=BASE_URL, images_dir=IMAGES_DIR,
+                 workers=WORKERS, state_file=STATE_FILE, probe=False):
+        self.mps = mps
+        self.state = state or {'run': {}, 'photos': {}}
+        self.state.setdefault('photos', {})
+        self.base_url = base_url.rstrip('/')
+        self.images_dir = Path(images_dir)
+        self.workers = workers
+        self.state_file = state_file
+        self.probe = probe
+        self.session = make_session(workers)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, mps, state_file=STATE_FILE, **kwargs):
+        state = load_json(state_file) if os.path.exists(state_file) else None
+        return cls(mps, state, state_file=state_file, **kwargs)
+
+    def photo_url(self, rep_id):
+        return self.base_url + PHOTO_PATH.format(rep_id=rep_id)
+
+    def fetch(self, mp_id, rep_id, entry):
+        """
+        Conditional GET of one portrait.
+        Returns 'updated', 'unchanged' or 'missing'.
+        """
+        path = self.images_dir / f"{mp_id}.jpg"
+        headers = {}
+        if path.exists() and entry.get('repId') == rep_id:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('lastModified'):
+                headers['If-Modified-Since'] = entry['lastModified']
+
+        response = self.session.get(self.photo_url(rep_id), headers=headers, timeout=TIMEOUT)
+        if response.status_code == 304:
+            return 'unchanged'
+        if response.status_code != 200 or len(response.content) < MIN_PHOTO_BYTES:
+            return 'missing'
+
+        content = response.content
+        sha1 = hashlib.sha1(content).hexdigest()
+        if sha1 != entry.get('sha1') or not path.exists():
+            tmp = path.with_suffix('.jpg.part')
+            tmp.write_bytes(content)
+            os.replace(tmp, path)
+            status = 'updated'
+        else:
+            status = 'unchanged'
+
+        entry.update({
+            'repId': rep_id,
+            'etag': response.headers.get('ETag'),
+            'lastModified': response.headers.get('Last-Modified'),
+            'sha1': sha1,
+            'bytes': len(content),
+        })
+        return status
+
+    def sync_one(self, mp):
+        mp_id = mp['id']
+        entry = dict(self.state['photos'].get(mp_id, {}))
+        known = entry.get('repId')
+        if known:
+            candidates = [known]
+        else:
+            with self.lock:
+                claimed = {e.get('repId') for other, e in self.state['photos'].items() if other != mp_id}
+            candidates = [r for r in rep_id_guesses(int(mp_id.split('_')[1]), self.probe) if r not in claimed]
+
+        status = 'missing'
+        for rep_id in candidates:
+            try:
+                status = self.fetch(mp_id, rep_id, entry)
+            except requests.RequestException as e:
+                entry['error'] = str(e)
+                status = 'error'
+                break
+            if status != 'missing':
+                entry.pop('error', None)
+                break
+
+        entry['status'] = status
+        entry['checkedAt'] = now_iso()
+        return mp_id, entry
+
+    def pending(self, restart=False):
+        """MPs still to check; an interrupted run skips what it already did"""
+        run = self.state.get('run', {})
+        if restart or run.get('complete', True) or not run.get('startedAt'):
+            self.state['run'] = {'startedAt': now_iso(), 'complete': False}
+            return list(self.mps)
+        started = run['startedAt']
+        return [
+            mp for mp in self.mps
+            if self.state['photos'].get(mp['id'], {}).get('checkedAt', '') < started
+            or self.state['photos'][mp['id']].get('status') == 'error'
+        ]
+
+    def flush(self):
+        with self.lock:
+            save_json(self.state_file, self.state)
+
+    def run(self, restart=False, progress=None):
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+        todo = self.pending(restart)
+        self.flush()
+
+        counts = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(self.sync_one, mp) for mp in todo]
+            for done, future in enumerate(as_completed(futures), start=1):
+                mp_id, entry = future.result()
+                with self.lock:
+                    self.state['photos'][mp_id] = entry
+                counts[entry['status']] = counts.get(entry['status'], 0) + 1
+                if progress:
+                    progress(done, len(todo), mp_id, entry)
+                if done % FLUSH_EVERY == 0:
+                    self.flush()
+
+        self.state['run']['complete'] = True
+        self.state['run']['finishedAt'] = now_iso()
+        self.flush()
+        return counts
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """
+    Serves DIR/{rep_id}.jpg at /RepresentativeImages/{rep_id}.jpg with
+    ETag / Last-Modified and 304 answers, like the parliament site
+    """
+    directory = '.'
+
+    def do_GET(self):
+        name = self.path.split('?', 1)[0].rsplit('/', 1)[-1]
+        path = Path(self.directory) / name
+        if not self.path.startswith('/RepresentativeImages/') or not path.is_file():
+            self.send_error(404)
+            return
+
+        stat = path.stat()
+        etag = f'"{stat.st_size:x}-{int(stat.st_mtime):x}"'
+        last_modified = formatdate(int(stat.st_mtime), usegmt=True)
+
+        not_modified = self.headers.get('If-None-Match') == etag
+        since = self.headers.get('If-Modified-Since')
+        if since and not self.headers.get('If-None-Match'):
+            try:
+                not_modified = int(stat.st_mtime) <= parsedate_to_datetime(since).timestamp()
+            except (TypeError, ValueError):
+                pass
+
+        if not_modified:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        body = path.read_bytes()
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/jpeg')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def serve_fixtures(directory, port=8765):
+    """Start the fixture server in a background thread and return it"""
+    handler = type('Handler', (FixtureHandler,), {'directory': str(directory)})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    args = sys.argv[1:]
+
+    if '--serve' in args:
+        i = args.index('--serve')
+        directory = args[i + 1]
+        port = int(args[i + 2]) if len(args) > i + 2 else 8765
+        server = serve_fixtures(directory, port)
+        print(f"Serving {directory} at http://127.0.0.1:{port}/RepresentativeImages/ (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+        return
+
+    base_url = args[args.index('--base-url') + 1] if '--base-url' in args else BASE_URL
+
+    print("=== MP Photo Sync ===\n")
+    mps = load_json(MPS_FILE)
+    sync = PhotoSync.load(mps, base_url=base_url, probe='--probe' in args)
+
+    def progress(done, total, mp_id, entry):
+        print(f"[{done}/{total}] {mp_id}: {entry['status']} (RepID {entry.get('repId')})")
+
+    started = datetime.now()
+    counts = sync.run(restart='--restart' in args, progress=progress)
+    elapsed = (datetime.now() - started).total_seconds()
+
+    # Synced files are staged in public/images/mps; photoUrl points at the store copy
+    changed = publish(mps, MPS_FILE)
+
+    print(f"\n=== RESULTS ({elapsed:.1f}s) ===")
+    for status in ('updated', 'unchanged', 'missing', 'error'):
+        print(f"{status}: {counts.get(status, 0)}")
+    print(f"photoUrl updated for {changed} MPs")
+    missing = [mp_id for mp_id, e in sync.state['photos'].items() if e.get('status') in ('missing', 'error')]
+    if missing:
+        print(f"Still missing: {missing[:10]}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Multi-phrase matcher (Aho-Corasick)
+Compiles a list of phrases into one automaton so a text is scanned once,
+whatever the number of phrases, and every occurrence is reported with
+the payload attached to its phrase.
+"""
+
+from collections import deque
+
+class PhraseAutomaton:
+    """
+    Usage:
+        automaton = PhraseAutomaton()
+        automaton.add("الميثاق", payload)
+        automaton.build()
+        for start, end, payload in automaton.finditer(text): ...
+    """
+
+    def __init__(self, phrases=None):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        self.built = False
+        for phrase, payload in (phrases or []):
+            self.add(phrase, payload)
+        if phrases:
+            self.build()
+
+    def __len__(self):
+        return sum(len(out) for out in self.output)
+
+    def add(self, phrase, payload=None):
+        if not phrase:
+            return
+        state = 0
+        for char in phrase:
+            nxt = self.goto[state].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = nxt
+        self.output[state].append((len(phrase), payload))
+        self.built = False
+
+    def build(self):
+        """Compute failure links (breadth-first) and merge outputs along them"""
+        queue = deque()
+        for state in self.goto[0].values():
+            self.fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+        self.built = True
+        return self
+
+    def finditer(self, text):
+        """Yield (start, end, payload) for every (possibly overlapping) occurrence"""
+        if not self.built:
+            self.build()
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, payload in output[state]:
+                yield i + 1 - length, i + 1, payload
+
+    def findall(self, text):
+        return list(self.finditer(text))
@@ -16,6 +16,8 @@ from PIL import Image
 import hashlib
 import shutil
 
+from image_pipeline import convert_to_jpg
+
 # تفعيل دعم UTF-8 في Windows
 if sys.platform == 'win32':
     import codecs
@@ -44,23 +46,6 @@ def find_all_images():
         images.extend(TEMP_PHOTOS_DIR.rglob(ext))
     return sorted(images)
 
-def convert_to_jpg(image_path, output_path, quality=85):
-    """تحويل الصورة إلى JPG مع ضغط مناسب"""
-    with Image.open(image_path) as img:
-        # تحويل إلى RGB إذا كانت PNG مع شفافية
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        # حفظ كـ JPG
-        img.save(output_path, 'JPEG', quality=quality, optimize=True)
-        return output_path
-
 def main():
     print("=" * 60)
     print("         تحديث صور النواب - Jordan Parliament Monitor")
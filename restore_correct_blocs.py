@@ -6,7 +6,9 @@ Match by MP name and assign to correct bloc
 """
 
 import json
-import re
+
+from bloc_rules import BlocRules, print_counts
+from mp_resolver import normalize_name
 
 def load_mps():
     with open('public/data/mps.json', 'r', encoding='utf-8') as f:
@@ -16,14 +18,6 @@ def save_mps(mps):
     with open('public/data/mps.json', 'w', encoding='utf-8') as f:
         json.dump(mps, f, ensure_ascii=False, indent=2)
 
-def normalize_name(name):
-    """Normalize name for matching"""
-    # Remove extra spaces
-    name = ' '.join(name.split())
-    # Remove common prefixes
-    name = name.replace('سعادة السيد', '').replace('سعادة النائب', '').strip()
-    return name
-
 # Correct bloc memberships from user
 CORRECT_BLOCS = {
     "كتلة اتحاد الأحزاب الوسطية والوطني الإسلامي": [
@@ -201,10 +195,12 @@ def main():
     print("=== Restoring Correct Bloc Memberships ===\n")
     
     mps = load_mps()
+    rules = BlocRules.load()
     changes = []
     notfound = []
     
     for bloc_name, member_names in CORRECT_BLOCS.items():
+        bloc_name = rules.canonical_bloc(bloc_name, 'ordinary_2')
         print(f"\nProcessing: {bloc_name} ({len(member_names)} members)")
         
         for member_name in member_names:
@@ -236,40 +232,8 @@ def main():
         for name in notfound[:10]:
             print(f"  - {name}")
     
-    # Verify
-    from collections import Counter
-    blocs = []
-    for mp in mps:
-        if mp.get('memberships'):
-            for mem in mp['memberships']:
-                if mem['session'] == 'ordinary_2':
-                    blocs.append(mem.get('bloc', 'Unknown'))
-                    break
-    
-    counts = Counter(blocs)
-    
-    print("\n=== Final Verification ===")
-    expected = {
-        "كتلة اتحاد الأحزاب الوسطية والوطني الإسلامي": 26,
-        "كتلة حزب مبادرة النيابية": 23,
-        "كتلة جبهة العمل الإسلامي": 31,
-        "كتلة حزب عزم": 20,
-        "كتلة حزب الميثاق الوطني": 35,
-        "النواب المستقلون": 3
-    }
-    
-    all_correct = True
-    for bloc, exp in expected.items():
-        actual = counts.get(bloc, 0)
-        status = "OK" if actual == exp else "WRONG"
-        print(f"[{status}] {bloc[:40]}: {actual}/{exp}")
-        if status != "OK":
-            all_correct = False
-    
-    if all_correct:
-        print("\n[SUCCESS] All blocs restored correctly!")
-    else:
-        print("\n[WARNING] Some mismatches remain")
+    # Verify against totalSeats in blocs.json
+    print_counts(mps)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time-indexed segment lookup
+Answers "which segment / speaker is on screen at t seconds" for the video
+player without scanning a session's segments.
+
+Segments are sorted by videoTimestamp into columnar arrays (starts, ends)
+and nested into a containment list (NCList): segments that lie inside
+another one (a chair segment spanning many interventions) go into that
+segment's sublist, so within each list both starts and ends increase. A
+query binary-searches the top list for the segments overlapping t, then
+only the sublists of those hits: O((k + 1) log n) for k results, however
+long the enclosing segments are.
+
+Each session with timed segments gets public/data/segment_index/<id>.json
+(same arrays, speakers dictionary-encoded) which the frontend binary-searches
+the same way, and sessions.json gets a segmentIndexUrl.
+
+    python segment_index.py                 # export all sessions
+    python segment_index.py SESSION_ID T    # who is speaking at T seconds
+"""
+
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+SESSIONS_FILE = 'public/data/sessions.json'
+INDEX_DIR = Path('public/data/segment_index')
+PUBLIC_ROOT = 'public'
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+class SegmentIndex:
+    """Sorted start/end arrays over a session's segments"""
+
+    def __init__(self, starts, ends, ids, speakers, speaker_of):
+        self.starts = starts
+        self.ends = ends
+        self.ids = ids
+        self.speakers = speakers
+        self.speaker_of = speaker_of
+        self.order, self.list_start, self.children = self.nest(starts, ends)
+        # starts / ends in list order, for bisect within one list
+        self.order_starts = [starts[p] for p in self.order]
+        self.order_ends = [ends[p] for p in self.order]
+
+    @staticmethod
+    def nest(starts, ends):
+        """
+        Containment lists over the positions: (order, list_start, children).
+        List l holds order[list_start[l]:list_start[l + 1]], sorted by start
+        with strictly increasing ends; list 0 is the top level and
+        children[p] is the list of the segments inside p (-1 if none).
+        """
+        lists, children, stack = [[]], [-1] * len(starts), []
+        for p in sorted(range(len(starts)), key=lambda p: (starts[p], -ends[p], p)):
+            while stack and ends[stack[-1]] < ends[p]:
+                stack.pop()
+            if stack:
+                parent = stack[-1]
+                if children[parent] == -1:
+                    children[parent] = len(lists)
+                    lists.append([])
+                lists[children[parent]].append(p)
+            else:
+                lists[0].append(p)
+            stack.append(p)
+
+        order, list_start = [], []
+        for members in lists:
+            list_start.append(len(order))
+            order.extend(members)
+        list_start.append(len(order))
+        return order, list_start, children
+
+    @classmethod
+    def from_segments(cls, segments):
+        """
+        Build from segments carrying videoTimestamp (and optionally
+        videoEndTimestamp; otherwise a segment runs until the next one starts).
+        Segments without a timestamp are skipped.
+        """
+        timed = sorted(
+            (s for s in segments if isinstance(s.get('videoTimestamp'), (int, float))),
+            key=lambda s: s['videoTimestamp'],
+        )
+        starts = [s['videoTimestamp'] for s in timed]
+        ends = []
+        for index, segment in enumerate(timed):
+            end = segment.get('videoEndTimestamp')
+            if end is None:
+                end = starts[index + 1] if index + 1 < len(starts) else float('inf')
+            ends.append(max(end, starts[index]))
+
+        speakers, speaker_of, position = [], [], {}
+        for segment in timed:
+            key = (segment.get('speakerId') or '', segment.get('speakerName') or '')
+            if key not in position:
+                position[key] = len(speakers)
+                speakers.append({'id': key[0] or None, 'name': key[1]})
+            speaker_of.append(position[key])
+        ids = [s.get('id') or s.get('segmentId') or str(i) for i, s in enumerate(timed)]
+        return cls(starts, ends, ids, speakers, speaker_of)
+
+    @classmethod
+    def from_json(cls, data):
+        ends = [float('inf') if e is None else e for e in data['ends']]
+        return cls(data['starts'], ends, data['ids'], data['speakers'], data['speakerOf'])
+
+    def to_json(self, session_id):
+        return {
+            'sessionId': session_id,
+            'starts': self.starts,
+            'ends': [None if e == float('inf') else e for e in self.ends],
+            'nest': {'order': self.order, 'listStart': self.list_start, 'children': self.children},
+            'ids': self.ids,
+            'speakers': self.speakers,
+            'speakerOf': self.speaker_of,
+        }
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _overlapping(self, t0, t1, seek):
+        """Positions with end > t0 and a start found by seek(starts, t1, lo, hi)"""
+        found, lists = [], [0] if self.order else []
+        while lists:
+            l = lists.pop()
+            lo, hi = self.list_start[l], self.list_start[l + 1]
+            first = bisect_right(self.order_ends, t0, lo, hi)
+            for k in range(first, seek(self.order_starts, t1, first, hi)):
+                position = self.order[k]
+                found.append(position)
+                if self.children[position] != -1:
+                    lists.append(self.children[position])
+        return sorted(found)
+
+    def at(self, t):
+        """Positions of the segments playing at t, earliest start first"""
+        return self._overlapping(t, t, bisect_right)
+
+    def between(self, t0, t1):
+        """Positions of the segments overlapping [t0, t1), e.g. a scrub preview"""
+        return self._overlapping(t0, t1, bisect_left)
+
+    def segment(self, position):
+        return {
+            'id': self.ids[position],
+            'start': self.starts[position],
+            'end': self.ends[position],
+            'speaker': self.speakers[self.speaker_of[position]],
+        }
+
+    def speaker_at(self, t):
+        """Speaker of the latest-starting segment at t, or None"""
+        positions = self.at(t)
+        return self.segment(positions[-1])['speaker'] if positions else None
+
+def index_path(session_id, out_dir=INDEX_DIR):
+    return Path(out_dir) / f"{session_id}.json"
+
+def index_url(path):
+    """Site URL of an index under public/, else its path (exports outside the site)"""
+    path = Path(path)
+    if path.is_relative_to(PUBLIC_ROOT):
+        return '/' + path.relative_to(PUBLIC_ROOT).as_posix()
+    return path.as_posix()
+
+def export_indexes(sessions, out_dir=INDEX_DIR):
+    """Write one index per session with timed segments and set segmentIndexUrl"""
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    written = []
+    for session in sessions:
+        index = SegmentIndex.from_segments(session.get('segments') or [])
+        path = index_path(session['id'], out_dir)
+        if not len(index):
+            session.pop('segmentIndexUrl', None)
+            if path.exists():
+                path.unlink()
+            continue
+        save_json(path, index.to_json(session['id']))
+        session['segmentIndexUrl'] = index_url(path)
+        written.append((session['id'], len(index)))
+    return written
+
+def load_index(session_id, out_dir=INDEX_DIR):
+    path = index_path(session_id, out_dir)
+    return SegmentIndex.from_json(load_json(path)) if path.exists() else None
+
+def main():
+    if len(sys.argv) == 3:
+        index = load_index(sys.argv[1])
+        if index is None:
+            print(f"No segment index for {sys.argv[1]}")
+            return
+        t = float(sys.argv[2])
+        for position in index.at(t):
+            segment = index.segment(position)
+            print(f"{segment['id']}: {segment['speaker']['name']} ({segment['start']}s - {segment['end']}s)")
+        return
+
+    print("=== Segment Time Index ===\n")
+    sessions = load_json(SESSIONS_FILE)
+    written = export_indexes(sessions)
+    for session_id, count in written:
+        print(f"  {session_id}: {count} segments")
+    print(f"Indexed sessions: {len(written)}")
+    save_json(SESSIONS_FILE, sessions)
+    print(f"\nSaved to {INDEX_DIR}/")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentence and clause splitter
+Cuts Arabic text into sentence (or clause) units as (start, end) offset
+spans, yielded lazily, so callers slice only the units they keep.
+
+One compiled alternation is scanned once over the text. It matches:
+- terminators: . ! ? ؟ ؛ … bullets and line breaks (not a decimal point
+  and not the dot of a one-letter abbreviation such as "د.", but the
+  full stop after a number, as in "المادة 5.")
+- clause marks: ، , : (only with clauses=True)
+- discourse markers of the captions, which have no punctuation at all:
+  "شكرا", "بسم الله", "السلام عليكم" open a new sentence, and
+  "تفضل/تفضلي/تفضلوا" and "...وبركاته" close one
+
+Markers are written in normalized form (as arabic_text.normalize
+returns them) and compiled to patterns that also accept the original
+spellings, diacritics and tatweel.
+
+    for start, end in spans(text): text[start:end]
+
+    sentences("قال د. أحمد إن النسبة 2.5 بالمئة.")
+        -> ['قال د. أحمد إن النسبة 2.5 بالمئة.']
+    sentences("ناقشنا المادة 5. وانتقلنا إلى المادة 6.")
+        -> ['ناقشنا المادة 5.', 'وانتقلنا إلى المادة 6.']
+    python sentence_spans.py FILE [--clauses]
+"""
+
+import re
+import sys
+
+from caption_timeline import strip_marks
+
+OPENING_MARKERS = ['شكرا', 'بسم الله', 'السلام عليكم', 'الكلمه الان']
+CLOSING_MARKERS = ['تفضل', 'تفضلي', 'تفضلوا', 'وبركاته']
+
+LETTER_VARIANTS = {'ا': '[اأإآ]', 'ه': '[هة]', 'ي': '[يى]'}
+MARKS = r'[\u064B-\u065F\u0670\u0640]*'   # diacritics and tatweel between letters
+
+def marker_pattern(phrase):
+    """'شكرا' -> a pattern for شكراً / شكرًا / شكـرا ..."""
+    words = []
+    for word in phrase.split():
+        words.append(''.join(LETTER_VARIANTS.get(c, re.escape(c)) + MARKS for c in word))
+    return r'\s+'.join(words)
+
+def alternation(phrases):
+    return '|'.join(marker_pattern(p) for p in sorted(phrases, key=len, reverse=True))
+
+BOUNDARY = re.compile(
+    r'(?P<stop>(?:[!?؟؛;…◦•]|(?<!\b[^\W\d])\.(?!\d))+|\n\s*)'
+    r'|(?P<clause>[،,:](?!\d))'
+    rf'|(?P<opens>(?<!\w)(?:و\s*)?(?:{alternation(OPENING_MARKERS)})(?!\w))'
+    rf'|(?P<closes>(?<!\w)(?:{alternation(CLOSING_MARKERS)})(?!\w))'
+)
+WORD = re.compile(r'\w')
+
+def _emit(text, start, end, max_chars):
+    """Trimmed span(s) of text[start:end]; long spans are cut at a space"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if not WORD.search(text, start, end):
+        return
+    while max_chars and end - start > max_chars:
+        cut = text.rfind(' ', start + 1, start + max_chars + 1)
+        if cut <= start:
+            cut = start + max_chars
+        yield start, cut
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+    yield start, end
+
+def spans(text, clauses=False, max_chars=None):
+    """
+    Yield (start, end) of each sentence of text, in order. With
+    clauses=True, commas and colons split too. Spans longer than
+    max_chars are cut at the last space before the limit.
+    """
+    start = lead = 0    # lead: end of the opening markers of the current sentence
+    for match in BOUNDARY.finditer(text):
+        kind = match.lastgroup
+        if kind == 'clause' and not clauses:
+            continue
+        if kind == 'opens':
+            # "شكرا شكرا سعاده الرئيس" stays one sentence
+            if WORD.search(text, lead, match.start()):
+                yield from _emit(text, start, match.start(), max_chars)
+                start = match.start()
+            lead = match.end()
+            continue
+        yield from _emit(text, start, match.end(), max_chars)
+        start = lead = match.end()
+    yield from _emit(text, start, len(text), max_chars)
+
+def sentences(text, clauses=False, max_chars=None, min_chars=0):
+    """Sentence strings of at least min_chars characters"""
+    for start, end in spans(text, clauses, max_chars):
+        if end - start >= min_chars:
+            yield text[start:end]
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python sentence_spans.py FILE [--clauses]")
+        return
+    with open(sys.argv[1], 'r', encoding='utf-8-sig') as f:
+        text = strip_marks(f.read())
+    count = 0
+    for start, end in spans(text, clauses='--clauses' in sys.argv):
+        count += 1
+        if count <= 20:
+            print(f"{start:>7}  {text[start:end][:100]}")
+    print(f"\nUnits: {count}")
+
+if __name__ == '__main__':
+    main()
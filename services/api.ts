@@ -1,12 +1,19 @@
+import type { CSSProperties } from "react";
 import {
   MP,
   ParliamentSession,
   BlocMembership,
   MPTransition,
-  TranscriptMatch
+  TransitionStatus,
+  TranscriptMatch,
+  TermActivity,
+  PhotoSize,
+  PhotoVariants,
+  PhotoAtlas,
+  SegmentTimeIndex
 } from "../types";
 import { Party } from "../types";
-import { Law } from "../types";
+import { Law, LawArticles, VoteRow } from "../types";
 
 
 
@@ -25,10 +32,61 @@ export const normalizeForSearch = (text: string) =>
 /* =========================
    MPs
 ========================= */
+const getPhotoManifest = async (): Promise<Record<string, { variants: PhotoVariants }>> => {
+  try {
+    const res = await fetch("/data/photo_manifest.json");
+    if (!res.ok) return {};
+    return await res.json();
+  } catch {
+    return {};
+  }
+};
+
 export const getMPs = async (): Promise<MP[]> => {
-  const res = await fetch("/data/mps.json");
+  const [res, manifest] = await Promise.all([fetch("/data/mps.json"), getPhotoManifest()]);
   if (!res.ok) return [];
-  return await res.json();
+  const mps: MP[] = await res.json();
+  return mps.map(mp =>
+    manifest[mp.id] ? { ...mp, photoVariants: manifest[mp.id].variants } : mp
+  );
+};
+
+// Smallest pre-resized photo for a display size, falling back to the original
+export const mpPhoto = (mp: MP, size: PhotoSize): string | undefined =>
+  mp.photoVariants?.[size]?.webp.url || mp.photoUrl;
+
+export const getPhotoAtlas = async (): Promise<PhotoAtlas | undefined> => {
+  try {
+    const res = await fetch("/data/photo_atlas.json");
+    if (!res.ok) return undefined;
+    return await res.json();
+  } catch {
+    return undefined;
+  }
+};
+
+// Background style showing one MP's cell of its group's sprite sheet.
+// Positions are percentages, so any box with the cell's aspect ratio works.
+export const spriteStyle = (
+  atlas: PhotoAtlas | undefined,
+  grouping: string,
+  group: string | undefined,
+  mpId: string
+): CSSProperties | undefined => {
+  if (!atlas || !group) return undefined;
+  for (const name of atlas.groups[grouping]?.[group] || []) {
+    const sheet = atlas.atlases[name];
+    const index = sheet.members.indexOf(mpId);
+    if (index < 0) continue;
+    const percent = (n: number, count: number) => (count > 1 ? `${(n / (count - 1)) * 100}%` : "0%");
+    return {
+      backgroundImage: `url("${sheet.webp.url}")`,
+      backgroundSize: `${sheet.columns * 100}% ${sheet.rows * 100}%`,
+      backgroundPosition: `${percent(index % sheet.columns, sheet.columns)} ${percent(Math.floor(index / sheet.columns), sheet.rows)}`,
+      backgroundRepeat: "no-repeat"
+    };
+  }
+  return undefined;
 };
 
 export const getMPById = async (id: string) => {
@@ -63,9 +121,11 @@ export const getSessions = async (): Promise<ParliamentSession[]> => {
       // Fallback للقيم القديمة
       stats: {
         estimated_duration_minutes: s.stats?.estimated_duration_minutes || (s.duration_sec ? Math.round(s.duration_sec / 60) : 120),
+        duration_source: s.stats?.duration_source,
         distinct_speakers_count: s.stats?.distinct_speakers_count || s.num_speakers || s.chunks?.[0]?.interventions?.length || s.segments?.length || 0
       },
       brief_summary: s.brief_summary,
+      segmentIndexUrl: s.segmentIndexUrl,
       chunks: s.chunks || [
         {
           chunk_id: "full",
@@ -87,6 +147,49 @@ export const getSessions = async (): Promise<ParliamentSession[]> => {
   }
 };
 
+// Per-session start/end arrays for "who is speaking at t" (segment_index.py)
+export const getSegmentIndex = async (session: ParliamentSession): Promise<SegmentTimeIndex | undefined> => {
+  if (!session.segmentIndexUrl) return undefined;
+  try {
+    const res = await fetch(session.segmentIndexUrl);
+    if (!res.ok) return undefined;
+    return await res.json();
+  } catch {
+    return undefined;
+  }
+};
+
+// Positions of the segments playing at t (earliest start first). The index
+// nests segments inside the ones that contain them (segment_index.py); every
+// list has increasing starts and ends, so each visited list is binary-searched
+export const segmentsAt = (index: SegmentTimeIndex, t: number): number[] => {
+  const { order, listStart, children } = index.nest;
+  const end = (k: number) => index.ends[order[k]] ?? Infinity;
+  const found: number[] = [];
+  const lists = order.length ? [0] : [];
+  while (lists.length) {
+    const l = lists.pop()!;
+    // First segment of the list still running at t
+    let lo = listStart[l];
+    let hi = listStart[l + 1];
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (end(mid) <= t) lo = mid + 1;
+      else hi = mid;
+    }
+    for (let k = lo; k < listStart[l + 1] && index.starts[order[k]] <= t; k++) {
+      found.push(order[k]);
+      if (children[order[k]] !== -1) lists.push(children[order[k]]);
+    }
+  }
+  return found.sort((a, b) => a - b);
+};
+
+export const speakerAt = (index: SegmentTimeIndex, t: number) => {
+  const positions = segmentsAt(index, t);
+  return positions.length ? index.speakers[index.speakerOf[positions[positions.length - 1]]] : undefined;
+};
+
 export const getSessionById = async (id: string) => {
   const sessions = await getSessions();
   return sessions.find(s => s.id === id);
@@ -107,6 +210,7 @@ export const getBlocMemberships = async (
       if (!membership) return null;
 
       return {
+        mpId: mp.id,
         blocName: membership.bloc,
         memberName: mp.fullName,
         term
@@ -115,24 +219,74 @@ export const getBlocMemberships = async (
     .filter(Boolean) as BlocMembership[];
 };
 
+/* =========================
+   Bloc / Party Activity (precomputed)
+========================= */
+export const getBlocActivity = async (
+  term: 1 | 2
+): Promise<TermActivity | undefined> => {
+  try {
+    const res = await fetch("/data/bloc_activity.json");
+    if (!res.ok) return undefined;
+    const data: TermActivity[] = await res.json();
+    return data.find(t => t.id === (term === 1 ? "ordinary_1" : "ordinary_2"));
+  } catch {
+    return undefined;
+  }
+};
+
 /* =========================
    MP Transitions
 ========================= */
 export const getMPTransitions = async (): Promise<MPTransition[]> => {
+  // Precomputed by bloc_transitions.py
+  try {
+    const res = await fetch("/data/transitions.json");
+    if (res.ok) {
+      const feed = await res.json();
+      if (Array.isArray(feed.mps)) return feed.mps;
+    }
+  } catch {
+    // fall back to diffing the roster below
+  }
+
   const mps = await getMPs();
 
+  // Renames listed as aliases in blocs.json are the same bloc, not a shift
+  const aliases: Record<string, Record<string, string>> = {};
+  try {
+    const res = await fetch("/data/blocs.json");
+    if (res.ok) {
+      for (const term of await res.json()) {
+        aliases[term.id] = {};
+        for (const b of term.blocs || []) {
+          for (const alias of b.aliases || []) aliases[term.id][alias] = b.name;
+        }
+      }
+    }
+  } catch {
+    // without blocs.json only identical names count as the same bloc
+  }
+  const sameBloc = (t1: string, t2: string) =>
+    t1 === t2 || aliases.ordinary_2?.[t1] === t2 || aliases.ordinary_1?.[t2] === t1;
+
+  // Same rules as bloc_transitions.sweep, so both paths report the same statuses
   return mps.map(mp => {
-    const t1 = mp.memberships?.find(m => m.session === "ordinary_1")?.bloc;
-    const t2 =
-      mp.memberships?.find(m => m.session === "ordinary_2")?.bloc ||
-      mp.parliamentaryBloc ||
-      "مستقل";
+    const m1 = mp.memberships?.find(m => m.session === "ordinary_1");
+    const m2 = mp.memberships?.find(m => m.session === "ordinary_2");
+    const t1 = m1?.bloc;
+    const t2 = m2?.bloc || mp.parliamentaryBloc || "مستقل";
+
+    let status: TransitionStatus = "STABLE";
+    if (!m1 && m2) status = "NEW_ENTRY";
+    else if (t1 && !sameBloc(t1, t2)) status = "SHIFTED";
 
     return {
+      mpId: mp.id,
       name: mp.fullName,
       term1Bloc: t1,
       term2Bloc: t2,
-      status: t1 && t1 !== t2 ? "SHIFTED" : "STABLE"
+      status
     };
   });
 };
@@ -324,6 +478,29 @@ export const getLawById = async (id: string): Promise<Law | undefined> => {
   return laws.find(l => l.id === id);
 };
 
+// Article structure and session citations (law_articles.py), fetched per law
+export const getLawArticles = async (law: Law): Promise<LawArticles | undefined> => {
+  if (!law.articlesUrl) return undefined;
+  try {
+    const res = await fetch(law.articlesUrl);
+    if (!res.ok) return undefined;
+    return await res.json();
+  } catch {
+    return undefined;
+  }
+};
+
+// Structured votes and decisions extracted from session summaries (session_votes.py)
+export const getVotes = async (): Promise<VoteRow[]> => {
+  try {
+    const res = await fetch("/data/votes.json");
+    if (!res.ok) return [];
+    return await res.json();
+  } catch {
+    return [];
+  }
+};
+
 /* =========================
    User Email (LOCAL)
 ========================= */
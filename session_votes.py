@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vote and decision extractor
+Turns the prose in brief_summary.decisions / events of every session into
+structured rows for VotingView:
+
+    election   speaker / deputies / assistants, with candidates and counts
+    referral   a bill or report sent to a committee
+    law        a bill approved or rejected
+    proposal   an amendment proposal approved or rejected
+    motion     any other recorded vote (statements, recommendations, ...)
+
+Each sentence is scanned once with a single compiled alternation of all
+signals (vote counts, "من أصل", بالتزكية / بالأغلبية / بالإجماع,
+referral / approval / rejection verbs). Named MPs, laws and committees are
+found with phrase automata built from mps.json, laws.json and
+committees.json. An events row that repeats a decisions row of the same
+session is kept but marked duplicateOf.
+
+    python session_votes.py
+"""
+
+import json
+import re
+from collections import Counter
+
+from arabic_text import fold
+from law_articles import build_law_automaton
+from mp_resolver import name_variations
+from phrase_automaton import PhraseAutomaton
+
+MPS_FILE = 'public/data/mps.json'
+LAWS_FILE = 'public/data/laws.json'
+COMMITTEES_FILE = 'public/data/committees.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+OUTPUT_FILE = 'public/data/votes.json'
+
+SOURCES = ('decisions', 'events')
+
+# All signals in one pass (patterns are written against fold()ed text)
+SIGNAL_PATTERNS = {
+    'count': r'(?<![\d/])(\d{1,3})\s*(?:صوتا|صوت|نائبا)',
+    'total': r'من اصل\s*(\d{1,3})',
+    'acclamation': r'بالتزكيه',
+    'unanimous': r'بالاجماع',
+    'majority': r'بالاغلبيه|باغلبيه',
+    'election': r'\b(?:فاز|فوز|انتخب|انتخاب|حسم)',
+    'referral': r'\b(?:احاله|احالته|احالتها|احال|تحويل)',
+    'approve': r'\b(?:اقرار|اقر|وافق|الموافقه|بالموافقه|صادق|تبني)',
+    'reject': r'\b(?:(?:رفض|رفضه|برفض) (?!علي|الحكومه)|(?:تم |قرر (?:المجلس )?ب)?ردّ?(?= (?:ال)?(?:مشروع|قانون|اقتراح|موازنه)))',
+    'proposal': r'\bمقترح',
+    'law': r'\b(?:ال)?قانون',
+}
+SIGNALS = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in SIGNAL_PATTERNS.items()))
+COUNT_NUMBER = re.compile(r'\d+')
+
+POSITIONS = [
+    ('first_deputy', re.compile(r'النائب الاول')),
+    ('second_deputy', re.compile(r'النائب الثاني')),
+    ('assistant', re.compile(r'مساعد')),
+    ('speaker', re.compile(r'رئاسه (?:المجلس|مجلس النواب)|رئيس(?:ا)? للمجلس')),
+]
+COMMITTEE_MENTION = re.compile(r'(?:ال)?لجنه\s+(\w+)(?:\s+(\w+))?')
+SENTENCE_BREAK = re.compile(r'(?<=[.!؟])\s+|\s*[◦•]\s*')
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def strip_article(token):
+    return token[2:] if token.startswith('ال') and len(token) > 4 else token
+
+class Indexes:
+    """Phrase automata for MPs, laws and committees"""
+
+    def __init__(self, mps, laws, committees):
+        variations = {}
+        for mp in mps:
+            for variation in name_variations(mp.get('fullName', '')):
+                variations.setdefault(variation, set()).add(mp['id'])
+        self.mps = PhraseAutomaton()
+        for variation, ids in variations.items():
+            if len(ids) == 1 and len(variation.split()) >= 2:
+                mp_id = next(iter(ids))
+                self.mps.add(variation, mp_id)
+                # Compounds are indexed joined ("عبدالباسط") but often written apart
+                spaced = re.sub(r'\b(عبد|ابو)(?=\S)', r'\1 ', variation)
+                if spaced != variation:
+                    self.mps.add(spaced, mp_id)
+        self.mps.build()
+
+        self.laws = build_law_automaton(laws)
+        self.committees = [
+            (name, [strip_article(t) for t in fold(name).split()[1:]])
+            for name in (c['name'] for c in committees)
+        ]
+
+    def find_mps(self, folded):
+        """[(start, end, mp_id)] for whole-word MP names, longest match first"""
+        found = []
+        for start, end, mp_id in self.mps.finditer(folded):
+            before = folded[start - 1] if start else ' '
+            after = folded[end] if end < len(folded) else ' '
+            if after.isalnum() or not (before.isspace() or not before.isalnum() or
+                                       (before == 'و' and (start < 2 or folded[start - 2].isspace()))):
+                continue
+            found.append((start, end, mp_id))
+        found.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        kept, last_end = [], -1
+        for start, end, mp_id in found:
+            if start >= last_end:
+                kept.append((start, end, mp_id))
+                last_end = end
+        return kept
+
+    def find_law(self, folded, year):
+        """Longest law title named in the text (nearest year on ties), or None"""
+        best = None
+        for start, end, law in self.laws.finditer(folded):
+            rank = (end - start, -abs(law.get('year', year) - year))
+            if best is None or rank > best[0]:
+                best = (rank, law)
+        return best[1]['id'] if best else None
+
+    def find_committee(self, folded):
+        """Official committee name for the first committee mentioned, or None"""
+        for match in COMMITTEE_MENTION.finditer(folded):
+            words = [strip_article(w) for w in match.groups() if w]
+            best, best_len, tie = None, 0, False
+            for name, tokens in self.committees:
+                shared = 0
+                for word, token in zip(words, tokens):
+                    if word != token:
+                        break
+                    shared += 1
+                if shared > best_len:
+                    best, best_len, tie = name, shared, False
+                elif shared and shared == best_len:
+                    tie = True
+            if best and not tie:
+                return best
+        return None
+
+def sentences(text):
+    for part in SENTENCE_BREAK.split(text):
+        part = part.strip()
+        if part:
+            yield part
+
+def scan(folded):
+    """{signal: [match]} for every signal in the text"""
+    signals = {}
+    for match in SIGNALS.finditer(folded):
+        signals.setdefault(match.lastgroup, []).append(match)
+    return signals
+
+def pair_counts(counts, mentions):
+    """
+    [(mp_id or None, votes)]: each count goes to the closest unpaired MP
+    named before it (after the previous count), else the next one after it.
+    """
+    pairs, used, previous_end = [], set(), 0
+    for index, match in enumerate(counts):
+        next_start = counts[index + 1].start() if index + 1 < len(counts) else float('inf')
+        votes = int(COUNT_NUMBER.search(match.group()).group())
+        before = [m for m in mentions if previous_end <= m[0] < match.start() and m not in used]
+        after = [m for m in mentions if match.end() <= m[0] < next_start and m not in used]
+        mention = before[-1] if before else (after[0] if after else None)
+        if mention:
+            used.add(mention)
+        pairs.append((mention[2] if mention else None, votes))
+        previous_end = match.end()
+    return pairs
+
+def classify(signals, position):
+    def first(*names):
+        starts = [(signals[n][0].start(), n) for n in names if n in signals]
+        return min(starts)[1] if starts else None
+
+    if 'election' in signals and 'law' not in signals and (position or 'acclamation' in signals or 'count' in signals):
+        return 'election'
+    if 'referral' in signals:
+        return 'referral'
+    decided = first('approve', 'reject') or ('majority' in signals or 'unanimous' in signals or 'count' in signals)
+    if not decided:
+        return None
+    if 'proposal' in signals:
+        return 'proposal'
+    if 'law' in signals:
+        return 'law'
+    return 'motion'
+
+def extract_row(text, indexes, year, law_context):
+    folded = fold(text)
+    signals = scan(folded)
+    position = next((name for name, pattern in POSITIONS if pattern.search(folded)), None)
+    kind = classify(signals, position)
+    if not kind:
+        return None
+
+    row = {'type': kind}
+    verdict = min(
+        ((signals[n][0].start(), n) for n in ('approve', 'reject') if n in signals),
+        default=(None, None),
+    )[1]
+    row['outcome'] = {
+        'election': 'elected',
+        'referral': 'referred',
+    }.get(kind, 'rejected' if verdict == 'reject' else 'approved')
+    row['method'] = next(
+        (method for method in ('acclamation', 'unanimous', 'majority') if method in signals),
+        'count' if 'count' in signals else None,
+    )
+
+    mentions = indexes.find_mps(folded)
+    row['mpIds'] = list(dict.fromkeys(m[2] for m in mentions))
+
+    counts = signals.get('count', [])
+    if kind == 'election':
+        row['position'] = position
+        pairs = pair_counts(counts, mentions)
+        row['candidates'] = [{'mpId': mp_id, 'votes': votes} for mp_id, votes in pairs]
+        winners = sorted((c for c in row['candidates'] if c['mpId']), key=lambda c: -c['votes'])
+        row['winnerId'] = winners[0]['mpId'] if winners else (row['mpIds'][0] if row['mpIds'] else None)
+    elif counts:
+        row['votesFor'] = int(COUNT_NUMBER.search(counts[0].group()).group())
+    if 'total' in signals:
+        row['votesTotal'] = int(COUNT_NUMBER.search(signals['total'][0].group()).group())
+
+    if 'law' in signals:
+        row['lawId'] = indexes.find_law(folded, year) or law_context
+    if kind == 'referral':
+        row['committee'] = indexes.find_committee(folded)
+    row['text'] = text
+    return row
+
+def extract_session(session, indexes):
+    summary = session.get('brief_summary') or {}
+    year = int(str(session.get('date') or '0')[:4] or 0)
+    rows = []
+    for source in SOURCES:
+        for item_index, item in enumerate(summary.get(source) or []):
+            if not isinstance(item, str):
+                continue
+            law_context = None
+            for sentence_index, text in enumerate(sentences(item)):
+                row = extract_row(text, indexes, year, law_context)
+                law_context = indexes.find_law(fold(text), year) or law_context
+                if not row:
+                    continue
+                rows.append(dict({
+                    'id': f"{session['id']}-{source[0]}{item_index}-{sentence_index}",
+                    'sessionId': session['id'],
+                    'date': session.get('date'),
+                    'source': source,
+                }, **row))
+    mark_duplicates(rows)
+    return rows
+
+def row_key(row, committee=True):
+    return (row['type'], row['outcome'], row.get('lawId'), row.get('committee') if committee else None,
+            row.get('winnerId'), tuple(sorted(row['mpIds'])), row.get('votesFor'))
+
+def mark_duplicates(rows):
+    """
+    Events rows restating a decisions row of the same session; an event
+    that names no committee ("اللجان المختصة") still matches its decision.
+    """
+    decided = {}
+    for row in rows:
+        if row['source'] == 'decisions':
+            decided.setdefault(row_key(row), row['id'])
+            decided.setdefault(row_key(row, committee=False), row['id'])
+    for row in rows:
+        if row['source'] != 'decisions' and row_key(row) in decided:
+            row['duplicateOf'] = decided[row_key(row)]
+
+def extract_all(sessions, mps, laws, committees):
+    indexes = Indexes(mps, laws, committees)
+    rows = []
+    for session in sorted(sessions, key=lambda s: (s.get('date') or '', s['id'])):
+        rows.extend(extract_session(session, indexes))
+    return rows
+
+def main():
+    print("=== Session Votes & Decisions ===\n")
+    sessions = load_json(SESSIONS_FILE)
+    mps = load_json(MPS_FILE)
+    laws = load_json(LAWS_FILE)
+    committees = load_json(COMMITTEES_FILE)['committees']
+
+    rows = extract_all(sessions, mps, laws, committees)
+    save_json(OUTPUT_FILE, rows)
+
+    unique = [r for r in rows if 'duplicateOf' not in r]
+    print(f"Rows: {len(rows)} ({len(rows) - len(unique)} repeated in events)")
+    for (kind, outcome), n in sorted(Counter((r['type'], r['outcome']) for r in unique).items()):
+        print(f"  {kind:9} {outcome:9} {n}")
+    print(f"With vote counts: {sum(1 for r in unique if r.get('votesFor') or r.get('candidates'))}")
+    print(f"Linked to a law: {sum(1 for r in unique if r.get('lawId'))}")
+    print(f"\nSaved to {OUTPUT_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Speaking-rate calibration
+Measures how fast people actually speak in the chamber instead of assuming
+130 words per minute:
+
+1. Every caption transcript (caption_timeline.caption_files, plus
+   sample_transcript.txt) is cut at its time marks; words and seconds
+   between consecutive marks are counted with NumPy (searchsorted over
+   word offsets).
+2. An interval that lies inside one speaker turn ("Name:" lines) is
+   credited to that speaker. Outliers (gaps, pauses, caption glitches)
+   are dropped.
+3. Global rate = words / seconds over all intervals. A speaker's rate is
+   shrunk towards it by PRIOR_SECONDS of "global" speech, so one short
+   turn cannot produce an extreme rate.
+
+The rates go to public/data/speaking_rates.json, and every session gets
+stats.estimated_duration_minutes in one batch:
+
+    video      measured duration of the recording (duration / duration_sec)
+    verbatim   words of each turn of its verbatim minutes / that speaker's rate,
+               times the overhead factor (pauses, votes, procedure) fitted on
+               the sessions that have both minutes and video; only used when
+               that factor predicts each of them to within MAX_VERBATIM_ERROR
+               (leave-one-out), otherwise the source is skipped
+    speakers   linear fit of duration on num_speakers over the timed sessions
+
+    python speaking_rate.py
+"""
+
+import json
+import os
+import re
+
+import numpy as np
+
+from caption_timeline import CaptionTimeline, caption_files
+from mp_resolver import MPResolver, normalize_name
+
+MPS_FILE = 'public/data/mps.json'
+SESSIONS_FILE = 'public/data/sessions.json'
+RATES_FILE = 'public/data/speaking_rates.json'
+VERBATIM_DIR = 'public/data/minutes_verbatim'
+EXTRA_CAPTIONS = ['sample_transcript.txt']
+
+MIN_INTERVAL = 5        # seconds; shorter spans are dominated by rounding
+MAX_INTERVAL = 300      # longer spans hide pauses, votes and breaks
+MIN_RATE, MAX_RATE = 0.5, 5.0   # words per second considered plausible
+PRIOR_SECONDS = 120     # weight of the global rate in a speaker's estimate
+MAX_VERBATIM_ERROR = 0.25   # leave-one-out relative error of the verbatim overhead factor
+
+WORD = re.compile(r'\S+')
+SPEAKER_TURN = re.compile(r'^[ \t]*([^\n:"“]{2,60}?)\s*:', re.M)
+ROLE_WORDS = re.compile(r'رئيس|الرئيس|رئاسه|الامين|وزير|المقرر|النائب|سعاده|معالي|دوله')
+CHAIR = re.compile(r'^(?:ال)?رئيس(?: المجلس| مجلس النواب)?$|^رئاسه المجلس$')
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def read_text(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return f.read()
+
+def speaker_key(label, resolver):
+    """MP id, 'chair', or the normalized role label; None if not a speaker line"""
+    role = re.sub(r'^(?:سعاده|معالي|عطوفه|دوله)\s+', '', normalize_name(label).strip())
+    if CHAIR.match(role):
+        return 'chair'
+    mp_id = resolver.resolve_id(label)
+    if mp_id:
+        return mp_id
+    if ROLE_WORDS.search(normalize_name(label) or label) or ROLE_WORDS.search(label):
+        return role or None
+    return None
+
+def speaker_turns(text, resolver):
+    """(offsets, keys) of the speaker lines in a transcript, in order"""
+    offsets, keys = [], []
+    for match in SPEAKER_TURN.finditer(text):
+        key = speaker_key(match.group(1), resolver)
+        if key:
+            offsets.append(match.start())
+            keys.append(key)
+    return np.asarray(offsets, dtype=np.int64), keys
+
+def word_offsets(text):
+    return np.fromiter((m.start() for m in WORD.finditer(text)), dtype=np.int64)
+
+def interval_samples(timeline, resolver):
+    """
+    (words, chars, seconds, speaker index, keys) per interval between
+    consecutive marks; speaker index is -1 when the interval spans a turn
+    change.
+    """
+    if len(timeline) < 2:
+        return np.zeros(0), np.zeros(0), np.zeros(0), np.zeros(0, dtype=np.int64), []
+    words_at = word_offsets(timeline.text)
+    marks = timeline.offsets.astype(np.int64)
+    words = np.diff(np.searchsorted(words_at, marks)).astype(float)
+    chars = np.diff(timeline.offsets)
+    seconds = np.diff(timeline.times)
+
+    turn_offsets, keys = speaker_turns(timeline.text, resolver)
+    if len(turn_offsets):
+        first = np.searchsorted(turn_offsets, marks[:-1], side='right') - 1
+        last = np.searchsorted(turn_offsets, marks[1:] - 1, side='right') - 1
+        speaker = np.where((first == last) & (first >= 0), first, -1)
+    else:
+        speaker = np.full(len(words), -1, dtype=np.int64)
+    return words, chars, seconds, speaker, keys
+
+def fit_rates(samples):
+    """
+    Global and per-speaker words/second from interval_samples() results.
+    Returns {'global': {...}, 'speakers': {key: {...}}}.
+    """
+    all_words, all_chars, all_seconds, all_keys = [], [], [], []
+    for words, chars, seconds, speaker, keys in samples:
+        all_words.append(words)
+        all_chars.append(chars)
+        all_seconds.append(seconds)
+        all_keys.extend(keys[i] if i >= 0 else None for i in speaker)
+    words = np.concatenate(all_words) if all_words else np.zeros(0)
+    chars = np.concatenate(all_chars) if all_chars else np.zeros(0)
+    seconds = np.concatenate(all_seconds) if all_seconds else np.zeros(0)
+    keys = np.array(all_keys, dtype=object)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.where(seconds > 0, words / seconds, 0.0)
+    valid = (seconds >= MIN_INTERVAL) & (seconds <= MAX_INTERVAL) & (rate >= MIN_RATE) & (rate <= MAX_RATE)
+    if not valid.any():
+        return {'global': None, 'speakers': {}}
+
+    total_words, total_seconds = words[valid].sum(), seconds[valid].sum()
+    global_rate = total_words / total_seconds
+    result = {
+        'global': {
+            'wordsPerSecond': round(float(global_rate), 3),
+            'wordsPerMinute': round(float(global_rate * 60), 1),
+            'charsPerSecond': round(float(chars[valid].sum() / total_seconds), 2),
+            'intervals': int(valid.sum()),
+            'seconds': int(total_seconds),
+            'dropped': int((~valid).sum()),
+        },
+        'speakers': {},
+    }
+    attributed = valid & (keys != None)  # noqa: E711 (element-wise on an object array)
+    for key in sorted(set(keys[attributed])):
+        mask = attributed & (keys == key)
+        w, s = words[mask].sum(), seconds[mask].sum()
+        shrunk = (w + PRIOR_SECONDS * global_rate) / (s + PRIOR_SECONDS)
+        result['speakers'][key] = {
+            'wordsPerSecond': round(float(shrunk), 3),
+            'observedWordsPerSecond': round(float(w / s), 3),
+            'intervals': int(mask.sum()),
+            'seconds': int(s),
+        }
+    return result
+
+def calibrate(resolver, paths):
+    samples = []
+    for path in paths:
+        samples.append(interval_samples(CaptionTimeline.from_transcript(read_text(path)), resolver))
+    rates = fit_rates(samples)
+    rates['sources'] = [os.path.basename(p) for p in paths]
+    return rates
+
+def duration_seconds(session):
+    """Measured video length of a session, or None"""
+    if session.get('duration_sec'):
+        return int(session['duration_sec'])
+    parts = str(session.get('duration') or '').split(':')
+    if len(parts) == 3 and all(p.isdigit() for p in parts):
+        return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+    return None
+
+def title_key(title):
+    """'العادية الثانية – الجلسة العاشرة التفريغ' -> (2, 'الجلسه العاشره')"""
+    folded = normalize_name(re.sub(r'[()]', ' ', title))
+    term = 2 if 'الثانيه' in folded.split('الجلسه')[0] else 1
+    match = re.search(r'الجلسه [^\d]*', folded)
+    name = match.group().replace('التفريغ', '').strip() if match else folded
+    return term, name
+
+def verbatim_files(directory=VERBATIM_DIR):
+    """{(term, title key): path} for the verbatim minutes"""
+    if not os.path.isdir(directory):
+        return {}
+    return {
+        title_key(os.path.splitext(name)[0]): os.path.join(directory, name)
+        for name in sorted(os.listdir(directory)) if name.endswith('.txt')
+    }
+
+def estimate_from_turns(text, rates, resolver):
+    """Seconds to speak a transcript, turn by turn at each speaker's rate"""
+    global_rate = rates['global']['wordsPerSecond']
+    turn_offsets, keys = speaker_turns(text, resolver)
+    words_at = word_offsets(text)
+    bounds = np.searchsorted(words_at, np.concatenate(([0], turn_offsets, [len(text)])))
+    counts = np.diff(bounds).astype(float)
+    speaker_rates = np.array(
+        [global_rate] + [rates['speakers'].get(k, {}).get('wordsPerSecond', global_rate) for k in keys]
+    )
+    return float((counts / speaker_rates).sum())
+
+def session_for(key, sessions):
+    return next((s for s in sessions if (s.get('ordinaryTerm') or 1, title_key(s.get('title', ''))[1]) == key), None)
+
+def verbatim_pairs(sessions, rates, resolver):
+    """[(session id, estimated speaking seconds, video seconds)] for minutes with a timed session"""
+    pairs = []
+    for key, path in verbatim_files().items():
+        session = session_for(key, sessions)
+        if session and duration_seconds(session):
+            pairs.append((session['id'], estimate_from_turns(read_text(path), rates, resolver),
+                          duration_seconds(session)))
+    return pairs
+
+def calibrate_verbatim(pairs):
+    """
+    Overhead factor video / speaking time over the paired sessions, and
+    the mean leave-one-out relative error of predicting each one with the
+    factor fitted on the others. The factor is None (verbatim minutes are
+    not used) with fewer than 3 pairs or an error above MAX_VERBATIM_ERROR.
+    """
+    result = {'factor': None, 'sessions': [p[0] for p in pairs], 'looError': None}
+    if len(pairs) < 2:
+        return result
+    estimate = np.array([p[1] for p in pairs], dtype=float)
+    video = np.array([p[2] for p in pairs], dtype=float)
+    others = (video.sum() - video) / (estimate.sum() - estimate)
+    error = float(np.mean(np.abs(others * estimate - video) / video))
+    result['looError'] = round(error, 3)
+    if len(pairs) >= 3 and error <= MAX_VERBATIM_ERROR:
+        result['factor'] = round(float(video.sum() / estimate.sum()), 3)
+    return result
+
+def fit_speaker_model(sessions):
+    """Least-squares duration_seconds ~ a + b * num_speakers over timed sessions"""
+    points = [(s['num_speakers'], duration_seconds(s)) for s in sessions
+              if s.get('num_speakers') and duration_seconds(s)]
+    if len(points) < 2:
+        return None
+    x, y = np.array(points, dtype=float).T
+    b, a = np.polyfit(x, y, 1)
+    return float(a), float(b)
+
+def backfill_durations(sessions, rates, resolver):
+    """Set stats.estimated_duration_minutes (and its source) on every session"""
+    factor = (rates.get('verbatim') or {}).get('factor')
+    verbatim = verbatim_files() if rates.get('global') and factor else {}
+    model = fit_speaker_model(sessions)
+    counts = {}
+    for session in sessions:
+        seconds, source = duration_seconds(session), 'video'
+        if seconds is None:
+            path = verbatim.get((session.get('ordinaryTerm') or 1, title_key(session.get('title', ''))[1]))
+            if path:
+                seconds, source = estimate_from_turns(read_text(path), rates, resolver) * factor, 'verbatim'
+        if seconds is None and model and session.get('num_speakers'):
+            a, b = model
+            seconds, source = max(0.0, a + b * session['num_speakers']), 'speakers'
+        if seconds is None:
+            continue
+        stats = session.get('stats') or {}
+        session['stats'] = stats
+        stats['estimated_duration_minutes'] = int(round(seconds / 60))
+        stats['duration_source'] = source
+        if source == 'video' and not session.get('duration_sec'):
+            session['duration_sec'] = int(seconds)
+        counts[source] = counts.get(source, 0) + 1
+    return counts
+
+def main():
+    print("=== Speaking-Rate Calibration ===\n")
+    resolver = MPResolver(load_json(MPS_FILE))
+    paths = list(caption_files().values()) + [p for p in EXTRA_CAPTIONS if os.path.exists(p)]
+    rates = calibrate(resolver, paths)
+    if not rates['global']:
+        print("[ERROR] No usable intervals between caption marks")
+        return
+    g = rates['global']
+    print(f"Transcripts: {len(paths)}")
+    print(f"Global: {g['wordsPerMinute']} words/min over {g['intervals']} intervals "
+          f"({g['seconds'] // 60} min, {g['dropped']} dropped)")
+    for key, speaker in sorted(rates['speakers'].items(), key=lambda kv: -kv[1]['seconds'])[:10]:
+        print(f"  {key}: {speaker['wordsPerSecond'] * 60:.0f} wpm "
+              f"(observed {speaker['observedWordsPerSecond'] * 60:.0f}, {speaker['seconds']}s)")
+
+    sessions = load_json(SESSIONS_FILE)
+
+    # Verbatim minutes only count as a duration source once calibrated on video
+    pairs = verbatim_pairs(sessions, rates, resolver)
+    rates['verbatim'] = calibrate_verbatim(pairs)
+    for session_id, estimate, video in pairs:
+        print(f"  check {session_id}: verbatim {estimate / 60:.0f} min speaking vs video {video / 60:.0f} min")
+    v = rates['verbatim']
+    error = 'n/a' if v['looError'] is None else f"{v['looError']:.0%}"
+    if v['factor']:
+        print(f"Verbatim overhead factor: {v['factor']} (leave-one-out error {error})")
+    else:
+        print(f"Verbatim minutes not used for durations ({len(pairs)} calibration sessions, "
+              f"leave-one-out error {error})")
+    save_json(RATES_FILE, rates)
+
+    counts = backfill_durations(sessions, rates, resolver)
+    save_json(SESSIONS_FILE, sessions)
+    print(f"\nDurations: {counts}")
+    print(f"Saved to {RATES_FILE} and {SESSIONS_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MP photo sprite atlases
+Packs portraits into a few sprite sheets per directory grouping, so a
+page that shows a whole bloc or governorate loads one or two images
+instead of one request per MP:
+
+    bloc         per session (memberships), avatar cells -> BlocsDirectoryView
+    governorate  card cells                              -> MPListView
+
+Cells are cropped to the exact variant box (image_pipeline.VARIANTS) and
+laid out row by row in member order. public/data/photo_atlas.json maps
+atlas name -> image URLs, grid and member ids, and grouping -> group ->
+atlas names.
+
+An atlas is keyed by the source hashes of its members (from
+photo_manifest.json); it is only re-rendered when one of them changes or
+the membership of its group does.
+
+    python sprite_atlas.py             # incremental (run after image_pipeline.py)
+    python sprite_atlas.py --force     # re-render every atlas
+"""
+
+import hashlib
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from image_pipeline import FORMATS, MANIFEST_FILE, PUBLIC_ROOT, VARIANTS, file_hash, public_url, to_rgb
+
+MPS_FILE = 'public/data/mps.json'
+ATLAS_FILE = 'public/data/photo_atlas.json'
+ATLAS_DIR = Path('public/images/mps/atlas')
+
+# grouping -> variant size of its cells
+GROUPINGS = {
+    'bloc': 'avatar',
+    'governorate': 'card',
+}
+MAX_CELLS = 36          # larger groups are split into several atlases
+FACE_CENTERING = (0.5, 0.3)  # crop portraits around the upper third
+LAYOUT_VERSION = 1
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def group_members(mps, grouping):
+    """{group: [mp ids]} for a grouping, in roster order"""
+    groups = {}
+    for mp in mps:
+        if grouping == 'bloc':
+            keys = [f"{m['session']}/{m['bloc']}" for m in mp.get('memberships', []) if m.get('bloc')]
+        else:
+            keys = [mp[grouping]] if mp.get(grouping) else []
+        for key in keys:
+            groups.setdefault(key, []).append(mp['id'])
+    return groups
+
+def grid_shape(count):
+    columns = max(1, math.ceil(math.sqrt(count)))
+    return columns, math.ceil(count / columns)
+
+def input_hash(members, manifest, size):
+    """Hash of everything an atlas image depends on"""
+    h = hashlib.sha1(f"{LAYOUT_VERSION}:{size}:{VARIANTS[size]}".encode())
+    for mp_id in members:
+        h.update(f"|{mp_id}:{manifest[mp_id]['sourceHash']}".encode())
+    return h.hexdigest()
+
+def plan_atlases(mps, manifest):
+    """
+    Every atlas the current roster needs:
+        {name: {'grouping', 'group', 'size', 'members', 'inputHash'}}
+    Only MPs with a photo in the manifest get a cell.
+    """
+    plan = {}
+    for grouping, size in GROUPINGS.items():
+        for group, members in group_members(mps, grouping).items():
+            members = [mp_id for mp_id in members if mp_id in manifest]
+            group_id = hashlib.sha1(group.encode('utf-8')).hexdigest()[:8]
+            for part, start in enumerate(range(0, len(members), MAX_CELLS)):
+                chunk = members[start:start + MAX_CELLS]
+                plan[f"{grouping}-{group_id}-{part}"] = {
+                    'grouping': grouping,
+                    'group': group,
+                    'size': size,
+                    'members': chunk,
+                    'inputHash': input_hash(chunk, manifest, size),
+                }
+    return plan
+
+def render_atlas(name, spec, manifest, out_dir=ATLAS_DIR):
+    """Worker: draw one atlas and return (name, map entry)"""
+    cell_w, cell_h = VARIANTS[spec['size']]
+    columns, rows = grid_shape(len(spec['members']))
+    sheet = Image.new('RGB', (columns * cell_w, rows * cell_h), (255, 255, 255))
+
+    for index, mp_id in enumerate(spec['members']):
+        with Image.open(manifest[mp_id]['source']) as img:
+            cell = ImageOps.fit(to_rgb(img), (cell_w, cell_h), Image.LANCZOS, centering=FACE_CENTERING)
+        sheet.paste(cell, ((index % columns) * cell_w, (index // columns) * cell_h))
+
+    entry = dict(spec, columns=columns, rows=rows, cell=[cell_w, cell_h],
+                 width=sheet.width, height=sheet.height)
+    for ext, (fmt, options) in FORMATS.items():
+        path = Path(out_dir) / f"{name}.{spec['inputHash'][:10]}.{ext}"
+        tmp = path.with_name(path.name + '.part')
+        sheet.save(tmp, fmt, **options)
+        os.replace(tmp, path)
+        entry[ext] = {'url': public_url(path), 'hash': file_hash(path), 'bytes': path.stat().st_size}
+    return name, entry
+
+def is_current(entry, spec, public_root=PUBLIC_ROOT):
+    if not entry or entry.get('inputHash') != spec['inputHash'] or entry.get('group') != spec['group']:
+        return False
+    return all((Path(public_root) / entry[ext]['url'].lstrip('/')).exists() for ext in FORMATS)
+
+def run(force=False, workers=None, mps_file=MPS_FILE, manifest_file=MANIFEST_FILE, atlas_file=ATLAS_FILE, out_dir=ATLAS_DIR):
+    """Return (atlas map, rendered names, reused count)"""
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    mps = load_json(mps_file)
+    manifest = load_json(manifest_file)
+    previous = load_json(atlas_file).get('atlases', {}) if os.path.exists(atlas_file) and not force else {}
+
+    plan = plan_atlases(mps, manifest)
+    todo = [name for name in sorted(plan) if not is_current(previous.get(name), plan[name])]
+    atlases = {name: previous[name] for name in plan if name not in todo}
+
+    rendered = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render_atlas, name, plan[name], manifest, out_dir) for name in todo]
+            for future in futures:
+                name, entry = future.result()
+                atlases[name] = entry
+                rendered.append(name)
+    atlases = dict(sorted(atlases.items()))
+
+    # Remove sheets no atlas points at any more (older hashes, dissolved groups)
+    keep = {Path(atlas[ext]['url']).name for atlas in atlases.values() for ext in FORMATS}
+    for path in Path(out_dir).iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+
+    groups = {}
+    for name, atlas in atlases.items():
+        groups.setdefault(atlas['grouping'], {}).setdefault(atlas['group'], []).append(name)
+
+    atlas_map = {'atlases': atlases, 'groups': groups}
+    save_json(atlas_file, atlas_map)
+    return atlas_map, rendered, len(atlases) - len(rendered)
+
+def main():
+    force = '--force' in sys.argv
+    workers = int(sys.argv[sys.argv.index('--workers') + 1]) if '--workers' in sys.argv else None
+
+    print("=== MP Photo Sprite Atlases ===\n")
+    if not os.path.exists(MANIFEST_FILE):
+        print(f"[ERROR] {MANIFEST_FILE} not found, run image_pipeline.py first")
+        return
+    atlas_map, rendered, reused = run(force=force, workers=workers)
+
+    atlases = atlas_map['atlases']
+    print(f"Atlases: {len(atlases)} (rendered {len(rendered)}, unchanged {reused})")
+    for grouping, groups in atlas_map['groups'].items():
+        sheets = sum(len(names) for names in groups.values())
+        size = sum(atlases[name]['webp']['bytes'] for names in groups.values() for name in names)
+        print(f"  {grouping}: {len(groups)} groups, {sheets} sheets, {size / 1024:.0f} KB webp")
+    print(f"\nSaved to {ATLAS_FILE}")
+
+if __name__ == '__main__':
+    main()
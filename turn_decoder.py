@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Speaker-turn decoder (HMM / Viterbi)
+An alternative to the rule cascade in update_session_6.find_turns: the
+transcript is cut into clause units (sentence_spans) and turn-taking is
+decoded as a hidden Markov model over them.
+
+States:       the chair; "other" (ministers, secretariat, MPs the text
+              does not name) as an opening state for the first unit of
+              a turn and an inside state for the rest, so that two
+              unnamed speakers in a row still make two turns; every MP
+              whose name occurs in the transcript
+Observations: cue counts per unit, found in one automaton pass over the
+              normalized text (arabic_text + phrase_automaton):
+              hand-over phrases, MP names, procedural phrases of the
+              chair, addressing the chair, basmala, thank-you formulas
+Emissions:    a (units x states) log-score matrix built with NumPy from
+              the cue counts; a name called together with a hand-over
+              scores for that MP in the following unit
+Transitions:  speakers keep the floor for several units, the chair for
+              few; the floor goes back to the chair more often than
+              directly to another speaker
+
+Viterbi runs in O(units x states^2) with one vectorized step per unit.
+decode_turns() returns the same [{speakerName, text, start, end}] list
+as find_turns, so either plugs into extract_segments:
+
+    extract_segments(text, mps, find=decode_turns)
+
+Run as a script to benchmark both segmenters against a majority
+baseline ("floor": the whole text is one unnamed speaker) for speed,
+share of words given to the right speaker, chair vs floor and
+turn-boundary F1, on transcripts with "Speaker:" lines removed so the
+text reads like captions. Most words belong to speakers the text never
+names, so the baseline already scores about as well as the decoder on
+the speaker and chair/floor metrics; what the decoder adds is turn
+boundaries (F1 0.35 overall, 0.70 on the caption transcript), not the
+identification of MPs:
+
+    python turn_decoder.py [FILE ...]
+"""
+
+import json
+import re
+import sys
+import time
+
+import numpy as np
+
+from arabic_text import normalize
+from caption_timeline import CAPTION_DIRS, CaptionTimeline, caption_files
+from mp_resolver import MPResolver, name_variations
+from phrase_automaton import PhraseAutomaton
+from sentence_spans import spans
+from speaking_rate import SPEAKER_TURN, VERBATIM_DIR, speaker_key, verbatim_files
+
+MPS_FILE = 'public/data/mps.json'
+
+CHAIR, OPEN, OTHER, FIRST_MP = 0, 1, 2, 3
+CHAIR_NAME = "رئيس المجلس"
+OTHER_NAME = "غير محدد"
+UNIT_CHARS = 300        # longest unit; caption runs without any boundary are cut
+BOUNDARY_TOLERANCE = 150   # benchmark: a turn change found within this many chars counts
+
+# Cue phrases, normalized (arabic_text.normalize(punctuation=True))
+CUES = {
+    'handover': ["تفضل", "تفضلي", "تفضلوا", "فليتفضل", "الكلمه ل", "الكلمه الان", "يليه", "يليها"],
+    'calling': ["سعاده النائب", "سعاده الزميل", "سعاده الزميله", "الزميل الكريم", "الزميله الكريمه"],
+    'procedure': [
+        "النصاب قانوني", "افتتح الجلسه", "افتتاح الجلسه", "ترفع الجلسه", "رفع الجلسه",
+        "الموافق يرفع يده", "الموافقون", "اغلبيه", "المجلس موافق", "يتلو الامين العام",
+        "ننتقل الي", "البند التالي",
+    ],
+    'address': ["سعاده الرئيس", "معالي الرئيس", "سيدي الرئيس", "دوله الرئيس"],
+    'opening': ["بسم الله الرحمن الرحيم", "بسم الله"],
+    'thanks': ["شكرا", "اشكرك", "اشكركم"],
+    'official': ["معالي الوزير", "معالي وزير", "الامين العام", "دوله رئيس الوزراء", "المقرر"],
+}
+
+# Emission weights (log scale)
+WEIGHTS = {
+    'handover_chair': 2.0,      # "تفضل" is said by the chair
+    'calling_chair': 1.5,       # ... and so is "سعاده النائب"
+    'procedure_chair': 2.5,
+    'address_not_chair': 2.5,   # "سعاده الرئيس" is said to the chair
+    'address_open': 2.0,        # ... usually in the first words of a turn
+    'opening_open': 2.0,        # speakers start with the basmala
+    'thanks_not_chair': 0.5,
+    'named_chair': 0.5,         # the chair names people; speakers rarely name themselves
+    'named_self': 1.0,
+    'called': 4.0,              # name + hand-over -> that MP holds the next unit
+    'called_other': 3.0,        # "معالي الوزير تفضل" -> "other" holds the next unit
+}
+STAY = 0.8              # probability that a speaker keeps the floor for the next unit
+CHAIR_STAY = 0.6        # the chair speaks in short interjections
+BACK_TO_CHAIR = 0.6     # share of a speaker's changes that hand the floor back to the chair
+TO_UNNAMED = 0.7        # share of the chair's changes that go to a speaker the text does not name
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def split_compounds(variation):
+    """normalize_name joins "عبد الله" -> "عبدالله"; transcripts write both"""
+    return re.sub(r'\b(عبد|ابو)(?=\S)', r'\1 ', variation)
+
+class TurnDecoder:
+    """Cue automaton over all MP names, reused for every transcript"""
+
+    def __init__(self, mps):
+        self.mps = mps
+        owners = {}
+        for index, mp in enumerate(mps):
+            for variation in name_variations(mp.get('fullName', '')):
+                if len(variation.split()) < 2:
+                    continue
+                for form in {variation, split_compounds(variation)}:
+                    owners.setdefault(form, set()).add(index)
+
+        self.automaton = PhraseAutomaton()
+        for form, indexes in owners.items():
+            if len(indexes) == 1:       # a name two MPs share is no evidence
+                self.automaton.add(form, ('name', next(iter(indexes))))
+        for cue, phrases in CUES.items():
+            for phrase in phrases:
+                self.automaton.add(phrase, (cue, None))
+        self.automaton.build()
+
+    def cues(self, text):
+        """[(original offset, cue, mp index)] on word boundaries, leftmost-longest"""
+        folded, offsets = normalize(text, punctuation=True, offsets=True)
+        size = len(folded)
+        found = sorted(
+            ((start, end, payload) for start, end, payload in self.automaton.finditer(folded)
+             if (start == 0 or folded[start - 1] == ' ') and (end == size or folded[end] == ' ')),
+            key=lambda m: (m[0], m[0] - m[1]),
+        )
+        result, last_end = [], 0
+        for start, end, (cue, mp_index) in found:
+            if start < last_end:
+                continue
+            last_end = end
+            result.append((int(offsets[start]), cue, mp_index))
+        return result
+
+    def emissions(self, starts, cues):
+        """(log-score matrix units x states, MP index of each MP state)"""
+        units = len(starts)
+        named_mps = sorted({mp for _, cue, mp in cues if cue == 'name'})
+        state_of = {mp: FIRST_MP + i for i, mp in enumerate(named_mps)}
+        states = FIRST_MP + len(named_mps)
+
+        position = np.array([offset for offset, _, _ in cues], dtype=np.int64)
+        unit = np.searchsorted(starts, position, side='right') - 1 if len(cues) else np.zeros(0, dtype=np.int64)
+        kinds = np.array([cue for _, cue, _ in cues], dtype=object)
+
+        def count(cue):
+            result = np.zeros(units)
+            np.add.at(result, unit[kinds == cue], 1)
+            return result
+
+        handover, procedure = count('handover'), count('procedure')
+        address, thanks, official = count('address'), count('thanks'), count('official')
+        opening, calling_title = count('opening'), count('calling')
+        named = np.zeros((units, states))
+        is_name = kinds == 'name'
+        if is_name.any():
+            columns = np.array([state_of[mp] for _, cue, mp in cues if cue == 'name'])
+            np.add.at(named, (unit[is_name], columns), 1)
+
+        w = WEIGHTS
+        scores = np.zeros((units, states))
+        scores[:, CHAIR] += (w['handover_chair'] * np.minimum(handover, 2) + w['procedure_chair'] * procedure
+                             + w['calling_chair'] * np.minimum(calling_title, 2)
+                             + w['named_chair'] * np.minimum(named.sum(axis=1), 2))
+        scores[:, CHAIR] -= w['address_not_chair'] * np.minimum(address, 1) + w['thanks_not_chair'] * np.minimum(thanks, 1)
+        scores[:, OPEN] += w['address_open'] * np.minimum(address, 1) + w['opening_open'] * np.minimum(opening, 1)
+        scores[:, FIRST_MP:] -= w['named_self'] * np.minimum(named[:, FIRST_MP:], 1)
+
+        # A hand-over in this unit or the next calls the names of this unit
+        calling = handover.copy()
+        calling[:-1] += handover[1:]
+        called = (named[:, FIRST_MP:] > 0) & (calling[:, None] > 0)
+        scores[1:, FIRST_MP:] += w['called'] * called[:-1]
+        called_other = (official > 0) & (calling > 0) & ~called.any(axis=1)
+        scores[1:, OPEN] += w['called_other'] * called_other[:-1]
+        return scores, named_mps
+
+    @staticmethod
+    def transitions(states):
+        """
+        Log transition matrix. An unnamed turn enters through OPEN and
+        carries on in OTHER; OTHER never follows the chair directly.
+        """
+        mps = states - FIRST_MP
+        matrix = np.zeros((states, states))
+        # The chair hands over to an unnamed speaker or to a named MP
+        to_mps = (1 - TO_UNNAMED) if mps else 0.0
+        matrix[CHAIR, CHAIR] = CHAIR_STAY
+        matrix[CHAIR, OPEN] = (1 - CHAIR_STAY) * (1 - to_mps)
+        matrix[CHAIR, FIRST_MP:] = (1 - CHAIR_STAY) * to_mps / max(mps, 1)
+        # A speaker goes on, gives the floor back, or is followed by another one
+        change = 1 - STAY
+        matrix[OPEN:, CHAIR] = change * BACK_TO_CHAIR
+        matrix[OPEN:, OPEN] = change * (1 - BACK_TO_CHAIR) * (1 - to_mps)
+        matrix[OPEN:, FIRST_MP:] = change * (1 - BACK_TO_CHAIR) * to_mps / max(mps, 1)
+        matrix[OPEN, OTHER] = STAY
+        matrix[OTHER, OTHER] = STAY
+        for state in range(FIRST_MP, states):
+            matrix[state, state] += STAY
+        with np.errstate(divide='ignore'):
+            return np.log(matrix)
+
+    @staticmethod
+    def viterbi(scores, log_transitions):
+        """Most likely state per unit; the session opens with the chair"""
+        units, states = scores.shape
+        back = np.zeros((units, states), dtype=np.int64)
+        delta = np.full(states, -np.inf)
+        delta[CHAIR] = 0.0
+        delta = delta + scores[0]
+        for t in range(1, units):
+            candidates = delta[:, None] + log_transitions
+            back[t] = candidates.argmax(axis=0)
+            delta = candidates[back[t], np.arange(states)] + scores[t]
+        path = np.zeros(units, dtype=np.int64)
+        path[-1] = int(delta.argmax())
+        for t in range(units - 1, 0, -1):
+            path[t - 1] = back[t, path[t]]
+        return path
+
+    def decode(self, text):
+        """[(start, end, state name)] turns over text"""
+        unit_spans = list(spans(text, clauses=True, max_chars=UNIT_CHARS))
+        if not unit_spans:
+            return []
+        starts = np.array([start for start, _ in unit_spans], dtype=np.int64)
+        scores, named_mps = self.emissions(starts, self.cues(text))
+        path = self.viterbi(scores, self.transitions(scores.shape[1]))
+
+        names = [CHAIR_NAME, OTHER_NAME, OTHER_NAME] + [self.mps[mp]['fullName'] for mp in named_mps]
+        turns = []
+        for (start, end), state in zip(unit_spans, path):
+            if turns and state != OPEN and turns[-1][2] == names[state]:
+                turns[-1] = (turns[-1][0], end, names[state])
+            else:
+                if turns:   # a turn runs up to the next one
+                    turns[-1] = (turns[-1][0], start, turns[-1][2])
+                turns.append((start, end, names[state]))
+        return turns
+
+_decoders = {}
+
+def roster_key(mps):
+    return tuple((mp.get('id'), mp.get('fullName')) for mp in mps)
+
+def decode_turns(text, mps):
+    """
+    Drop-in for update_session_6.find_turns. mps is the roster (a decoder
+    is built once per distinct roster) or a ready TurnDecoder.
+    """
+    if isinstance(mps, TurnDecoder):
+        decoder = mps
+    else:
+        key = roster_key(mps)
+        decoder = _decoders.get(key)
+        if decoder is None:
+            decoder = _decoders[key] = TurnDecoder(mps)
+    return [
+        {"speakerName": name, "text": text[start:end].strip(), "start": start, "end": end}
+        for start, end, name in decoder.decode(text)
+    ]
+
+# ----------------------------------------------------------------------
+# Benchmark
+# ----------------------------------------------------------------------
+
+def unlabelled(raw, resolver):
+    """
+    Remove the "Speaker:" lines of a labelled transcript.
+    Returns (text, turn starts, turn keys) with the turns in text offsets.
+    """
+    text = CaptionTimeline.from_transcript(raw).text
+    pieces, starts, keys, length = [], [], [], 0
+    labels = [(m, speaker_key(m.group(1), resolver)) for m in SPEAKER_TURN.finditer(text)]
+    labels = [(m, key) for m, key in labels if key]
+    for index, (match, key) in enumerate(labels):
+        end = labels[index + 1][0].start() if index + 1 < len(labels) else len(text)
+        piece = ' '.join(text[match.end():end].split())
+        if not piece:
+            continue
+        starts.append(length)
+        keys.append(key)
+        pieces.append(piece)
+        length += len(piece) + 1
+    return ' '.join(pieces), np.array(starts, dtype=np.int64), keys
+
+def floor_turns(text, mps):
+    """Baseline: the whole text is one speaker the text does not name"""
+    return [{"speakerName": OTHER_NAME, "text": text.strip(), "start": 0, "end": len(text)}]
+
+def segment_key(segment):
+    """chair / MP id / other, for an extract_segments() segment"""
+    if segment.get('speakerRole') == CHAIR_NAME:
+        return 'chair'
+    if str(segment.get('speakerId', '')).startswith('mp_'):
+        return segment['speakerId']
+    return 'other'
+
+def score(text, truth_starts, truth_keys, segments, tolerance=BOUNDARY_TOLERANCE):
+    """
+    {'speaker': share of words given the labelled speaker (chair / MP id /
+    other), 'chair': share of words right about chair vs floor,
+    'boundaries': F1 of predicted turn changes within tolerance chars}
+    """
+    words = np.array([m.start() for m in re.finditer(r'\S+', text)], dtype=np.int64)
+    truth = np.array([k if k == 'chair' or k.startswith('mp_') else 'other' for k in truth_keys], dtype=object)
+    expected = truth[np.clip(np.searchsorted(truth_starts, words, side='right') - 1, 0, None)]
+    predicted = np.full(len(words), 'chair', dtype=object)
+    for segment in sorted(segments, key=lambda s: s['startChar']):
+        predicted[words >= segment['startChar']] = segment_key(segment)
+
+    changes = truth_starts[1:][truth[1:] != truth[:-1]]
+    found = np.array(sorted(s['startChar'] for s in segments), dtype=np.int64)
+    found = found[found > 0]
+    def hits(points, targets):
+        if not len(points) or not len(targets):
+            return 0
+        right = np.clip(np.searchsorted(targets, points), 0, len(targets) - 1)
+        left = np.clip(right - 1, 0, None)
+        distance = np.minimum(np.abs(targets[right] - points), np.abs(targets[left] - points))
+        return int((distance <= tolerance).sum())
+    precision = hits(found, changes) / max(len(found), 1)
+    recall = hits(changes, found) / max(len(changes), 1)
+    return {
+        'speaker': float((predicted == expected).mean()),
+        'chair': float(((predicted == 'chair') == (expected == 'chair')).mean()),
+        'boundaries': 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+    }
+
+def benchmark_files():
+    paths = list(caption_files().values()) + list(verbatim_files(VERBATIM_DIR).values())
+    return [p for p in dict.fromkeys(paths)]
+
+def main():
+    # update_session_6 holds the rule segmenter and the shared formatter
+    from update_session_6 import extract_segments, find_turns
+
+    print("=== Speaker-Turn Decoder Benchmark ===\n")
+    mps = load_json(MPS_FILE)
+    resolver = MPResolver(mps)
+    paths = sys.argv[1:] or benchmark_files()
+    if not paths:
+        print(f"No labelled transcripts found in {', '.join(CAPTION_DIRS)}")
+        return
+
+    totals = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            text, truth_starts, truth_keys = unlabelled(f.read(), resolver)
+        if not len(truth_keys):
+            print(f"{path}: no speaker lines, skipped")
+            continue
+        print(f"{path}\n  {len(text)} chars, {len(truth_keys)} labelled turns")
+        for name, find in (('floor', floor_turns), ('rules', find_turns), ('hmm', decode_turns)):
+            started = time.perf_counter()
+            segments = extract_segments(text, mps, find=find)
+            elapsed = time.perf_counter() - started
+            result = score(text, truth_starts, truth_keys, segments)
+            total = totals.setdefault(name, {'chars': 0, 'seconds': 0.0})
+            total['chars'] += len(text)
+            total['seconds'] += elapsed
+            for metric, value in result.items():
+                total[metric] = total.get(metric, 0.0) + value * len(text)
+            print(f"  {name:>5}: {len(segments):>4} segments, speaker {result['speaker']:.1%}, "
+                  f"chair/floor {result['chair']:.1%}, boundary F1 {result['boundaries']:.2f}, "
+                  f"{elapsed * 1000:.0f} ms")
+
+    if totals:
+        print("\nOverall (weighted by length):")
+        for name, total in totals.items():
+            chars = total['chars']
+            print(f"  {name:>5}: speaker {total['speaker'] / chars:.1%}, chair/floor {total['chair'] / chars:.1%}, "
+                  f"boundary F1 {total['boundaries'] / chars:.2f}, {total['seconds']:.2f} s")
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,7 @@ export interface MP {
   id: string;
   fullName: string;
   photoUrl?: string;
+  photoVariants?: PhotoVariants;
   governorate?: string;
   district?: string;
   party?: string;
@@ -179,10 +180,25 @@ export interface ParliamentSession {
   };
   stats?: {
     estimated_duration_minutes: number | null;
+    duration_source?: 'video' | 'verbatim' | 'speakers';  // speaking_rate.py
     distinct_speakers_count: number;
   };
   chunks: SessionChunk[];
   brief_summary?: BriefSummary;
+  segmentIndexUrl?: string;
+}
+
+// Generated by segment_index.py (public/data/segment_index/<sessionId>.json)
+export interface SegmentTimeIndex {
+  sessionId: string;
+  starts: number[];
+  ends: (number | null)[];       // null = until the end of the video
+  // Containment lists: list l is order[listStart[l]..listStart[l + 1]),
+  // list 0 the top level, children[p] the list nested in segment p (-1: none)
+  nest: { order: number[]; listStart: number[]; children: number[] };
+  ids: string[];
+  speakers: { id: string | null; name: string }[];
+  speakerOf: number[];
 }
 
 export interface Law {
@@ -205,6 +221,7 @@ export interface Law {
     status: 'Completed' | 'Pending';
   }[];
   pdfUrl?: string;
+  articlesUrl?: string;
   number?: string;
   year: number;
   datePassed?: string;
@@ -233,8 +250,75 @@ export interface Party {
   lastUpdated: string;
 }
 
+// Generated by law_articles.py (public/data/laws/<id>.json)
+export interface LawClause {
+  label: string | null;
+  text: string;
+}
+
+export interface LawArticle {
+  number: number;
+  text: string;
+  clauses: LawClause[];
+  amends: { action: 'amend' | 'replace' | 'repeal' | 'add'; article: number } | null;
+}
+
+export interface LawArticleCitation {
+  sessionId: string;
+  date: string;
+  field: 'summary' | 'decisions' | 'mp_highlights';
+  snippet: string;
+}
+
+export interface LawDocument {
+  source: string;
+  sourceHash: string;
+  pages: number;
+  tablePages: number;
+  status: 'parsed' | 'unreadable';
+  preamble: string;
+  articles: LawArticle[];
+}
+
+export interface LawArticles {
+  lawId: string;
+  title: string;
+  documents: LawDocument[];
+  citations: Record<string, LawArticleCitation[]>;
+}
+
+// Generated by session_votes.py (public/data/votes.json)
+export type VoteType = 'election' | 'referral' | 'law' | 'proposal' | 'motion';
+export type VoteOutcome = 'elected' | 'referred' | 'approved' | 'rejected';
+
+export interface VoteCandidate {
+  mpId: string | null;
+  votes: number;
+}
+
+export interface VoteRow {
+  id: string;
+  sessionId: string;
+  date: string;
+  source: 'decisions' | 'events';
+  type: VoteType;
+  outcome: VoteOutcome;
+  method: 'acclamation' | 'unanimous' | 'majority' | 'count' | null;
+  mpIds: string[];
+  position?: 'speaker' | 'first_deputy' | 'second_deputy' | 'assistant' | null;
+  candidates?: VoteCandidate[];
+  winnerId?: string | null;
+  votesFor?: number;
+  votesTotal?: number;
+  lawId?: string | null;
+  committee?: string | null;
+  duplicateOf?: string;
+  text: string;
+}
+
 // Added missing interface for bloc memberships per term
 export interface BlocMembership {
+  mpId: string;
   blocName: string;
   memberName: string;
   term: 1 | 2;
@@ -245,6 +329,7 @@ export type TransitionStatus = 'STABLE' | 'SHIFTED' | 'NEW_ENTRY' | 'LEFT_MEMBER
 
 // Added missing interface for MP transition data
 export interface MPTransition {
+  mpId?: string;
   name: string;
   term1Bloc?: string;
   term2Bloc?: string;
@@ -263,3 +348,57 @@ export interface TranscriptMatch {
   videoId: string;
   matchType: 'exact' | 'fuzzy' | 'transcript';
 }
+
+// Precomputed by bloc_aggregation.py (public/data/bloc_activity.json)
+export interface GroupActivity {
+  interventions: number;
+  points: number;
+  sessions: number;
+  activeMps: number;
+}
+
+export interface TermActivity {
+  id: string;
+  name: string;
+  blocs: (GroupActivity & { bloc: string })[];
+  parties: (GroupActivity & { party: string })[];
+}
+
+// Generated by image_pipeline.py (public/data/photo_manifest.json)
+export interface PhotoFile {
+  url: string;
+  hash: string;
+  bytes: number;
+}
+
+export interface PhotoVariant {
+  width: number;
+  height: number;
+  webp: PhotoFile;
+  jpeg: PhotoFile;
+}
+
+export type PhotoSize = 'avatar' | 'card' | 'detail';
+
+export type PhotoVariants = Partial<Record<PhotoSize, PhotoVariant>>;
+
+// Generated by sprite_atlas.py (public/data/photo_atlas.json)
+export interface PhotoSprite {
+  grouping: string;
+  group: string;
+  size: PhotoSize;
+  members: string[];
+  columns: number;
+  rows: number;
+  cell: [number, number];
+  width: number;
+  height: number;
+  webp: PhotoFile;
+  jpeg: PhotoFile;
+}
+
+export interface PhotoAtlas {
+  atlases: Record<string, PhotoSprite>;
+  // grouping -> group -> atlas names
+  groups: Record<string, Record<string, string[]>>;
+}
@@ -1,9 +1,44 @@
 import json
 import re
-import json
-import re
-import difflib
 import sys
+from glob import glob
+
+from bloc_rules import BlocRules, seat_mismatches
+from committee_index import build_committee_index, committee_key, normalize_committee
+from mp_resolver import MPResolver
+
+MPS_FILE = 'public/data/mps.json'
+COMMITTEES_FILE = 'public/data/committees.json'
+DEFAULT_INPUTS = 'mp_update_batch_*.txt'
+# Curated committee lists of every MP (formerly hard-coded in the
+# update_mps_batch*.py scripts); read after the dumps so they win
+CURATED_COMMITTEES = 'mp_committees.txt'
+
+# Dump names are full four-part names: below this the dump is about
+# another person (same first and family name, other father/grandfather)
+MIN_CONFIDENCE = 0.95
+
+PROFILE_HEADER = "معلومات النائب"
+
+# Field header line -> profile key (None closes the current field)
+FIELD_HEADERS = {
+    "- الاسم": "name",
+    "- المجالس النيابية المشارك بها": "councils",
+    "- اللجان النيابية المشارك بها": "committees",
+    "- الكتل النيابية المشارك بها": "blocs",
+    "- لجان الأخوة المشارك بها": "brotherhood",
+    "- جمعيات الصداقة المشارك بها": "friendship",
+    "معلومات الاتصال": None,
+    "- هاتف المكتب": "phone",
+    "- البريد الالكتروني": "email",
+}
+
+SESSION_CODES = {
+    "الدورة العادية الأولى": "ordinary_1",
+    "الدورة العادية الثانية": "ordinary_2",
+}
+
+EMPTY_VALUE = "لا يوجد"
 
 def load_data(filepath):
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -16,218 +51,217 @@ def save_data(filepath, data):
     with open(filepath, 'a', encoding='utf-8') as f:
         f.write('\n')
 
-def parse_mp_block(block):
-    lines = [l.strip() for l in block.split('\n') if l.strip()]
-    data = {}
-    
-    current_key = None
-    for line in lines:
-        if line == "- الاسم":
-            current_key = "name"
-        elif line == "- المجالس النيابية المشارك بها":
-            current_key = "councils"
-        elif line == "- اللجان النيابية المشارك بها":
-            current_key = "committees"
-        elif line == "- الكتل النيابية المشارك بها":
-            current_key = "blocs"
-        elif line == "- لجان الأخوة المشارك بها":
-            current_key = "brotherhood"
-        elif line == "- جمعيات الصداقة المشارك بها":
-            current_key = "friendship"
-        elif line == "معلومات الاتصال":
-            current_key = None
-        elif line == "- هاتف المكتب":
-            current_key = "phone"
-        elif line == "- البريد الالكتروني":
-            current_key = "email"
-        elif line == "معلومات النائب":
+def iter_profiles(paths):
+    """
+    Stream MP profiles out of any number of dump files.
+    Files are read line by line and a record is yielded as soon as the next
+    "معلومات النائب" header (or the end of the file) closes it, so memory
+    stays bounded by one profile whatever the size of the dump.
+    """
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            record, key = {}, None
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line == PROFILE_HEADER:
+                    if 'name' in record:
+                        yield record
+                    record, key = {}, None
+                elif line in FIELD_HEADERS:
+                    key = FIELD_HEADERS[line]
+                elif key:
+                    record[key] = f"{record[key]} {line}" if key in record else line
+            if 'name' in record:
+                yield record
+
+def parse_session_items(text):
+    """
+    "الدورة العادية الأولى - كتلة حزب عزم/الدورة العادية الثانية - كتلة حزب عزم"
+    -> {"ordinary_1": ["كتلة حزب عزم"], "ordinary_2": ["كتلة حزب عزم"]}
+    """
+    items = {}
+    if not text or text == EMPTY_VALUE:
+        return items
+
+    # A '/' followed by "الدورة" starts a new entry; other slashes belong to the value
+    for item in re.split(r'/(?=\s*الدورة)', text):
+        session_name, sep, value = item.strip().partition(' - ')
+        if not sep:
             continue
-        else:
-            if current_key:
-                if current_key in data:
-                    data[current_key] += " " + line
-                else:
-                    data[current_key] = line
-    
-    return data
-
-def parse_text_file(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Split by "معلومات النائب" which seems to be the start of each block
-    # However, input has "معلومات النائب" at start. We can split by double newlines or look for the pattern.
-    # The provided text has "معلومات النائب" as a header.
-    
-    blocks = re.split(r'معلومات النائب', content)
-    parsed_mps = []
-    for block in blocks:
-        if not block.strip():
+        session_code = next((code for name, code in SESSION_CODES.items() if name in session_name), None)
+        value = value.strip()
+        if session_code and value:
+            items.setdefault(session_code, []).append(value)
+    return items
+
+def parse_list(text):
+    if not text or text == EMPTY_VALUE:
+        return []
+    return [x.strip() for x in text.split('/') if x.strip()]
+
+def merge_profiles(profiles, resolver, min_confidence=MIN_CONFIDENCE):
+    """
+    Resolve every streamed profile to an MP id and merge duplicates
+    (a later dump wins field by field). Only exact or near-exact name
+    matches are merged.
+    Returns ({mp_id: profile}, [unresolved names], [(name, mp_id, confidence)]).
+    """
+    merged, unresolved, weak = {}, [], []
+    for profile in profiles:
+        mp_id, confidence = resolver.confidence(profile['name'])
+        if not mp_id:
+            unresolved.append(profile['name'])
+            continue
+        if confidence < min_confidence:
+            weak.append((profile['name'], mp_id, confidence))
+            continue
+        merged.setdefault(mp_id, {}).update(profile)
+    return merged, unresolved, weak
+
+def known_committees(mps):
+    """Spelling already used in mps.json for each committee, so dumps keep it stable"""
+    names = {}
+    for mp in mps:
+        for membership in mp.get('memberships', []):
+            for name in membership.get('committees', []) or []:
+                names.setdefault(committee_key(name), name)
+    return names
+
+def bloc_conflicts(mp, profile, rules):
+    """
+    [(session, bloc in mps.json, bloc in the dump)] where they differ.
+    Blocs are curated (seat counts, bloc_rules.json overrides), so the
+    ingest only reports them; a real move goes into bloc_rules.json.
+    """
+    current = {m.get('session'): m.get('bloc') for m in mp.get('memberships', [])}
+    conflicts = []
+    for session_code, values in parse_session_items(profile.get('blocs')).items():
+        bloc = rules.canonical_bloc(values[-1], session_code, mp['id'])
+        if bloc != current.get(session_code):
+            conflicts.append((session_code, current.get(session_code), bloc))
+    return conflicts
+
+def apply_profile(mp, profile, committee_names=None, replace_contacts=False):
+    """
+    Write one merged profile (contacts, committees, associations) into its
+    MP record. Contacts already in mps.json are kept unless
+    replace_contacts; returns the [(field, kept value, dump value)] conflicts.
+    """
+    committee_names = committee_names or {}
+    conflicts = []
+    for key, field in (('email', 'email'), ('phone', 'officePhone')):
+        value = profile.get(key, '').strip()
+        if not value or value == mp.get(field):
             continue
-        mp_data = parse_mp_block(block)
-        if mp_data and 'name' in mp_data:
-            parsed_mps.append(mp_data)
-    return parsed_mps
-
-def normalize_name(name):
-    # Remove titles
-    titles = ["سعادة", "السيد", "الدكتور", "المهندس", "المحامي", "السيدة", "الآنسة", "الدكتورة", "المهندسة", "المحامية"]
-    for title in titles:
-        name = name.replace(title, "")
-    # Remove extra spaces
-    name = re.sub(r'\s+', ' ', name).strip()
-    # Normalize alef
-    name = re.sub(r'[أإآ]', 'ا', name)
-    name = name.replace("ة", "ه") # common mismatch
-    return name
-
-def find_mp_by_name(name, mps_data):
-    normalized_input = normalize_name(name)
-    
-    best_match = None
-    highest_ratio = 0.0
-    
-    for mp in mps_data:
-        # Check against fullName
-        mp_name = mp.get('fullName', '')
-        normalized_mp = normalize_name(mp_name)
-        
-        if normalized_input == normalized_mp:
-            return mp
-        
-        ratio = difflib.SequenceMatcher(None, normalized_input, normalized_mp).ratio()
-        if ratio > highest_ratio:
-            highest_ratio = ratio
-            best_match = mp
-            
-    if highest_ratio > 0.85: # Threshold for fuzzy match
-        return best_match
-    return None
+        if mp.get(field) and not replace_contacts:
+            conflicts.append((field, mp[field], value))
+        else:
+            mp[field] = value
+
+    memberships = mp.setdefault('memberships', [])
+
+    def session_entry(session_code):
+        entry = next((m for m in memberships if m.get('session') == session_code), None)
+        if not entry:
+            entry = {'session': session_code}
+            memberships.append(entry)
+        return entry
+
+    # The profile lists the full committee set of a session, so it replaces the old one
+    for session_code, values in parse_session_items(profile.get('committees')).items():
+        committees = []
+        for value in values:
+            name = normalize_committee(value)
+            name = committee_names.get(committee_key(name), name) if name else None
+            if name and name not in committees:
+                committees.append(name)
+        entry = session_entry(session_code)
+        if committees:
+            entry['committees'] = committees
+        else:   # "لا يوجد"
+            entry.pop('committees', None)
+
+    brotherhood = parse_list(profile.get('brotherhood'))
+    if brotherhood:
+        mp['brotherhoodCommittees'] = brotherhood
+    friendship = parse_list(profile.get('friendship'))
+    if friendship:
+        mp['friendshipAssociations'] = friendship
+    return conflicts
 
 def main():
-    mps_path = 'public/data/mps.json'
-    if len(sys.argv) > 1:
-        input_path = sys.argv[1]
-    else:
-        input_path = 'mp_update_data.txt'
-    
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    dry_run = '--dry-run' in sys.argv
+    replace_contacts = '--replace-contacts' in sys.argv
+    input_paths = args or sorted(glob(DEFAULT_INPUTS)) + [CURATED_COMMITTEES]
+
     try:
-        mps = load_data(mps_path)
+        mps = load_data(MPS_FILE)
     except FileNotFoundError:
-        print(f"Error: {mps_path} not found.")
+        print(f"Error: {MPS_FILE} not found.")
         return
 
-    parsed_data = parse_text_file(input_path)
-    print(f"Found {len(parsed_data)} MPs in input text.")
-    
-    updated_count = 0
-    
-    for new_data in parsed_data:
-        name = new_data.get('name')
-        mp = find_mp_by_name(name, mps)
-        
-        if not mp:
-            print(f"Warning: Could not find MP for '{name}'")
-            continue
-            
-        updated_count += 1
-        
-        # Update email and phone
-        if 'email' in new_data:
-            mp['email'] = new_data['email'].strip()
-        if 'phone' in new_data:
-            mp['officePhone'] = new_data['phone'].strip()
-            
-        # Update Memberships (Committees and Blocs)
-        # Parse committees string: "الدورة العادية الأولى - اللجان الدائمة / اللجنة القانونية/الدورة العادية الأولى - اللجان الدائمة / اللجنة الإدارية"
-        # Parse blocs string: "الدورة العادية الأولى - كتلة حزب عزم/الدورة العادية الثانية - كتلة حزب عزم"
-        
-        # Helper to process session items
-        def process_session_items(text, item_type):
-            if not text or text == "لا يوجد":
-                return
-            
-            # Split by '/' that is followed by 'الدورة' (start of new entry)
-            # using regex lookahead.
-            # Handles: "Session1 - Cat / Comm/Session2 - Cat / Comm"
-            import re
-            items = re.split(r'/(?=\s*الدورة)', text)
-            
-            for item in items:
-                item = item.strip()
-                if not item: continue
-                
-                parts = item.split(' - ')
-                if len(parts) >= 2:
-                    session_name_ar = parts[0].strip()
-                     # If the part is just "Session - Category" (no committee), value is category
-                    # If "Session - Category / Committee", splitting by ' - ' gives "Category / Committee" as last part
-                    
-                    if len(parts) > 2:
-                         # Case where title might have dashes? Unlikely but possible.
-                         # Generally "Session - Category / Committee" -> ["Session", "Category / Committee"]
-                         value = " - ".join(parts[1:]).strip()
-                    else:
-                        value = parts[1].strip()
-
-                    # Map session name to code
-                    session_code = None
-                    if "الدورة العادية الأولى" in session_name_ar:
-                        session_code = "ordinary_1"
-                    elif "الدورة العادية الثانية" in session_name_ar:
-                        session_code = "ordinary_2"
-                    
-                    if session_code:
-                        # Find or create session entry
-                        session_entry = next((s for s in mp.get('memberships', []) if s['session'] == session_code), None)
-                        if not session_entry:
-                            session_entry = {'session': session_code}
-                            if 'memberships' not in mp: mp['memberships'] = []
-                            mp['memberships'].append(session_entry)
-                        
-                        if item_type == 'bloc':
-                            session_entry['bloc'] = value
-                        elif item_type == 'committee':
-                            if 'committees' not in session_entry:
-                                session_entry['committees'] = []
-                            # Clean up committee name: "اللجان الدائمة / اللجنة القانونية" -> "اللجنة القانونية"
-                            # But wait, earlier we saw: "الدورة... - اللجان الدائمة / اللجنة..."
-                            # So value is "اللجان الدائمة / اللجنة..."
-                            if "/" in value:
-                                comm_name = value.split("/")[-1].strip()
-                            else:
-                                comm_name = value
-                                
-                            # FIX: Exclude "اللجان الدائمة" if it gets extracted incorrectly
-                            if comm_name == "اللجان الدائمة":
-                                return
-
-                            # Remove "اللجان الدائمة" if it exists in the list (cleanup)
-                            if "اللجان الدائمة" in session_entry['committees']:
-                                session_entry['committees'].remove("اللجان الدائمة")
-
-                            if comm_name not in session_entry['committees']:
-                                session_entry['committees'].append(comm_name)
-
-        if 'blocs' in new_data:
-            process_session_items(new_data['blocs'], 'bloc')
-            
-        if 'committees' in new_data:
-            process_session_items(new_data['committees'], 'committee')
-
-        # Update Brotherhood and Friendship
-        if 'brotherhood' in new_data and new_data['brotherhood'] != "لا يوجد":
-             # Assuming these are simple lists or comma separated? The input example says "لا يوجد" mostly.
-             # If there were multiple, they might be slash separated like others.
-             items = [x.strip() for x in new_data['brotherhood'].split('/') if x.strip()]
-             mp['brotherhoodCommittees'] = items
-
-        if 'friendship' in new_data and new_data['friendship'] != "لا يوجد":
-             items = [x.strip() for x in new_data['friendship'].split('/') if x.strip()]
-             mp['friendshipAssociations'] = items
-
-    print(f"Updated {updated_count} MPs.")
-    save_data(mps_path, mps)
+    rules = BlocRules.load()
+    resolver = MPResolver(mps)
+
+    print(f"Reading {len(input_paths)} file(s): {', '.join(input_paths)}")
+    merged, unresolved, weak = merge_profiles(iter_profiles(input_paths), resolver)
+    print(f"Matched {len(merged)} MPs.")
+    for name in unresolved:
+        print(f"Warning: Could not find MP for '{name}'")
+    for name, mp_id, confidence in weak:
+        print(f"Warning: '{name}' only resembles {mp_id} "
+              f"{resolver.by_id[mp_id]['fullName']} ({confidence:.2f}), not merged")
+
+    conflicts = [
+        (mp_id, conflict) for mp_id, profile in merged.items()
+        for conflict in bloc_conflicts(resolver.by_id[mp_id], profile, rules)
+    ]
+    if conflicts:
+        print(f"\n{len(conflicts)} bloc(s) differ from mps.json (left unchanged; "
+              f"add an override to bloc_rules.json to move an MP):")
+        for mp_id, (session_code, current, bloc) in conflicts:
+            print(f"  {mp_id} [{session_code}] {current} -> {bloc}")
+
+    committee_names = known_committees(mps)
+    before = json.dumps(mps, ensure_ascii=False, sort_keys=True)
+    seats_before = set(seat_mismatches(mps))
+    contact_conflicts = 0
+    for mp_id, profile in merged.items():
+        contact_conflicts += len(apply_profile(resolver.by_id[mp_id], profile, committee_names, replace_contacts))
+    changed = json.dumps(mps, ensure_ascii=False, sort_keys=True) != before
+    if contact_conflicts:
+        print(f"\n{contact_conflicts} contact field(s) differ from mps.json and were kept "
+              f"(--replace-contacts to take the dump values).")
+
+    new_mismatches = [m for m in seat_mismatches(mps) if m not in seats_before]
+    if new_mismatches:
+        print("\nError: the update breaks bloc seat counts, mps.json not saved:")
+        for term_id, bloc, actual, expected in new_mismatches:
+            print(f"  [{term_id}] {bloc}: {actual}/{expected}")
+        return
+
+    if dry_run:
+        print("Dry run: mps.json " + ("would change." if changed else "is already up to date."))
+        return
+
+    if changed:
+        save_data(MPS_FILE, mps)
+        print("Updated mps.json.")
+    else:
+        print("mps.json is already up to date.")
+
+    # Rebuild the committee x session -> MP ids index from the updated roster
+    committees = build_committee_index(mps)
+    try:
+        unchanged = load_data(COMMITTEES_FILE) == committees
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        save_data(COMMITTEES_FILE, committees)
+    print(f"Indexed {len(committees['committees'])} committees.")
 
 if __name__ == "__main__":
     main()
@@ -1,181 +0,0 @@
-import json
-import re
-import difflib
-
-def load_data(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_data(filepath, data):
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    with open(filepath, 'a', encoding='utf-8') as f:
-        f.write('\n')
-
-def normalize_name(name):
-    titles = ["سعادة", "السيد", "الدكتور", "المهندس", "المحامي", "السيدة", "الآنسة", "الدكتورة", "المهندسة", "المحامية"]
-    for title in titles:
-        name = name.replace(title, "")
-    name = re.sub(r'\s+', ' ', name).strip()
-    name = re.sub(r'[أإآ]', 'ا', name)
-    name = name.replace("ة", "ه")
-    return name
-
-def find_mp_by_name(name, mps_data):
-    normalized_input = normalize_name(name)
-    best_match = None
-    highest_ratio = 0.0
-    
-    for mp in mps_data:
-        mp_name = mp.get('fullName', '')
-        normalized_mp = normalize_name(mp_name)
-        
-        if normalized_input == normalized_mp:
-            return mp
-        
-        ratio = difflib.SequenceMatcher(None, normalized_input, normalized_mp).ratio()
-        if ratio > highest_ratio:
-            highest_ratio = ratio
-            best_match = mp
-            
-    if highest_ratio > 0.85:
-        return best_match
-    return None
-
-# MP Data batch 3: MPs 41-60
-mp_data = {
-    "حسين سعود عوض مرعي كريشان": {
-        "ordinary_1": ["لجنة الاقتصاد الرقمي والريادة", "لجنة البيئة والمناخ"],
-        "ordinary_2": ["لجنة الخدمات العامة والنقل", "لجنة الاقتصاد الرقمي والريادة"]
-    },
-    "حسين علي محمود العموش": {
-        "ordinary_1": ["لجنة التربية والتعليم", "لجنة فلسطين"],
-        "ordinary_2": ["لجنة الرد على خطاب العرش", "لجنة التوجيه الوطني والإعلام", "لجنة الزراعة والمياه"]
-    },
-    "حكم منصور ظاهر المعادات": {
-        "ordinary_1": ["لجنة البيئة والمناخ", "لجنة الصحة والغذاء"],
-        "ordinary_2": ["لجنة الرد على خطاب العرش", "لجنة الصحة والغذاء", "لجنة الاقتصاد الرقمي والريادة"]
-    },
-    "حمزة محمد محمود الحوامدة": {
-        "ordinary_1": ["لجنة الاقتصاد الرقمي والريادة", "لجنة البيئة والمناخ"],
-        "ordinary_2": ["لجنة البيئة والمناخ", "لجنة السياحة والآثار"]
-    },
-    "حمود إبراهيم أحمد الزواهرة": {
-        "ordinary_1": ["لجنة السياحة والآثار"],
-        "ordinary_2": ["لجنة الرد على خطاب العرش", "لجنة الزراعة والمياه", "لجنة السياحة والآثار"]
-    },
-    "حياة حسين علي مسيمي": {
-        "ordinary_1": ["لجنة المرأة وشؤون الأسرة", "لجنة الصحة والغذاء"],
-        "ordinary_2": ["لجنة الصحة والغذاء"]
-    },
-    "خالد علي محمد المسامرة العقيالات": {
-        "ordinary_1": ["اللجنة القانونية", "لجنة الاقتصاد الرقمي والريادة"],
-        "ordinary_2": ["لجنة الخدمات العامة والنقل", "لجنة الاقتصاد الرقمي والريادة"]
-    },
-    "خالد موسى عيسى أبو حسان": {
-        "ordinary_1": ["لجنة الاقتصاد والاستثمار"],
-        "ordinary_2": ["لجنة الاقتصاد والاستثمار"]
-    },
-    "خضر هليل مطير بني خالد": {
-        "ordinary_1": ["لجنة البيئة والمناخ", "لجنة الطاقة والثروة المعدنية"],
-        "ordinary_2": ["لجنة الطاقة والثروة المعدنية", "لجنة الريف والبادية"]
-    },
-    "خليفة سليمان محمد الديات": {
-        "ordinary_1": ["لجنة الزراعة والمياه", "لجنة الريف والبادية"],
-        "ordinary_2": ["لجنة الشؤون الخارجية", "اللجنة الإدارية"]
-    },
-    "خميس حسين خليل عطية": {
-        "ordinary_1": [],
-        "ordinary_2": []
-    },
-    "ديمة محمد طارق عبدالرحيم طهبوب": {
-        "ordinary_1": ["لجنة الشؤون الخارجية"],
-        "ordinary_2": ["لجنة الرد على خطاب العرش", "لجنة الشؤون الخارجية"]
-    },
-    "دينا عوني محمد البشير": {
-        "ordinary_1": ["لجنة الاقتصاد الرقمي والريادة", "لجنة الشؤون الخارجية"],
-        "ordinary_2": ["اللجنة القانونية", "لجنة الشؤون الخارجية"]
-    },
-    "راكان خلف محمد أبو هنية": {
-        "ordinary_1": ["لجنة الشؤون الخارجية"],
-        "ordinary_2": ["لجنة الطاقة والثروة المعدنية"]
-    },
-    "رانيا منصور عواد أبو رمان": {
-        "ordinary_1": ["اللجنة القانونية", "اللجنة المالية"],
-        "ordinary_2": ["لجنة الرد على خطاب العرش", "اللجنة المالية", "اللجنة القانونية"]
-    },
-    "رانية محمد حسن الخليفات": {
-        "ordinary_1": ["لجنة الشباب والرياضة والثقافة", "لجنة السياحة والآثار"],
-        "ordinary_2": ["لجنة التربية والتعليم", "لجنة المرأة وشؤون الأسرة"]
-    },
-    "رائد طاهر حمدان القطامين": {
-        "ordinary_1": ["لجنة الاقتصاد والاستثمار", "لجنة الطاقة والثروة المعدنية"],
-        "ordinary_2": []
-    },
-    "رائد مصباح طلب رباع": {
-        "ordinary_1": ["لجنة الحريات العامة وحقوق الإنسان", "لجنة التوجيه الوطني والإعلام"],
-        "ordinary_2": ["لجنة الصحة والغذاء", "لجنة الحريات العامة وحقوق الإنسان"]
-    },
-    "رند جهاد فؤاد الخزوز": {
-        "ordinary_1": ["اللجنة المالية", "لجنة الشباب والرياضة والثقافة"],
-        "ordinary_2": ["اللجنة المالية", "لجنة الشباب والرياضة والثقافة"]
-    },
-    "زهير محمد زهير الخشمان": {
-        "ordinary_1": ["لجنة الاقتصاد والاستثمار", "لجنة الخدمات العامة والنقل"],
-        "ordinary_2": ["لجنة الرد على خطاب العرش", "لجنة الاقتصاد والاستثمار", "لجنة البيئة والمناخ"]
-    }
-}
-
-def main():
-    mps_path = 'public/data/mps.json'
-    
-    try:
-        mps = load_data(mps_path)
-    except FileNotFoundError:
-        print(f"Error: {mps_path} not found.")
-        return
-
-    updated_count = 0
-    
-    for name, sessions_data in mp_data.items():
-        mp = find_mp_by_name(name, mps)
-        
-        if not mp:
-            print(f"Warning: Could not find MP for '{name}'")
-            continue
-        
-        print(f"Updating: {mp['fullName']}")
-        updated_count += 1
-        
-        # Ensure memberships exists
-        if 'memberships' not in mp:
-            mp['memberships'] = []
-        
-        # Update Session 1 (ordinary_1)
-        session1 = next((s for s in mp['memberships'] if s['session'] == 'ordinary_1'), None)
-        if not session1:
-            session1 = {'session': 'ordinary_1'}
-            mp['memberships'].append(session1)
-        
-        if sessions_data['ordinary_1']:
-            session1['committees'] = sessions_data['ordinary_1']
-        elif 'committees' in session1:
-            del session1['committees']
-        
-        # Update Session 2 (ordinary_2)
-        session2 = next((s for s in mp['memberships'] if s['session'] == 'ordinary_2'), None)
-        if not session2:
-            session2 = {'session': 'ordinary_2'}
-            mp['memberships'].append(session2)
-        
-        if sessions_data['ordinary_2']:
-            session2['committees'] = sessions_data['ordinary_2']
-        elif 'committees' in session2:
-            del session2['committees']
-
-    print(f"\nUpdated {updated_count} MPs (batch 3: MPs 41-60).")
-    save_data(mps_path, mps)
-    print("Data saved successfully!")
-
-if __name__ == "__main__":
-    main()
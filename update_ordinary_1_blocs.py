@@ -7,6 +7,9 @@ Based on user-provided data
 
 import json
 
+from bloc_rules import BlocRules, print_counts
+from mp_resolver import normalize_name
+
 def load_mps():
     with open('public/data/mps.json', 'r', encoding='utf-8') as f:
         return json.load(f)
@@ -15,12 +18,6 @@ def save_mps(mps):
     with open('public/data/mps.json', 'w', encoding='utf-8') as f:
         json.dump(mps, f, ensure_ascii=False, indent=2)
 
-def normalize_name(name):
-    """Normalize name for matching"""
-    name = ' '.join(name.split())
-    name = name.replace('سعادة السيد', '').replace('سعادة النائب', '').strip()
-    return name
-
 # Correct bloc memberships for ordinary_1
 ORDINARY_1_BLOCS = {
     "كتلة حزب الميثاق الوطني": [
@@ -196,10 +193,12 @@ def main():
     print("=== Updating Ordinary Session 1 Bloc Memberships ===\n")
     
     mps = load_mps()
+    rules = BlocRules.load()
     changes = []
     notfound = []
     
     for bloc_name, member_names in ORDINARY_1_BLOCS.items():
+        bloc_name = rules.canonical_bloc(bloc_name, 'ordinary_1')
         print(f"Processing: {bloc_name} ({len(member_names)} members)")
         
         for member_name in member_names:
@@ -236,43 +235,8 @@ def main():
     print(f"Total changes: {len(changes)}")
     print(f"Not found: {len(notfound)}")
     
-    # Verify
-    from collections import Counter
-    blocs = []
-    for mp in mps:
-        if mp.get('memberships'):
-            for mem in mp['memberships']:
-                if mem['session'] == 'ordinary_1':
-                    blocs.append(mem.get('bloc', 'Unknown'))
-                    break
-    
-    counts = Counter(blocs)
-    
-    expected = {
-        "كتلة حزب الميثاق الوطني": 35,
-        "كتلة حزب إرادة والوطني الإسلامي": 18,
-        "كتلة اتحاد الأحزاب الوسطية": 18,
-        "كتلة حزب عزم": 19,
-        "كتلة حزب جبهة العمل الإسلامي": 31,
-        "كتلة تقدم النيابية": 15
-    }
-    
-    print("\n=== Final Verification (ordinary_1) ===")
-    all_correct = True
-    for bloc, exp in expected.items():
-        actual = counts.get(bloc, 0)
-        status = "[OK]" if actual == exp else "[WRONG]"
-        print(f"{status} {bloc[:45]}: {actual}/{exp}")
-        if actual != exp:
-            all_correct = False
-    
-    total = sum(counts.values())
-    print(f"\nTotal MPs with ordinary_1: {total}/138")
-    
-    if all_correct and total >= 136:
-        print("\n*** SUCCESS! Ordinary_1 blocs updated! ***")
-    else:
-        print(f"\nSome issues remain")
+    # Verify against totalSeats in blocs.json
+    print_counts(mps)
 
 if __name__ == '__main__':
     main()
@@ -2,6 +2,8 @@
 import json
 import os
 
+from mp_resolver import normalize_name
+
 # Data path
 DATA_DIR = os.path.join(os.getcwd(), 'public', 'data')
 BLOCS_FILE = os.path.join(DATA_DIR, 'blocs.json')
@@ -69,16 +71,6 @@ BLOC_INFO_MAP = {
     "كتلة تقدم النيابية": {"id": "bloc_taqadom_1", "color": "#d97706", "leadParty": "حزب تقدم"}
 }
 
-def normalize_name(name):
-    """Normalize Arabic names for better matching."""
-    name = name.strip()
-    name = name.replace('أ', 'ا').replace('إ', 'ا').replace('آ', 'ا')
-    name = name.replace('ة', 'ه')
-    name = name.replace('ى', 'ي')
-    name = name.replace('عبد ', 'عبد')
-    name = name.replace(' ابو ', ' ابو')
-    return name
-
 def load_json(path):
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
@@ -4,24 +4,20 @@ import re
 from datetime import datetime
 import difflib
 
+from arabic_text import normalize
+from boilerplate import Boilerplate
+from caption_timeline import CaptionTimeline, align_segments
+from interval_selection import handover_weight, select_intervals
+from mp_resolver import MPResolver
+from sentence_spans import sentences
+
 # Constants
 TRANSCRIPT_FILE = r"c:\Users\Ultimate\Downloads\jordan-parliament-monitor-(al-majlis) (10)\transcripts\الجلسة السادسة - تشريعية - اليوم الاثنين 20241230.txt"
 MPS_FILE = r"c:\Users\Ultimate\Downloads\jordan-parliament-monitor-(al-majlis) (10)\public\data\mps.json"
 SESSIONS_FILE = r"c:\Users\Ultimate\Downloads\jordan-parliament-monitor-(al-majlis) (10)\public\data\sessions.json"
-
-def normalize_text(text):
-    """Normalize Arabic text for comparison."""
-    if not text: return ""
-    text = str(text)
-    # Remove diacritics
-    text = re.sub(r'[\u064B-\u065F]', '', text)
-    # Normalize Alef
-    text = text.replace("أ", "ا").replace("إ", "ا").replace("آ", "ا")
-    # Normalize Teh Marbuta
-    text = text.replace("ة", "ه")
-    # Normalize Alef Maqsura
-    text = text.replace("ى", "ي")
-    return text.strip()
+BULLET_CHARS = 200  # caption speech has no punctuation; cap summary bullets
+BOILERPLATE = Boilerplate()
+MIN_TURN_CHARS = 50     # hand-overs closer than this are the same turn
 
 def load_mps():
     with open(MPS_FILE, 'r', encoding='utf-8') as f:
@@ -29,12 +25,12 @@ def load_mps():
 
 def get_mp_id_by_name(name, mps):
     """Find MP ID by fuzzy matching the name."""
-    norm_name = normalize_text(name)
+    norm_name = normalize(name)
     best_ratio = 0
     best_id = "unknown"
     
     for mp in mps:
-        mp_name = normalize_text(mp['fullName'])
+        mp_name = normalize(mp['fullName'])
         # Check for direct substring match
         if norm_name in mp_name or mp_name in norm_name:
             return mp['id']
@@ -47,15 +43,12 @@ def get_mp_id_by_name(name, mps):
             
     return best_id
 
-def extract_segments(text, mps):
+def find_turns(text, mps):
     """
-    Extract segments using token scanning.
+    Find speaker turns using token scanning.
     Scans for 'Tafadal'/'Al-Kalima' and finds speaker name in surrounding tokens.
+    Returns [{speakerName, text, start, end}] over text (time marks removed).
     """
-    # 1. Pre-processing
-    # Remove timestamps first
-    text = re.sub(r'\(\d{0,2}:?\d{2}:\d{2}\)', '', text)
-    
     # Titles to ignore when finding name
     titles = {"سعادة", "معالي", "الزميل", "الزميلة", "الاخ", "الأخ", "النائب", "الدكتور", "الدكتورة", "المهندس", "المهندسة", "السيد", "السيدة", "الشيخ", "اخ", "أخ", "يا", "ال"}
     
@@ -96,6 +89,8 @@ def extract_segments(text, mps):
             curr_j = i + 1
             
             valid_name_parts = []
+            name_tokens = []
+            titled = False
             
             for j in range(curr_j, scan_limit):
                 t = tokens[j]
@@ -111,6 +106,7 @@ def extract_segments(text, mps):
                     
                 # If title/preposition, skip
                 if w in titles:
+                    titled = titled or not valid_name_parts
                     continue
                     
                 # If short word likely noise? "من", "عن"
@@ -119,6 +115,7 @@ def extract_segments(text, mps):
                      
                 # Candidate name part
                 valid_name_parts.append(w)
+                name_tokens.append(t)
                 if len(valid_name_parts) >= 3: 
                     break
             
@@ -127,7 +124,10 @@ def extract_segments(text, mps):
                 transitions.append({
                     "idx": token['start'], # Start of "Tafadal"
                     "speaker": full_name_candidate,
-                    "tokens_idx": i
+                    "tokens_idx": i,
+                    "name_chars": name_tokens[-1]['end'] - name_tokens[0]['start'],
+                    "name_end": name_tokens[-1]['end'],
+                    "titled": titled
                 })
                 i = curr_j + len(valid_name_parts)
                 continue
@@ -135,6 +135,8 @@ def extract_segments(text, mps):
             # If lookahead failed, check LOOKBEHIND (Suffix Pattern)
             # "Saadat Al-Naib X Tafadal"
             valid_name_parts = []
+            name_tokens = []
+            titled = False
             start_search = max(0, i - 10)
             
             for k in range(i-1, start_search, -1):
@@ -144,10 +146,14 @@ def extract_segments(text, mps):
                 if w in ["تفضل", "شكرا", "بسم", "السلام"]:
                     break 
                 
-                if w.isdigit() or w in titles or len(w) < 2:
+                if w in titles:
+                    titled = titled or bool(valid_name_parts)
+                    continue
+                if w.isdigit() or len(w) < 2:
                     continue
                     
                 valid_name_parts.insert(0, w)
+                name_tokens.insert(0, t)
                 if len(valid_name_parts) >= 3:
                     break
             
@@ -156,7 +162,10 @@ def extract_segments(text, mps):
                  transitions.append({
                     "idx": token['start'], # Start of "Tafadal"
                     "speaker": full_name_candidate,
-                    "tokens_idx": i
+                    "tokens_idx": i,
+                    "name_chars": name_tokens[-1]['end'] - name_tokens[0]['start'],
+                    "name_end": token['end'],
+                    "titled": titled
                 })
         
         i += 1
@@ -166,22 +175,23 @@ def extract_segments(text, mps):
     start_idx = 0
     start_speaker = "رئيس المجلس"
     
-    transitions.sort(key=lambda x: x['idx'])
-    
-    unique_trans = []
-    if transitions:
-        curr = transitions[0]
-        for t in transitions[1:]:
-            if t['idx'] - curr['idx'] < 50: 
-               continue
-            unique_trans.append(curr)
-            curr = t
-        unique_trans.append(curr)
+    # Hand-overs closer than MIN_TURN_CHARS compete: keep the heaviest set
+    # (longer name, a title before it, a confident MP match)
+    resolver = MPResolver(mps)
+    intervals = []
+    for t in transitions:
+        _, confidence = resolver.confidence(t['speaker'])
+        intervals.append((
+            t['idx'],
+            max(t['idx'] + MIN_TURN_CHARS, t['name_end']),
+            handover_weight(t['name_chars'], t['titled'], confidence),
+        ))
+    unique_trans = [transitions[i] for i in select_intervals(intervals)]
     
     for t in unique_trans:
         chunk = text[start_idx:t['idx']].strip()
         if len(chunk) > 10:
-             segments.append({ "speakerName": start_speaker, "text": chunk })
+             segments.append({ "speakerName": start_speaker, "text": chunk, "start": start_idx, "end": t['idx'] })
         
         # Identify start of NEW speech
         new_start = min(len(text), t['idx'] + 50)
@@ -189,15 +199,29 @@ def extract_segments(text, mps):
         intro_text = text[t['idx']:new_start]
         if segments and segments[-1]['speakerName'] == "رئيس المجلس":
             segments[-1]['text'] += " " + intro_text
+            segments[-1]['end'] = new_start
         else:
-            segments.append({ "speakerName": "رئيس المجلس", "text": intro_text })
+            segments.append({ "speakerName": "رئيس المجلس", "text": intro_text, "start": t['idx'], "end": new_start })
             
         start_idx = new_start
         start_speaker = t['speaker']
 
     final_chunk = text[start_idx:].strip()
     if len(final_chunk) > 10:
-        segments.append({ "speakerName": start_speaker, "text": final_chunk })
+        segments.append({ "speakerName": start_speaker, "text": final_chunk, "start": start_idx, "end": len(text) })
+
+    return segments
+
+def extract_segments(text, mps, find=find_turns):
+    """
+    Extract segments from a caption transcript. find splits the text into
+    speaker turns: find_turns (rules) or turn_decoder.decode_turns (HMM).
+    """
+    # 1. Pre-processing
+    # Remove timestamps first, keeping them as offset -> time marks
+    timeline = CaptionTimeline.from_transcript(text)
+    text = timeline.text
+    segments = find(text, mps)
 
     # 5. Formatter
     final_output_segments = []
@@ -225,45 +249,15 @@ def extract_segments(text, mps):
         # --- IMPROVED SUMMARIZATION LOGIC ---
         
         # 1. Clean Filler
-        # Phrases to remove from start of summary
-        fillers = [
-            "بسم الله الرحمن الرحيم",
-             "والصلاه والسلام على",
-             "شكرا سعاده الرئيس", 
-             "شكرا سيدي الرئيس",
-             "شكرا معالي الرئيس",
-             "سيدي الرئيس",
-             "سعادة الرئيس",
-             "الزملاء المحترمين",
-             "زملائي الاعزاء",
-             "صباح الخير",
-             "يعطيك العافيه",
-             "تفضل",
-             "شكرا",
-             "بدايه"
-        ]
-        
-        clean_text = text_content
-        # Remove timestamps again just in case
-        clean_text = re.sub(r'\(\d{2}:\d{2}\)', '', clean_text)
-        
-        # Deduplicate spaces
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-        
-        # Remove fillers from logical start
-        # Iterate multiple times to clean stacked fillers "Shukran Saadat ... Bismillah ..."
-        for _ in range(3):
-            for filler in fillers:
-                if clean_text.startswith(filler):
-                    clean_text = clean_text[len(filler):].strip()
-                    # Also handle "wa" (and) connector? "wa Shukran"
-                    if clean_text.startswith("و "):
-                         clean_text = clean_text[2:].strip()
+        # Ritual formulas (basmala, thanks, addressing the chair...) are only
+        # dropped from the bullets and the excerpt; fullText keeps the speech
+        # as said and boilerplateSpans tags them in transcript offsets
+        full_text = ' '.join(text[seg['start']:seg['end']].split())
+        clean_text, removed = BOILERPLATE.strip(text[seg['start']:seg['end']])
         
         # 2. Extract Key Sentences
-        # Split by punctuation (Arabic comma, dot, newline)
-        raw_sentences = re.split(r'[.،\n\t]+', clean_text)
-        sentences = [s.strip() for s in raw_sentences if len(s.strip()) > 10]
+        # Split at punctuation and at the captions' discourse markers (شكرا, تفضل...)
+        units = list(sentences(clean_text, clauses=True, max_chars=BULLET_CHARS, min_chars=11))
         
         # Keywords for "Action" or "Important" sentences
         keywords = ["اطالب", "نطالب", "اقترح", "يجب", "مشكلة", "فساد", "تجاوز", "سؤال", "استجواب", "الموازنة", "تقرير", "ديوان"]
@@ -271,13 +265,13 @@ def extract_segments(text, mps):
         selected_bullets = []
         
         # Prioritize sentences with keywords
-        for s in sentences:
+        for s in units:
             if any(k in s for k in keywords):
                 selected_bullets.append(s)
                 
         # If no keyword sentences found, take the first 2 meaningful sentences
         if not selected_bullets:
-             selected_bullets = sentences[:2]
+             selected_bullets = units[:2]
         
         # Limit to 3 bullets max
         final_bullets = selected_bullets[:3]
@@ -300,12 +294,18 @@ def extract_segments(text, mps):
             "speakerId": mp_id,
             "speakerRole": role,
             "textExcerpt": clean_text[:150] + "..." if len(clean_text) > 150 else clean_text,
-            "fullText": clean_text,
+            "fullText": full_text,
             "topics": ["مناقشة عامة"],
             "stanceTowardGovernment": stance,
-            "summaryBullets": final_bullets
+            "summaryBullets": final_bullets,
+            "startChar": seg['start'],
+            "endChar": seg['end'],
+            "boilerplateSpans": [[seg['start'] + start, seg['start'] + end, category] for start, end, category in removed]
         })
         count += 1
+
+    # 6. Video times from the caption marks (interpolated between marks)
+    align_segments(final_output_segments, timeline)
         
     return final_output_segments
 
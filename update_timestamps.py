@@ -1,66 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Segment video timestamps
+Sets videoTimestamp / videoEndTimestamp on the segments of every session
+from the time marks of its YouTube caption transcript (caption_timeline.py),
+instead of accumulating word_count / 130 wpm from zero.
+
+Transcripts are matched to sessions by the video id written in the file.
+Sessions without a caption transcript keep their existing timestamps.
+The per-session time index (segment_index.py) is re-exported afterwards.
+
+    python update_timestamps.py
+"""
+
 import json
-import math
 
-def update_timestamps():
-    file_path = 'c:/Users/Ultimate/Downloads/jordan-parliament-monitor-(al-majlis) (10)/public/data/sessions.json'
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        sessions = json.load(f)
-    
-    # Find Session 6
-    target_session = None
+from caption_timeline import CaptionTimeline, align_segments, caption_files, video_id_of
+from segment_index import INDEX_DIR, export_indexes
+from speaking_rate import duration_seconds
+
+SESSIONS_FILE = 'public/data/sessions.json'
+
+def load_json(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(filepath, data):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def update_timestamps(sessions, captions):
+    """Align every session that has segments and a caption file; returns a report"""
+    report = {'aligned': [], 'no_captions': []}
     for session in sessions:
-        if session['id'] == 'sess_2024_06_legislative':
-            target_session = session
-            break
-            
-    if not target_session:
-        print("Session 6 not found")
-        return
+        segments = session.get('segments') or []
+        if not segments:
+            continue
+        path = captions.get(video_id_of(session))
+        if not path:
+            report['no_captions'].append(session['id'])
+            continue
+        timeline = CaptionTimeline.from_file(path, duration_seconds(session))
+        located = align_segments(segments, timeline)
+        report['aligned'].append((session['id'], len(segments), located, len(timeline)))
+    return report
+
+def main():
+    print("=== Segment Video Timestamps ===\n")
+    sessions = load_json(SESSIONS_FILE)
+    captions = caption_files()
+    print(f"Caption transcripts: {len(captions)}")
 
-    segments = target_session.get('segments', [])
-    
-    # Starting parameters
-    current_time = 0
-    words_per_minute = 130
-    
-    updated_count = 0
-    
-    print(f"Processing {len(segments)} segments...")
-    
-    for i, segment in enumerate(segments):
-        # Specific fix for known start points if any (override logic)
-        # We respect existing non-zero timestamps if they seem strictly increasing
-        existing_ts = segment.get('videoTimestamp', 0)
-        
-        # If existing timestamp is valid and ahead of current tracker, sync to it
-        if existing_ts > current_time:
-            current_time = existing_ts
-        
-        # Assign current time to segment
-        segment['videoTimestamp'] = int(current_time)
-        
-        # Calculate duration based on text length
-        text = segment.get('textExcerpt', '') or segment.get('sentence', '')
-        word_count = len(text.split())
-        
-        # Minimum duration 30 seconds, otherwise based on word count
-        duration_seconds = max(20, (word_count / words_per_minute) * 60)
-        
-        # Specific override for very short procedural segments
-        if word_count < 10:
-            duration_seconds = 10
-            
-        print(f"Seg {i}: {segment.get('speakerName')} at {int(current_time)}s (Duration: {int(duration_seconds)}s)")
-        
-        current_time += duration_seconds
-        updated_count += 1
+    report = update_timestamps(sessions, captions)
+    for session_id, total, located, marks in report['aligned']:
+        print(f"  {session_id}: {located}/{total} segments located, {marks} time marks")
+    if report['no_captions']:
+        print(f"No caption transcript ({len(report['no_captions'])}): {report['no_captions'][:10]}")
 
-    # Save back
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(sessions, f, indent=4, ensure_ascii=False)
-        
-    print(f"Updated {updated_count} segments. Final time: {int(current_time/60)} minutes.")
+    if report['aligned']:
+        indexed = export_indexes(sessions)
+        save_json(SESSIONS_FILE, sessions)
+        print(f"Time indexes: {len(indexed)} sessions in {INDEX_DIR}/")
+        print(f"\nSaved to {SESSIONS_FILE}")
+    else:
+        print("\nNothing to update")
 
-if __name__ == "__main__":
-    update_timestamps()
+if __name__ == '__main__':
+    main()